@@ -0,0 +1,60 @@
+"""Minimal timing harness shared by the benchmark modules.
+
+A benchmark module defines `bench_<name>()` functions. Each one does its setup and returns a
+zero-argument callable, which is what gets timed. Benchmarks holding resources, such as process
+pools, can instead be generators that yield the callable and release the resources once it has
+been timed, e.g. in a `with` block around the `yield`. Modules end with::
+
+    if __name__ == "__main__":
+        main(globals())
+
+and are run from the repository root with ``uv run python -m benchmarks.<module>``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from types import GeneratorType
+from typing import Callable, Iterator, Union
+
+Benchmark = Callable[[], Union[Callable[[], object], Iterator[Callable[[], object]]]]
+
+
+def collect(namespace: dict) -> dict[str, Benchmark]:
+    """Returns the `bench_*` functions defined in `namespace` keyed by their name."""
+    return {
+        name[len("bench_") :]: fn
+        for name, fn in namespace.items()
+        if name.startswith("bench_") and callable(fn)
+    }
+
+
+def measure(benchmark: Benchmark, repeat: int = 5, min_time: float = 0.2) -> float:
+    """Returns the best time per call of the callable returned by `benchmark`, in seconds."""
+    setup = benchmark()
+    if not isinstance(setup, GeneratorType):
+        return _measure(setup, repeat, min_time)
+    try:
+        return _measure(next(setup), repeat, min_time)
+    finally:
+        # resumes the generator at its `yield`, so its `with` blocks and `finally` clauses run
+        setup.close()
+
+
+def _measure(fn: Callable[[], object], repeat: int, min_time: float) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def main(namespace: dict) -> None:
+    for name, benchmark in collect(namespace).items():
+        print(f"{name:<40} {format_time(measure(benchmark)):>14}")
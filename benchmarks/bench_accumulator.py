@@ -0,0 +1,49 @@
+"""Summing 1M statement lines, `MoneyAccumulator` against repeated `Money.__add__`."""
+
+from __future__ import annotations
+
+import random
+
+from kudi import Money, MoneyAccumulator
+
+from benchmarks._harness import main
+
+N = 1_000_000
+
+
+def _lines() -> list[Money]:
+    rng = random.Random(0)
+    return [Money(rng.randint(-(10**6), 10**6), "NGN") for _ in range(N)]
+
+
+def bench_money_add_1m():
+    lines = _lines()
+
+    def run():
+        total = Money(0, "NGN")
+        for line in lines:
+            total += line
+        return total
+
+    return run
+
+
+def bench_accumulator_iadd_1m():
+    lines = _lines()
+
+    def run():
+        total = MoneyAccumulator("NGN")
+        for line in lines:
+            total += line
+        return total.freeze()
+
+    return run
+
+
+def bench_accumulator_update_1m():
+    lines = _lines()
+    return lambda: MoneyAccumulator("NGN").update(lines).freeze()
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,68 @@
+"""Throughput and event loop latency benchmarks for `kudi.aparse`.
+
+Besides the timings, running this module reports the worst event loop stall seen by a
+heartbeat task while a local producer pushes bursts of records.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import kudi
+from kudi import Money
+
+from benchmarks._harness import main
+
+N = 100_000
+BURST = 10_000
+CODES = ("USD", "EUR", "NGN")
+
+
+async def _produce(n: int = N):
+    for i in range(n):
+        yield i, CODES[i % len(CODES)]
+        if i % BURST == BURST - 1:
+            await asyncio.sleep(0)
+
+
+async def _consume_inline():
+    # the baseline: building each `Money` as records arrive
+    return [Money(amount, code) async for amount, code in _produce()]
+
+
+async def _consume_aparse():
+    return [money async for money in kudi.aparse(_produce())]
+
+
+def bench_ingest_inline():
+    return lambda: asyncio.run(_consume_inline())
+
+
+def bench_ingest_aparse():
+    return lambda: asyncio.run(_consume_aparse())
+
+
+async def _max_stall(consume) -> float:
+    stall = 0.0
+    running = True
+
+    async def heartbeat():
+        nonlocal stall
+        while running:
+            start = time.perf_counter()
+            await asyncio.sleep(0)
+            stall = max(stall, time.perf_counter() - start)
+
+    task = asyncio.create_task(heartbeat())
+    await consume()
+    running = False
+    await task
+    return stall
+
+
+if __name__ == "__main__":
+    main(globals())
+    for name, consume in (("inline", _consume_inline), ("aparse", _consume_aparse)):
+        stall = asyncio.run(_max_stall(consume))
+        print(f"max event loop stall ({name}){'':<19} {stall * 1e3:>11.3f} ms")
@@ -0,0 +1,39 @@
+"""1M allocations by the same ratios, through `AllocationPlan` and `Money.allocate`."""
+
+from __future__ import annotations
+
+import random
+from array import array
+
+from kudi import AllocationPlan, MoneyArray
+
+from benchmarks._harness import main
+
+N = 1_000_000
+RATIOS = (70, 20, 7, 3)
+
+
+def _amounts() -> MoneyArray:
+    rng = random.Random(0)
+    return MoneyArray(array("q", (rng.randint(0, 10**9) for _ in range(N))), "USD")
+
+
+def bench_money_allocate_1m():
+    monies = _amounts().to_monies()
+    return lambda: [money.allocate(*RATIOS) for money in monies]
+
+
+def bench_plan_allocate_1m():
+    monies = _amounts().to_monies()
+    allocate = AllocationPlan(*RATIOS).allocate
+    return lambda: [allocate(money) for money in monies]
+
+
+def bench_plan_allocate_array_1m():
+    amounts = _amounts()
+    plan = AllocationPlan(*RATIOS)
+    return lambda: plan.allocate_array(amounts)
+
+
+if __name__ == "__main__":
+    main(globals())
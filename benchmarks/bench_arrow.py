@@ -0,0 +1,40 @@
+"""Conversion benchmarks for `kudi.arrow` against exploding monies into two columns by hand."""
+
+from __future__ import annotations
+
+import pyarrow as pa
+
+from kudi import Money, MoneyArray
+from kudi.arrow import from_arrow, to_arrow
+
+from benchmarks._harness import main
+
+N = 1_000_000
+
+
+def bench_to_arrow():
+    ma = MoneyArray(range(N), "USD")
+    return lambda: to_arrow(ma)
+
+
+def bench_from_arrow():
+    column = to_arrow(MoneyArray(range(N), "USD"))
+    return lambda: from_arrow(column)
+
+
+def bench_explode_monies_by_hand():
+    monies = [Money(i, "USD") for i in range(N)]
+
+    def explode():
+        pa.table(
+            {
+                "amount": [m.amount for m in monies],
+                "currency": [m.currency.code.value for m in monies],
+            }
+        )
+
+    return explode
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,50 @@
+"""Cash rounding 1M till amounts to the smallest coin, against a `Decimal` quantize loop."""
+
+from __future__ import annotations
+
+import random
+from array import array
+from decimal import ROUND_HALF_UP, Decimal
+
+from kudi import Money, MoneyArray
+
+from benchmarks._harness import main
+
+N = 1_000_000
+
+
+def _till(n: int = N) -> MoneyArray:
+    # basket totals of a supermarket till, mostly small
+    rng = random.Random(0)
+    return MoneyArray(
+        array("q", (int(rng.expovariate(1 / 4_000)) for _ in range(n))), "CHF"
+    )
+
+
+def bench_decimal_quantize_1m():
+    amounts = _till().tolist()
+    coin = Decimal("0.05")
+
+    def run():
+        return [
+            Money(
+                (Decimal(a).scaleb(-2) / coin).quantize(1, ROUND_HALF_UP) * coin, "CHF"
+            )
+            for a in amounts
+        ]
+
+    return run
+
+
+def bench_money_round_to_1m():
+    monies = _till().to_monies()
+    return lambda: [money.round_to() for money in monies]
+
+
+def bench_money_array_round_to_1m():
+    till = _till()
+    return lambda: till.round_to()
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,58 @@
+"""1M currency lookups and constructions by id, against alpha and numeric codes."""
+
+from __future__ import annotations
+
+import random
+
+from kudi import Money
+from kudi.currency import CURRENCIES_BY_ID
+from kudi.currencies_data import CURRENCIES_DATA
+
+from benchmarks._harness import main
+
+N = 1_000_000
+resolve_currency = Money._resolve_currency
+
+
+def _currencies() -> list:
+    rng = random.Random(0)
+    return [rng.choice(CURRENCIES_BY_ID) for _ in range(N)]
+
+
+def bench_lookup_by_alpha_code_1m():
+    codes = [currency.code.value for currency in _currencies()]
+    return lambda: [resolve_currency(code) for code in codes]
+
+
+def bench_lookup_by_lowercase_code_1m():
+    codes = [currency.code.value.lower() for currency in _currencies()]
+    return lambda: [resolve_currency(code) for code in codes]
+
+
+def bench_lookup_by_numeric_code_1m():
+    codes = [
+        CURRENCIES_DATA[currency.code]["numeric_code"]
+        for currency in _currencies()
+        if CURRENCIES_DATA[currency.code]["numeric_code"]
+    ]
+    return lambda: [resolve_currency(code) for code in codes]
+
+
+def bench_lookup_by_id_1m():
+    ids = [currency.id for currency in _currencies()]
+    return lambda: [CURRENCIES_BY_ID[currency_id] for currency_id in ids]
+
+
+def bench_money_by_alpha_code_1m():
+    codes = [currency.code.value for currency in _currencies()]
+    return lambda: [Money(150, code) for code in codes]
+
+
+def bench_money_by_id_1m():
+    ids = [currency.id for currency in _currencies()]
+    from_currency_id = Money.from_currency_id
+    return lambda: [from_currency_id(150, currency_id) for currency_id in ids]
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,43 @@
+"""Breaking 1M ATM withdrawals into notes, with unlimited notes and from a cash inventory."""
+
+from __future__ import annotations
+
+import random
+
+from kudi import Money
+from kudi.denominations import breakdown_available
+
+from benchmarks._harness import main
+
+N = 1_000_000
+# the notes an NGN ATM holds and how many of each
+ATM = {100_000: 2_000, 50_000: 2_000, 20_000: 500}
+
+
+def _withdrawals(n: int = N) -> list[Money]:
+    rng = random.Random(0)
+    return [Money(rng.randint(1, 400) * 100_000 // 2, "NGN") for _ in range(n)]
+
+
+def bench_breakdown_1m():
+    withdrawals = _withdrawals()
+    return lambda: [money.breakdown() for money in withdrawals]
+
+
+def bench_breakdown_available_1m():
+    withdrawals = _withdrawals()
+    return lambda: [money.breakdown(ATM) for money in withdrawals]
+
+
+def bench_breakdown_available_uncached_10k():
+    withdrawals = _withdrawals(10_000)
+    denominations = tuple(sorted(ATM, reverse=True))
+    available = tuple(ATM[d] for d in denominations)
+    search = breakdown_available.__wrapped__
+    return lambda: [
+        search(denominations, available, money.amount) for money in withdrawals
+    ]
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,44 @@
+"""Exact division of money against the float based `int(a / d)` it replaces."""
+
+from __future__ import annotations
+
+from kudi import Money
+from kudi.calculator import Calculator
+
+from benchmarks._harness import main
+
+AMOUNT = 123_456_789
+
+
+def bench_float_int_division():
+    money = Money(AMOUNT, "USD")
+    return lambda: Money(int(money.amount / 7), money.currency.code)
+
+
+def bench_money_truediv():
+    money = Money(AMOUNT, "USD")
+    return lambda: money / 7
+
+
+def bench_money_floordiv():
+    money = Money(AMOUNT, "USD")
+    return lambda: money // 7
+
+
+def bench_money_divmod():
+    money = Money(AMOUNT, "USD")
+    return lambda: divmod(money, 7)
+
+
+def bench_calculator_divide():
+    return lambda: Calculator.divide(AMOUNT, 7)
+
+
+def bench_money_truediv_large_amount():
+    # beyond 2**53 the float path loses precision
+    money = Money(10**30 + 7, "USD")
+    return lambda: money / 7
+
+
+if __name__ == "__main__":
+    main(globals())
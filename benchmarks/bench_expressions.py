@@ -0,0 +1,80 @@
+"""Long arithmetic chains over monies and money arrays, eager operators against `expr`."""
+
+from __future__ import annotations
+
+import random
+from array import array
+
+from kudi import Money, MoneyArray, expr
+
+from benchmarks._harness import main
+
+
+def _monies(n: int) -> list[Money]:
+    rng = random.Random(0)
+    return [Money(rng.randint(-(10**6), 10**6), "USD") for _ in range(n)]
+
+
+def _arrays(n: int, length: int) -> list[MoneyArray]:
+    rng = random.Random(0)
+    return [
+        MoneyArray(
+            array("q", (rng.randint(-(10**6), 10**6) for _ in range(length))), "USD"
+        )
+        for _ in range(n)
+    ]
+
+
+def bench_eager_chain_10k_x_20():
+    chains = [_monies(20) for _ in range(500)] * 20
+
+    def run():
+        for monies in chains:
+            total = monies[0]
+            for i, money in enumerate(monies[1:]):
+                total = total + money if i % 3 else total - money * 3
+        return total
+
+    return run
+
+
+def bench_expr_chain_10k_x_20():
+    chains = [_monies(20) for _ in range(500)] * 20
+
+    def run():
+        for monies in chains:
+            total = expr(monies[0])
+            for i, money in enumerate(monies[1:]):
+                total = total + money if i % 3 else total - money * 3
+            total = total.evaluate()
+        return total
+
+    return run
+
+
+def bench_eager_arrays_10_x_100k():
+    arrays = _arrays(10, 100_000)
+
+    def run():
+        total = arrays[0]
+        for i, money_array in enumerate(arrays[1:]):
+            total = total + money_array if i % 3 else total - money_array * 3
+        return total
+
+    return run
+
+
+def bench_expr_arrays_10_x_100k():
+    arrays = _arrays(10, 100_000)
+
+    def run():
+        total = expr(arrays[0])
+        for i, money_array in enumerate(arrays[1:]):
+            total = total + money_array if i % 3 else total - money_array * 3
+        return total.evaluate()
+
+    return run
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,61 @@
+"""Applying a tiered fee schedule to 10M amounts against a per-Money `Decimal` loop."""
+
+from __future__ import annotations
+
+import random
+from array import array
+from decimal import ROUND_HALF_UP, Decimal
+
+from kudi import Money, MoneyArray
+from kudi.fees import FeeSchedule, Tier
+
+from benchmarks._harness import main
+
+SCHEDULE = FeeSchedule(
+    "NGN",
+    Tier(up_to=250_000, bps=150),
+    Tier(bps=150, fixed=10_000, maximum=200_000),
+)
+
+
+def _amounts(n: int) -> MoneyArray:
+    rng = random.Random(0)
+    return MoneyArray(array("q", (rng.randint(0, 10**9) for _ in range(n))), "NGN")
+
+
+def bench_per_money_decimal_100k():
+    monies = _amounts(100_000).to_monies()
+    rate = Decimal("0.015")
+
+    def fee(money: Money) -> Money:
+        amount = Decimal(money.amount) * rate
+        if money.amount > 250_000:
+            amount = min(amount + 10_000, Decimal(200_000))
+        return Money(int(amount.quantize(1, rounding=ROUND_HALF_UP)), "NGN")
+
+    def run():
+        fees = [fee(money) for money in monies]
+        nets = [money - f for money, f in zip(monies, fees)]
+        return fees, nets
+
+    return run
+
+
+def bench_schedule_per_money_100k():
+    monies = _amounts(100_000).to_monies()
+    apply = SCHEDULE.apply
+    return lambda: [apply(money) for money in monies]
+
+
+def bench_schedule_array_100k():
+    amounts = _amounts(100_000)
+    return lambda: SCHEDULE.apply(amounts)
+
+
+def bench_schedule_array_10m():
+    amounts = _amounts(10_000_000)
+    return lambda: SCHEDULE.apply(amounts)
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,69 @@
+"""Per call formatting benchmarks across currency styles."""
+
+from __future__ import annotations
+
+from kudi import Money
+
+from kudi.formatter import ACCOUNTING_STYLE, INDIAN_STYLE, NBSP_STYLE
+
+from benchmarks._harness import main
+
+AMOUNT = 123_456_789
+
+
+def _format(code: str):
+    format_ = Money(0, code).currency.formatter.format
+    return lambda: format_(AMOUNT)
+
+
+def bench_format_usd_symbol_prefix():
+    return _format("USD")
+
+
+def bench_format_aed_symbol_suffix():
+    return _format("AED")
+
+
+def bench_format_brl_dot_delimiter():
+    return _format("BRL")
+
+
+def bench_format_jpy_no_minor_unit():
+    return _format("JPY")
+
+
+def bench_format_negative():
+    format_ = Money(0, "USD").currency.formatter.format
+    return lambda: format_(-AMOUNT)
+
+
+def _format_style(code: str, style):
+    format_ = Money(0, code).currency.formatter.format
+    return lambda: format_(AMOUNT, style)
+
+
+def bench_format_inr_indian_style():
+    return _format_style("INR", INDIAN_STYLE)
+
+
+def bench_format_usd_accounting_style():
+    return _format_style("USD", ACCOUNTING_STYLE)
+
+
+def bench_format_usd_nbsp_style():
+    return _format_style("USD", NBSP_STYLE)
+
+
+def bench_money_str():
+    money = Money(AMOUNT, "USD")
+    return lambda: str(money)
+
+
+def bench_plan_format_many_1000():
+    plan = Money(0, "USD").currency.formatter.plan
+    amounts = list(range(AMOUNT, AMOUNT + 1000))
+    return lambda: plan.format_many(amounts)
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,64 @@
+"""Per-currency aggregation of mixed monies against a naive dict of `Money.__add__`.
+
+Monies are streamed from a pool of 10k values in 20 currencies, so the inputs do not need to
+be held in memory.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+
+from kudi import Money, group_by_currency, summarize_by_currency, totals_by_currency
+
+from benchmarks._harness import main
+
+N = 1_000_000
+CODES = (
+    "USD", "EUR", "GBP", "NGN", "JPY", "BHD", "INR", "BRL", "CAD", "AUD",
+    "CHF", "CNY", "KES", "GHS", "ZAR", "MXN", "SEK", "NOK", "AED", "SGD",
+)  # fmt: skip
+
+
+def _stream():
+    rng = random.Random(0)
+    pool = [
+        Money(rng.randint(-(10**6), 10**6), CODES[i % len(CODES)])
+        for i in range(10_000)
+    ]
+    return lambda: itertools.islice(itertools.cycle(pool), N)
+
+
+def bench_naive_dict_of_money_add_1m():
+    stream = _stream()
+
+    def run():
+        totals = {}
+        for money in stream():
+            code = money.currency.code
+            if code in totals:
+                totals[code] = totals[code] + money
+            else:
+                totals[code] = money
+        return totals
+
+    return run
+
+
+def bench_totals_by_currency_1m():
+    stream = _stream()
+    return lambda: totals_by_currency(stream())
+
+
+def bench_summarize_by_currency_1m():
+    stream = _stream()
+    return lambda: summarize_by_currency(stream())
+
+
+def bench_group_by_currency_1m():
+    stream = _stream()
+    return lambda: group_by_currency(stream())
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,44 @@
+"""Cost of operation hooks on `Money.split`."""
+
+from __future__ import annotations
+
+from kudi import Money, hooks
+
+from benchmarks._harness import main
+
+
+def _split(n: int):
+    money = Money(123_456_789, "USD")
+    return lambda: money.split(n)
+
+
+def bench_split_10_without_hooks():
+    hooks.clear()
+    return _split(10)
+
+
+def _with_hook(sample_rate: float):
+    # registered only while timing so later benchmarks run without hooks
+    money = Money(123_456_789, "USD")
+
+    def run():
+        remove = hooks.on_operation(lambda operation: None, sample_rate=sample_rate)
+        try:
+            for _ in range(100):
+                money.split(10)
+        finally:
+            remove()
+
+    return run
+
+
+def bench_split_10_x100_with_hook():
+    return _with_hook(1.0)
+
+
+def bench_split_10_x100_with_sampled_hook():
+    return _with_hook(0.01)
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,24 @@
+"""Import time of `kudi`, measured in fresh interpreters."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from benchmarks._harness import main
+
+
+def _import(statement: str):
+    def bench():
+        command = [sys.executable, "-c", statement]
+        return lambda: subprocess.run(command, check=True)
+
+    return bench
+
+
+bench_interpreter_startup = _import("pass")
+bench_import_kudi = _import("import kudi")
+
+
+if __name__ == "__main__":
+    main(globals())
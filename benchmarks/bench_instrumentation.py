@@ -0,0 +1,41 @@
+"""Overhead of `kudi.instrumentation`, which should be none once it is disabled again."""
+
+from __future__ import annotations
+
+from kudi import Money, instrumentation
+
+from benchmarks._harness import main
+
+N = 1000
+AMOUNTS = range(N)
+
+
+def _construct_and_format():
+    for amount in AMOUNTS:
+        str(Money(amount, "USD"))
+
+
+def bench_never_enabled_1000():
+    return _construct_and_format
+
+
+def bench_disabled_after_enabled_1000():
+    instrumentation.enable()
+    instrumentation.disable()
+    return _construct_and_format
+
+
+def bench_enabled_1000():
+    # enabled only while timing so later benchmarks are not instrumented
+    def run():
+        instrumentation.enable()
+        try:
+            _construct_and_format()
+        finally:
+            instrumentation.disable()
+
+    return run
+
+
+if __name__ == "__main__":
+    main(globals())
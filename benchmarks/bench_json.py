@@ -0,0 +1,65 @@
+"""Encode/decode benchmarks for `kudi.json` against the ad hoc hooks it replaces."""
+
+from __future__ import annotations
+
+import io
+import json
+
+from kudi import Money
+from kudi.json import default, dump_ndjson, load_ndjson, object_hook
+
+from benchmarks._harness import main
+
+N = 10_000
+CODES = ("USD", "EUR", "NGN", "JPY", "BHD")
+
+
+def _monies() -> list[Money]:
+    return [Money(i * 7 - N, CODES[i % len(CODES)]) for i in range(N)]
+
+
+def bench_encode_default():
+    monies = _monies()
+    return lambda: json.dumps(monies, default=default)
+
+
+def bench_encode_major_units_hook():
+    monies = _monies()
+
+    def hook(obj):
+        return {
+            "amount": str(obj.as_major_units()),
+            "currency": obj.currency.code.value,
+        }
+
+    return lambda: json.dumps(monies, default=hook)
+
+
+def bench_decode_object_hook():
+    payload = json.dumps(_monies(), default=default)
+    return lambda: json.loads(payload, object_hook=object_hook)
+
+
+def bench_decode_money_init_hook():
+    payload = json.dumps(_monies(), default=default)
+
+    def hook(obj):
+        return Money(obj["amount"], obj["currency"])
+
+    return lambda: json.loads(payload, object_hook=hook)
+
+
+def bench_ndjson_write():
+    monies = _monies()
+    return lambda: dump_ndjson(monies, io.StringIO())
+
+
+def bench_ndjson_read():
+    fp = io.StringIO()
+    dump_ndjson(_monies(), fp)
+    lines = fp.getvalue().splitlines()
+    return lambda: list(load_ndjson(lines))
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,50 @@
+"""Chunked reduction benchmarks for `kudi.ledger` over a memory-mapped file."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+from kudi import Money, MoneyArray
+from kudi.ledger import Ledger
+
+from benchmarks._harness import main
+
+N = 1_000_000
+
+
+def _ledger() -> Ledger:
+    path = os.path.join(tempfile.mkdtemp(), "bench.ledger")
+    with Ledger.create(path, "USD") as ledger:
+        ledger.append(MoneyArray(range(-N // 2, N // 2), "USD"))
+    return Ledger(path)
+
+
+def bench_ledger_sum():
+    ledger = _ledger()
+    return lambda: ledger.sum()
+
+
+def bench_ledger_count_by_sign():
+    ledger = _ledger()
+    return lambda: ledger.count_by_sign()
+
+
+def bench_ledger_open_and_view():
+    path = _ledger()._path
+    return lambda: Ledger(path).money_array()
+
+
+def bench_money_list_sum():
+    monies = [Money(i, "USD") for i in range(-N // 2, N // 2)]
+
+    def money_sum():
+        total = Money(0, "USD")
+        for money in monies:
+            total = total + money
+
+    return money_sum
+
+
+if __name__ == "__main__":
+    main(globals())
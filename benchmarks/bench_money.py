@@ -0,0 +1,97 @@
+"""Hot path benchmarks for `Money` construction, arithmetic, comparisons, split and
+allocate."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from kudi import CurrencyCode, Money
+
+from benchmarks._harness import main
+
+AMOUNT = 123_456_789
+
+
+def bench_init_int_alpha_code():
+    return lambda: Money(AMOUNT, "USD")
+
+
+def bench_init_int_lowercase_code():
+    return lambda: Money(AMOUNT, "usd")
+
+
+def bench_init_int_currency_code():
+    return lambda: Money(AMOUNT, CurrencyCode.USD)
+
+
+def bench_init_int_numeric_code():
+    return lambda: Money(AMOUNT, 840)
+
+
+def bench_init_float():
+    return lambda: Money(1234567.89, "USD")
+
+
+def bench_init_decimal():
+    amount = Decimal("1234567.89")
+    return lambda: Money(amount, "USD")
+
+
+def bench_init_str():
+    return lambda: Money("1234567.89", "USD")
+
+
+def bench_add():
+    a, b = Money(AMOUNT, "USD"), Money(1, "USD")
+    return lambda: a + b
+
+
+def bench_sub():
+    a, b = Money(AMOUNT, "USD"), Money(1, "USD")
+    return lambda: a - b
+
+
+def bench_mul_int():
+    a = Money(AMOUNT, "USD")
+    return lambda: a * 3
+
+
+def bench_neg():
+    a = Money(AMOUNT, "USD")
+    return lambda: -a
+
+
+def bench_eq():
+    a, b = Money(AMOUNT, "USD"), Money(AMOUNT, "USD")
+    return lambda: a == b
+
+
+def bench_lt():
+    a, b = Money(AMOUNT, "USD"), Money(1, "USD")
+    return lambda: a < b
+
+
+def _split(n: int):
+    def bench():
+        money = Money(AMOUNT, "USD")
+        return lambda: money.split(n)
+
+    return bench
+
+
+def _allocate(n: int):
+    def bench():
+        money = Money(AMOUNT, "USD")
+        ratios = list(range(1, n + 1))
+        return lambda: money.allocate(*ratios)
+
+    return bench
+
+
+for _n in (2, 10, 100, 1000):
+    globals()[f"bench_split_{_n}"] = _split(_n)
+    globals()[f"bench_allocate_{_n}"] = _allocate(_n)
+
+
+if __name__ == "__main__":
+    main(globals())
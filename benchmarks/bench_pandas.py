@@ -0,0 +1,54 @@
+"""Group-by benchmarks for `kudi.pandas` against `Money` objects in `object` columns."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from kudi import Money, MoneyArray
+from kudi.pandas import MoneyExtensionArray
+
+from benchmarks._harness import main
+
+N = 100_000
+GROUPS = 100
+
+
+def _frame(values) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"key": rng.integers(0, GROUPS, N), "value": values})
+
+
+def bench_groupby_sum_money_dtype():
+    amounts = MoneyArray(np.arange(N, dtype=np.int64), "USD")
+    df = _frame(MoneyExtensionArray.from_money_array(amounts))
+    return lambda: df.groupby("key")["value"].sum()
+
+
+def bench_groupby_sum_object_column():
+    df = _frame(pd.Series([Money(i, "USD") for i in range(N)], dtype=object))
+
+    def groupby_sum():
+        df.groupby("key")["value"].agg(lambda values: sum(values[1:], values.iloc[0]))
+
+    return groupby_sum
+
+
+def bench_sum_money_dtype():
+    s = pd.Series(MoneyExtensionArray.from_money_array(MoneyArray(range(N), "USD")))
+    return lambda: s.sum()
+
+
+def bench_sum_object_column():
+    monies = [Money(i, "USD") for i in range(N)]
+
+    def object_sum():
+        total = monies[0]
+        for money in monies[1:]:
+            total = total + money
+
+    return object_sum
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,50 @@
+"""Scaling benchmarks for `kudi.parallel` over 1, 2, 4 and 8 worker processes."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+from kudi import MoneyArray
+from kudi.parallel import sum_by_currency
+
+from benchmarks._harness import main
+
+N = 8_000_000
+CHUNK_SIZE = 1 << 19
+
+
+def _sum_money_array(workers: int):
+    money_array = MoneyArray(range(N), "USD")
+    # the pool is shut down once the benchmark is timed, so its workers do not linger into
+    # the next one
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # start the workers before timing
+        sum_by_currency(money_array[:1], executor=executor)
+        yield lambda: sum_by_currency(
+            money_array, workers=workers, chunk_size=CHUNK_SIZE, executor=executor
+        )
+
+
+def bench_sum_money_array_single_process():
+    money_array = MoneyArray(range(N), "USD")
+    return lambda: money_array.sum()
+
+
+def bench_sum_money_array_1_worker():
+    return _sum_money_array(1)
+
+
+def bench_sum_money_array_2_workers():
+    return _sum_money_array(2)
+
+
+def bench_sum_money_array_4_workers():
+    return _sum_money_array(4)
+
+
+def bench_sum_money_array_8_workers():
+    return _sum_money_array(8)
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,49 @@
+"""Parsing throughput for formatted money strings."""
+
+from __future__ import annotations
+
+import random
+
+from kudi import Money
+
+from benchmarks._harness import main
+
+N = 1_000_000
+
+
+def _texts(code: str, n: int = N) -> list[str]:
+    rng = random.Random(0)
+    format_ = Money(0, code).currency.formatter.format
+    return [format_(rng.randint(-(10**10), 10**10)) for _ in range(n)]
+
+
+def bench_money_parse_ngn():
+    text = "₦1,234,567.89"
+    return lambda: Money.parse(text, "NGN")
+
+
+def bench_money_parse_inferred_currency():
+    text = "₦1,234,567.89"
+    return lambda: Money.parse(text)
+
+
+def bench_decimal_baseline():
+    # the string cleanup a caller had to do before `Money.parse` existed
+    text = "₦1,234,567.89"
+    return lambda: Money(text.replace("₦", "").replace(",", ""), "NGN")
+
+
+def bench_plan_parse_many_1m():
+    plan = Money(0, "NGN").currency.parser.plan
+    texts = _texts("NGN")
+    return lambda: plan.parse_many(texts)
+
+
+def bench_money_parse_1m():
+    texts = _texts("NGN")
+    parse = Money.parse
+    return lambda: [parse(text, "NGN") for text in texts]
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,48 @@
+"""Daily interest on 100k balances, `PreciseMoney` against a `Decimal` per step."""
+
+from __future__ import annotations
+
+import random
+from decimal import ROUND_HALF_UP, Decimal
+
+from kudi import Money
+
+from benchmarks._harness import main
+
+N = 100_000
+RATE = Decimal("0.0525")
+
+
+def _balances() -> list[tuple[Money, int]]:
+    rng = random.Random(0)
+    return [
+        (Money(rng.randint(0, 10**9), "USD"), rng.randint(1, 366)) for _ in range(N)
+    ]
+
+
+def bench_decimal_per_step_100k():
+    balances = _balances()
+
+    def interest(money: Money, days: int) -> Money:
+        amount = Decimal(money.amount).scaleb(-2)
+        amount = amount * RATE * days / 365
+        return Money(amount.quantize(Decimal("0.01"), ROUND_HALF_UP), "USD")
+
+    return lambda: [interest(money, days) for money, days in balances]
+
+
+def bench_precise_money_100k():
+    balances = _balances()
+    return lambda: [
+        (money.with_scale(6) * RATE * days / 365).to_money() for money, days in balances
+    ]
+
+
+def bench_money_per_step_100k():
+    # rounds to the subunit at every step, so it drifts from the other two
+    balances = _balances()
+    return lambda: [money * RATE * days / 365 for money, days in balances]
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,53 @@
+"""Applying rates and basis points against doing it by hand with `Decimal`."""
+
+from __future__ import annotations
+
+from decimal import ROUND_HALF_UP, Decimal
+from fractions import Fraction
+
+from kudi import Money
+
+from benchmarks._harness import main
+
+N = 10_000
+VAT = Decimal("0.075")
+
+
+def _monies() -> list[Money]:
+    return [Money(i * 37 + 1999, "USD") for i in range(N)]
+
+
+def bench_decimal_by_hand_10k():
+    monies = _monies()
+    one = Decimal(1)
+
+    def run():
+        return [
+            Money(
+                int((Decimal(m.amount) * VAT).quantize(one, rounding=ROUND_HALF_UP)),
+                m.currency.code,
+            )
+            for m in monies
+        ]
+
+    return run
+
+
+def bench_mul_decimal_10k():
+    monies = _monies()
+    return lambda: [m * VAT for m in monies]
+
+
+def bench_multiply_fraction_10k():
+    monies = _monies()
+    rate = Fraction(3, 40)
+    return lambda: [m.multiply(rate) for m in monies]
+
+
+def bench_basis_points_10k():
+    monies = _monies()
+    return lambda: [m.basis_points(35) for m in monies]
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,42 @@
+"""Sorting 1M monies with `Money.__lt__`, `Money.sort_key` and `kudi.sorted_money`."""
+
+from __future__ import annotations
+
+import random
+
+from kudi import Money, sorted_money
+
+from benchmarks._harness import main
+
+N = 1_000_000
+
+
+def _monies(codes: tuple[str, ...] = ("USD",)) -> list[Money]:
+    rng = random.Random(0)
+    return [
+        Money(rng.randint(-(10**9), 10**9), codes[i % len(codes)]) for i in range(N)
+    ]
+
+
+def bench_sorted_lt_1m():
+    monies = _monies()
+    return lambda: sorted(monies)
+
+
+def bench_sorted_sort_key_1m():
+    monies = _monies()
+    return lambda: sorted(monies, key=Money.sort_key)
+
+
+def bench_sorted_money_1m():
+    monies = _monies()
+    return lambda: sorted_money(monies)
+
+
+def bench_sorted_money_group_1m():
+    monies = _monies(("USD", "EUR", "NGN", "JPY"))
+    return lambda: sorted_money(monies, mixed="group")
+
+
+if __name__ == "__main__":
+    main(globals())
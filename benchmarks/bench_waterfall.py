@@ -0,0 +1,122 @@
+"""Waterfall allocation over thousands of capped parties, against naive repeated water-filling."""
+
+from __future__ import annotations
+
+import random
+
+from kudi import Money
+from kudi.waterfall import Party, Waterfall
+
+from benchmarks._harness import main
+
+
+def _tiers(parties: int) -> list[list[Party]]:
+    rng = random.Random(0)
+    return [
+        [
+            Party(ratio=rng.randint(1, 9), cap=rng.randint(1, 1_000_000))
+            for _ in range(parties)
+        ]
+        for _ in range(3)
+    ]
+
+
+def _naive_fill(
+    ratios: list[int], caps: list[int], amount: int
+) -> tuple[list[int], int]:
+    # caps whoever would pass their cap and shares again, until nobody does
+    shares = [0] * len(ratios)
+    open_ = set(range(len(ratios)))
+    while open_:
+        total = sum(ratios[i] for i in open_)
+        full = {i for i in open_ if caps[i] * total <= amount * ratios[i]}
+        if not full:
+            paid = 0
+            for i in open_:
+                shares[i] = amount * ratios[i] // total
+                paid += shares[i]
+            for i in sorted(open_)[: amount - paid]:
+                shares[i] += 1
+            return shares, 0
+        for i in full:
+            shares[i] = caps[i]
+            amount -= caps[i]
+        open_ -= full
+    return shares, amount
+
+
+def bench_naive_water_filling_3x1000():
+    tiers = _tiers(1_000)
+    columns = [([p.ratio for p in tier], [p.cap for p in tier]) for tier in tiers]
+
+    def run():
+        for amount in (10**6, 10**8, 10**9):
+            remaining = amount
+            shares = []
+            for ratios, caps in columns:
+                tier, remaining = _naive_fill(ratios, caps, remaining)
+                shares.append([Money(share, "USD") for share in tier])
+
+    return run
+
+
+def _staircase(parties: int) -> tuple[list[int], int]:
+    # caps that the naive algorithm only reaches one per pass: each cap sits just below the
+    # level the parties left share at, which rises as every cap is paid
+    amount = parties * 10**3100
+    gap = 10**3000
+    caps = []
+    remaining = amount
+    for left in range(parties, 1, -1):
+        cap = remaining // left - gap
+        caps.append(cap)
+        remaining -= cap
+        gap = gap // (2 * (left - 1))
+    caps.append(remaining + 1)
+    return caps, amount
+
+
+def bench_naive_water_filling_worst_case_1000():
+    caps, amount = _staircase(1_000)
+    ratios = [1] * len(caps)
+    return lambda: _naive_fill(ratios, caps, amount)
+
+
+def bench_waterfall_worst_case_1000():
+    caps, amount = _staircase(1_000)
+    waterfall = Waterfall("USD", [Party(cap=cap) for cap in caps])
+    money = Money(amount, "USD")
+    return lambda: waterfall.allocate(money)
+
+
+def bench_waterfall_3x1000():
+    waterfall = Waterfall("USD", *_tiers(1_000))
+    monies = [Money(amount, "USD") for amount in (10**6, 10**8, 10**9)]
+    return lambda: [waterfall.allocate(money) for money in monies]
+
+
+def bench_compile_3x10000():
+    tiers = _tiers(10_000)
+    return lambda: Waterfall("USD", *tiers)
+
+
+def bench_waterfall_3x10000():
+    waterfall = Waterfall("USD", *_tiers(10_000))
+    monies = [Money(amount, "USD") for amount in (10**6, 10**8, 10**9)]
+    return lambda: [waterfall.allocate(money) for money in monies]
+
+
+def bench_payout_waterfall_100k():
+    waterfall = Waterfall(
+        "NGN",
+        [Party(floor=5_000, cap=20_000), Party(ratio=3, cap=100_000)],
+        [Party(ratio=7), Party(ratio=3)],
+    )
+    rng = random.Random(0)
+    monies = [Money(rng.randint(0, 10**6), "NGN") for _ in range(100_000)]
+    allocate = waterfall.allocate
+    return lambda: [allocate(money) for money in monies]
+
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,114 @@
+"""Runs the benchmark suite and compares it against a stored baseline.
+
+Usage, from the repository root::
+
+    uv run python -m benchmarks.run                   # compare against benchmarks/baseline.json
+    uv run python -m benchmarks.run --update          # record a new baseline
+    uv run python -m benchmarks.run money formatter   # only bench_money and bench_formatter
+
+The command exits with status 1 when a benchmark is slower than its baseline by more than
+`--threshold`. Baselines are only comparable on the machine they were recorded on, so record
+one before comparing changes locally. Modules whose optional dependencies are missing are
+skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import importlib
+import json
+import pkgutil
+import sys
+from pathlib import Path
+
+from benchmarks._harness import collect, format_time, measure
+
+BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.25
+
+
+def _modules(names: list[str]) -> list[str]:
+    if names:
+        return [f"bench_{name.removeprefix('bench_')}" for name in names]
+    return sorted(
+        module.name
+        for module in pkgutil.iter_modules([str(Path(__file__).parent)])
+        if module.name.startswith("bench_")
+    )
+
+
+def run(modules: list[str], pattern: str = "*", repeat: int = 5) -> dict[str, float]:
+    """Measures the benchmarks of the given modules, keyed by `module.name`."""
+    results = {}
+    for module_name in modules:
+        try:
+            module = importlib.import_module(f"benchmarks.{module_name}")
+        except ImportError as e:
+            print(f"skipping {module_name}: {e}", file=sys.stderr)
+            continue
+        for name, benchmark in collect(vars(module)).items():
+            key = f"{module_name.removeprefix('bench_')}.{name}"
+            if not fnmatch.fnmatch(key, pattern):
+                continue
+            results[key] = measure(benchmark, repeat=repeat)
+            print(f"{key:<48} {format_time(results[key]):>14}", flush=True)
+    return results
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """Returns the benchmarks that are slower than their baseline by more than
+    `threshold`."""
+    regressions = []
+    for key, seconds in results.items():
+        expected = baseline.get(key)
+        if expected is not None and seconds > expected * (1 + threshold):
+            regressions.append(key)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="e.g. money formatter")
+    parser.add_argument("-k", "--filter", default="*", help="e.g. 'money.split_*'")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="the allowed slowdown as a fraction of the baseline",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--update", action="store_true", help="record the results as the baseline"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(_modules(args.modules), args.filter, args.repeat)
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    if args.update:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"recorded {len(results)} benchmarks in {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for key in regressions:
+        print(
+            f"regression: {key} took {format_time(results[key])},"
+            f" baseline {format_time(baseline[key])}",
+            file=sys.stderr,
+        )
+    missing = len([key for key in results if key not in baseline])
+    if missing:
+        print(f"{missing} benchmarks have no baseline", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,35 @@
 from __future__ import annotations
 from .money import Money
+from .money_array import MoneyArray
+from .allocation import AllocationPlan
+from .precise import PreciseMoney
+from .expressions import Expr, expr
+from .accumulator import MoneyAccumulator
+from .grouping import group_by_currency, summarize_by_currency, totals_by_currency
+from .sorting import sorted_money
 from .exceptions import (
     KudiException,
     InvalidCurrencyCodeError,
     InvalidCurrencyAlphaCodeError,
     InvalidCurrencyNumericCodeError,
     CurrencyMismatchError,
+    InvalidLedgerFileError,
 )
 from .currency import Currency
 from .currency_codes import CurrencyCode
 
 __all__ = [
     "Money",
+    "MoneyArray",
+    "AllocationPlan",
+    "PreciseMoney",
+    "Expr",
+    "expr",
+    "MoneyAccumulator",
+    "group_by_currency",
+    "totals_by_currency",
+    "summarize_by_currency",
+    "sorted_money",
     "CurrencyCode",
     "Currency",
     "KudiException",
@@ -19,4 +37,20 @@ __all__ = [
     "InvalidCurrencyAlphaCodeError",
     "InvalidCurrencyNumericCodeError",
     "CurrencyMismatchError",
+    "InvalidLedgerFileError",
+    "aparse",
+    "stats",
 ]
+
+
+def __getattr__(name: str):
+    # `aparse` pulls in asyncio, so it is only imported on first use
+    if name == "aparse":
+        from .aio import aparse
+
+        return aparse
+    if name == "stats":
+        from .instrumentation import stats
+
+        return stats
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
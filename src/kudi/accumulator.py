@@ -0,0 +1,161 @@
+"""A mutable running total for tight loops over monies.
+
+`Money` is immutable, so `total += money` builds a new money for every line. A
+`MoneyAccumulator` adds in place into a python int, checks currencies by identity first, and
+only builds a money when it is frozen.
+
+Example:
+    >>> total = MoneyAccumulator("USD")
+    >>> for line in statement:
+    ...     total += line.amount
+    >>> total.freeze()
+    Money(amount=1250, code="USD")
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from kudi.currency import Currency
+from kudi.currency_codes import CurrencyCode
+from kudi.exceptions import CurrencyMismatchError
+from kudi.money import Money
+
+
+class MoneyAccumulator:
+    """MoneyAccumulator sums monies of a single currency in place.
+
+    Monies and raw ints in the subunit of the currency can be added with `+=` and subtracted
+    with `-=`, which counts as adding the negated value. Besides the total, the accumulator
+    keeps the count, the smallest and largest values added and the sum of their squares.
+    """
+
+    __slots__ = ("_currency", "_total", "_count", "_min", "_max", "_sum_of_squares")
+
+    def __init__(self, code: int | str | CurrencyCode):
+        """MoneyAccumulator sums monies of a single currency in place.
+
+        Args:
+            code: the currency of the monies to sum, see `Money`.
+        """
+        self._currency: Currency = Money._resolve_currency(code)
+        self._total = 0
+        self._count = 0
+        self._min = 0
+        self._max = 0
+        self._sum_of_squares = 0
+
+    def _amount_of(self, value: Money | int) -> int:
+        if isinstance(value, int):
+            return value
+        if isinstance(value, Money):
+            if (
+                value._currency is not self._currency
+                and value._currency != self._currency
+            ):
+                raise CurrencyMismatchError(
+                    "operations on monies with different currencies is not allowed"
+                )
+            return value._amount
+        raise TypeError(f"cannot accumulate `{type(value)}`, use `Money` or `int`")
+
+    def _add(self, amount: int):
+        if self._count:
+            if amount < self._min:
+                self._min = amount
+            elif amount > self._max:
+                self._max = amount
+        else:
+            self._min = self._max = amount
+        self._total += amount
+        self._count += 1
+        self._sum_of_squares += amount * amount
+
+    def __iadd__(self, value: Money | int) -> MoneyAccumulator:
+        # `_add` inlined, this is the hot path of reconciliation loops
+        if isinstance(value, Money) and value._currency is self._currency:
+            amount = value._amount
+        else:
+            amount = self._amount_of(value)
+        if self._count:
+            if amount < self._min:
+                self._min = amount
+            elif amount > self._max:
+                self._max = amount
+        else:
+            self._min = self._max = amount
+        self._total += amount
+        self._count += 1
+        self._sum_of_squares += amount * amount
+        return self
+
+    def __isub__(self, value: Money | int) -> MoneyAccumulator:
+        self._add(-self._amount_of(value))
+        return self
+
+    def update(self, values: Iterable[Money | int]) -> MoneyAccumulator:
+        """Adds many monies or ints, faster than `+=` in a loop."""
+        currency = self._currency
+        total, count, sum_of_squares = self._total, self._count, self._sum_of_squares
+        low, high = self._min, self._max
+        try:
+            for value in values:
+                if isinstance(value, Money):
+                    if value._currency is not currency and value._currency != currency:
+                        raise CurrencyMismatchError(
+                            "operations on monies with different currencies is not allowed"
+                        )
+                    amount = value._amount
+                else:
+                    amount = self._amount_of(value)
+                if count:
+                    if amount < low:
+                        low = amount
+                    elif amount > high:
+                        high = amount
+                else:
+                    low = high = amount
+                total += amount
+                count += 1
+                sum_of_squares += amount * amount
+        finally:
+            # the values before one that raises are kept, like with `+=`
+            self._total, self._count = total, count
+            self._sum_of_squares = sum_of_squares
+            self._min, self._max = low, high
+        return self
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    @property
+    def count(self) -> int:
+        """the number of values added"""
+        return self._count
+
+    @property
+    def min(self) -> Money | None:
+        """the smallest value added, `None` when nothing was added"""
+        if not self._count:
+            return None
+        return Money._from_minor_units(self._min, self._currency)
+
+    @property
+    def max(self) -> Money | None:
+        """the largest value added, `None` when nothing was added"""
+        if not self._count:
+            return None
+        return Money._from_minor_units(self._max, self._currency)
+
+    @property
+    def sum_of_squares(self) -> int:
+        """the sum of the squares of the values added in the subunit, e.g. for their variance"""
+        return self._sum_of_squares
+
+    def freeze(self) -> Money:
+        """Returns the total as a money"""
+        return Money._from_minor_units(self._total, self._currency)
+
+    def __repr__(self):
+        return f'MoneyAccumulator(total={self._total}, count={self._count}, code="{self._currency.code}")'
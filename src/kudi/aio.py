@@ -0,0 +1,155 @@
+"""asyncio ingestion of money records.
+
+Example:
+    >>> async for money in aparse(consumer):  # yields (amount, code) tuples
+    ...     ledger.append(money)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import AsyncIterable, AsyncIterator, Mapping, Union
+
+from kudi.currency import CURRENCIES
+from kudi.currency_codes import CurrencyCode
+from kudi.json import AMOUNT_KEY, CURRENCY_KEY
+from kudi.money import Money
+
+Record = Union[tuple, Mapping]
+"""An `(amount, code)` tuple or a mapping with `amount` and `currency` keys, as produced by
+`kudi.json`."""
+
+DEFAULT_BATCH_SIZE = 1024
+
+
+class _Buffer:
+    """Records read ahead from the source, with back-pressure once `high_water` records are
+    waiting."""
+
+    def __init__(self, high_water: int):
+        self.records: deque = deque()
+        self.high_water = high_water
+        self.readable = asyncio.Event()
+        self.writable = asyncio.Event()
+        self.writable.set()
+        self.finished = False
+        self.failure: BaseException | None = None
+
+    async def fill(self, source: AsyncIterable[Record]):
+        records = self.records
+        readable = self.readable
+        try:
+            async for record in source:
+                records.append(record)
+                readable.set()
+                if len(records) >= self.high_water:
+                    self.writable.clear()
+                    await self.writable.wait()
+        except Exception as e:
+            self.failure = e
+        finally:
+            self.finished = True
+            readable.set()
+
+    async def drain(self, n: int) -> list[Record]:
+        """Returns up to `n` of the records waiting, waiting for at least one unless the
+        source is exhausted."""
+        records = self.records
+        while not records and not self.finished:
+            self.readable.clear()
+            await self.readable.wait()
+        popleft = records.popleft
+        batch = [popleft() for _ in range(min(n, len(records)))]
+        if len(records) < self.high_water:
+            self.writable.set()
+        return batch
+
+
+def _split(record: Record) -> tuple:
+    if isinstance(record, tuple):
+        return record
+    return record[AMOUNT_KEY], record[CURRENCY_KEY]
+
+
+def _parse_batch(batch: list[Record]) -> list[Money]:
+    """Parses records into monies, exact alpha codes with int amounts skip normalization."""
+    monies = []
+    append = monies.append
+    get_currency = CURRENCIES.get
+    from_minor_units = Money._from_minor_units
+    for record in batch:
+        amount, code = _split(record)
+        currency = get_currency(code) if isinstance(code, str) else None
+        if currency is not None and type(amount) is int:
+            append(from_minor_units(amount, currency))
+        else:
+            append(Money(amount, code))
+    return monies
+
+
+def _normalize_batch(batch: list[Record]) -> list[tuple[int, CurrencyCode]]:
+    # runs in worker processes, so ints and codes are sent back instead of monies
+    return [(money.amount, money.currency.code) for money in _parse_batch(batch)]
+
+
+async def aparse(
+    source: AsyncIterable[Record],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    executor: Executor | None = None,
+    offload_threshold: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[Money]:
+    """Parses money records from an async source without blocking the event loop.
+
+    Records that are already waiting are parsed together in batches of at most `batch_size`,
+    and control is handed back to the event loop between batches, so bursts do not starve
+    other tasks while a slow source is never waited on to fill a batch.
+
+    Args:
+        source: an async iterable of `(amount, code)` tuples or mappings with `amount` and
+            `currency` keys. Amounts follow the same rules as `Money`.
+        batch_size: the maximum number of records parsed at a time.
+        executor: a thread or process pool to parse large batches in. Process pools send
+            back ints and codes rather than monies.
+        offload_threshold: the smallest batch sent to `executor`, smaller batches are parsed
+            inline.
+    Yields:
+        The parsed monies in the order of the records.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than 0")
+    loop = asyncio.get_running_loop()
+    buffer = _Buffer(high_water=batch_size * 4)
+    reader = loop.create_task(buffer.fill(source))
+    from_minor_units = Money._from_minor_units
+    try:
+        while True:
+            batch = await buffer.drain(batch_size)
+            if not batch:
+                break
+            if executor is not None and len(batch) >= offload_threshold:
+                if isinstance(executor, ProcessPoolExecutor):
+                    normalized = await loop.run_in_executor(
+                        executor, _normalize_batch, batch
+                    )
+                    monies = [
+                        from_minor_units(amount, CURRENCIES[code])
+                        for amount, code in normalized
+                    ]
+                else:
+                    monies = await loop.run_in_executor(executor, _parse_batch, batch)
+            else:
+                monies = _parse_batch(batch)
+            for money in monies:
+                yield money
+            await asyncio.sleep(0)
+        if buffer.failure is not None:
+            raise buffer.failure
+    finally:
+        # the reader must not outlive the generator, even when it is closed early
+        reader.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reader
@@ -0,0 +1,114 @@
+"""Precomputed ratio splits for allocating many monies with the same ratios.
+
+Example:
+    >>> plan = AllocationPlan(70, 20, 10)
+    >>> plan.allocate(Money(1001, "USD"))
+    [Money(amount=701, code="USD"), Money(amount=200, code="USD"), Money(amount=100, code="USD")]
+"""
+
+from __future__ import annotations
+
+from array import array
+
+from kudi import hooks
+from kudi.money import Money
+from kudi.money_array import MoneyArray
+
+
+class AllocationPlan:
+    """AllocationPlan splits monies by fixed ratios without losing pennies.
+
+    The ratios are validated and summed once, and the order in which leftover pennies are
+    handed out is decided up front: round-robin amongst the parties with a non-zero ratio,
+    starting from the first, exactly like `Money.allocate`.
+    """
+
+    __slots__ = ("ratios", "_total", "_leftover_order")
+
+    def __init__(self, *ratios: int):
+        """Compiles an allocation plan.
+
+        Args:
+            ratios: the non-negative ratios of the parties.
+        """
+        if len(ratios) == 0:
+            raise ValueError("no ratios specified")
+        for ratio in ratios:
+            if ratio < 0:
+                raise ValueError("negative ratios not allowed, ratios must be positive")
+        self.ratios: tuple[int, ...] = ratios
+        self._total = sum(ratios)
+        self._leftover_order = tuple(i for i, ratio in enumerate(ratios) if ratio != 0)
+
+    def __len__(self) -> int:
+        """Returns the number of parties"""
+        return len(self.ratios)
+
+    def _shares(self, amount: int) -> list[int]:
+        total = self._total
+        if total == 0:
+            return [0] * len(self.ratios)
+        shares = [amount * ratio // total for ratio in self.ratios]
+        leftover = amount - sum(shares)
+        if leftover:
+            # the shares are floored, so the leftover is positive and smaller than the
+            # number of parties with a non-zero ratio
+            for i in self._leftover_order[:leftover]:
+                shares[i] += 1
+        return shares
+
+    def allocate(self, money: Money) -> list[Money]:
+        """Splits a money by the ratios of the plan.
+
+        Returns:
+            The share of each party, in the order of the ratios. The shares add up to the money.
+        """
+        start = hooks._start() if hooks._hooks else 0
+        currency = money.currency
+        from_minor_units = Money._from_minor_units
+        shares = [
+            from_minor_units(share, currency) for share in self._shares(money.amount)
+        ]
+        if start:
+            hooks._emit("allocate", len(self.ratios), currency.code.value, start)
+        return shares
+
+    def allocate_array(self, amounts: MoneyArray) -> list[MoneyArray]:
+        """Splits every amount of a money array by the ratios of the plan.
+
+        The shares are computed party by party over the whole array and stored in a single
+        parties × amounts int64 buffer.
+
+        Returns:
+            A money array per party, in the order of the ratios, holding the party's share of
+            each amount. For every amount, the shares add up to it.
+        """
+        start = hooks._start() if hooks._hooks else 0
+        values = amounts.amounts
+        n = len(values)
+        total = self._total
+        buffer = array("q")
+        if total == 0:
+            buffer.frombytes(bytes(8 * n * len(self.ratios)))
+        else:
+            columns = [[a * ratio // total for a in values] for ratio in self.ratios]
+            leftovers = [a - sum(row) for a, row in zip(values, zip(*columns))]
+            order = self._leftover_order
+            for i, leftover in enumerate(leftovers):
+                for party in order[:leftover]:
+                    columns[party][i] += 1
+            for column in columns:
+                buffer.extend(column)
+        view = memoryview(buffer)
+        currency = amounts.currency
+        if start:
+            hooks._emit(
+                "allocate_array", n * len(self.ratios), currency.code.value, start
+            )
+        return [
+            MoneyArray._from_view(view[i * n : (i + 1) * n], currency)
+            for i in range(len(self.ratios))
+        ]
+
+    def __repr__(self):
+        return f"AllocationPlan({', '.join(map(str, self.ratios))})"
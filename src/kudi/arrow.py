@@ -0,0 +1,182 @@
+"""Apache Arrow support for Money columns.
+
+`MoneyType` is an Arrow extension type whose storage is a struct of the amount in the subunit
+of the currency as int64 and the alpha code of the currency as a dictionary encoded string.
+Conversions between `MoneyArray` and Arrow share the amounts buffer instead of copying it, and
+the type survives a Parquet round trip once this module has been imported.
+
+This module requires pyarrow, which can be installed with the `arrow` extra, e.g.
+`uv add kudi[arrow]`.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from kudi.currency_codes import CurrencyCode
+from kudi.exceptions import CurrencyMismatchError
+from kudi.money_array import MoneyArray
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "kudi.arrow requires pyarrow, install it with `uv add kudi[arrow]`"
+    ) from e
+
+AMOUNT_FIELD = "amount"
+CURRENCY_FIELD = "currency"
+
+
+class MoneyType(pa.ExtensionType):
+    """Arrow extension type for monetary values."""
+
+    def __init__(self):
+        super().__init__(
+            pa.struct(
+                [
+                    pa.field(AMOUNT_FIELD, pa.int64(), nullable=False),
+                    pa.field(
+                        CURRENCY_FIELD,
+                        pa.dictionary(pa.int16(), pa.string()),
+                        nullable=False,
+                    ),
+                ]
+            ),
+            "kudi.money",
+        )
+
+    def __arrow_ext_serialize__(self) -> bytes:
+        return b""
+
+    @classmethod
+    def __arrow_ext_deserialize__(cls, storage_type, serialized) -> MoneyType:
+        return cls()
+
+
+try:
+    pa.register_extension_type(MoneyType())
+except pa.ArrowKeyError:  # pragma: no cover
+    # already registered, e.g. when the module is reloaded
+    pass
+
+
+def _repeat_int16(value: int, n: int) -> pa.Array:
+    buffer = pa.py_buffer(value.to_bytes(2, sys.byteorder) * n)
+    return pa.Array.from_buffers(pa.int16(), n, [None, buffer])
+
+
+def to_arrow(*money_arrays: MoneyArray) -> pa.ExtensionArray:
+    """Converts money arrays into a single Arrow money column.
+
+    With a single money array the amounts buffer is shared with Arrow instead of being copied.
+    Several arrays, possibly in different currencies, are concatenated into one column with one
+    dictionary entry per currency.
+    """
+    if len(money_arrays) == 0:
+        raise ValueError("no money arrays specified")
+    codes: dict[str, int] = {}
+    amounts = []
+    indices = []
+    for money_array in money_arrays:
+        index = codes.setdefault(money_array.currency.code.value, len(codes))
+        n = len(money_array)
+        view = money_array.amounts
+        # Arrow buffers are contiguous, a strided view would be exported as the wrong items
+        buffer = pa.py_buffer(view if view.contiguous else view.tobytes())
+        amounts.append(pa.Array.from_buffers(pa.int64(), n, [None, buffer]))
+        indices.append(_repeat_int16(index, n))
+
+    storage = pa.StructArray.from_arrays(
+        [
+            amounts[0] if len(amounts) == 1 else pa.concat_arrays(amounts),
+            pa.DictionaryArray.from_arrays(
+                indices[0] if len(indices) == 1 else pa.concat_arrays(indices),
+                pa.array(list(codes), pa.string()),
+            ),
+        ],
+        fields=list(MoneyType().storage_type),
+    )
+    return pa.ExtensionArray.from_storage(MoneyType(), storage)
+
+
+def _flatten(column: pa.ExtensionArray | pa.ChunkedArray) -> tuple[pa.Array, pa.Array]:
+    if isinstance(column, pa.ChunkedArray):
+        # only copies when there is more than one chunk
+        column = column.combine_chunks()
+    if not isinstance(column.type, MoneyType):
+        raise TypeError(f"expected a `kudi.money` column, got {column.type}")
+    if column.null_count:
+        raise ValueError("money columns with nulls are not supported")
+    amounts, currencies = column.storage.flatten()
+    return amounts, currencies
+
+
+def _as_money_array(amounts: pa.Array, code: str) -> MoneyArray:
+    if amounts.null_count:
+        raise ValueError("money columns with nulls are not supported")
+    start = amounts.offset * 8
+    data = memoryview(amounts.buffers()[1])[start : start + len(amounts) * 8]
+    return MoneyArray(data, code)
+
+
+def from_arrow(column: pa.ExtensionArray | pa.ChunkedArray) -> MoneyArray:
+    """Converts an Arrow money column in a single currency into a MoneyArray.
+
+    The MoneyArray is a view of the Arrow amounts buffer, no amounts are copied.
+
+    Raises:
+        CurrencyMismatchError: when the column holds more than one currency, use
+            `to_money_arrays` to split such columns instead.
+    """
+    amounts, currencies = _flatten(column)
+    codes = set(currencies.dictionary.take(pc.unique(currencies.indices)).to_pylist())
+    if len(codes) > 1:
+        raise CurrencyMismatchError(
+            "operations on monies with different currencies is not allowed"
+        )
+    if not codes:
+        if len(currencies.dictionary) == 0:
+            raise ValueError("cannot determine the currency of an empty money column")
+        codes = {currencies.dictionary[0].as_py()}
+    return _as_money_array(amounts, codes.pop())
+
+
+def to_money_arrays(
+    column: pa.ExtensionArray | pa.ChunkedArray,
+) -> dict[CurrencyCode, MoneyArray]:
+    """Splits an Arrow money column into one MoneyArray per currency, keeping the order of
+    the values within each currency."""
+    amounts, currencies = _flatten(column)
+    result = {}
+    for index in pc.unique(currencies.indices).to_pylist():
+        code = currencies.dictionary[index].as_py()
+        mask = pc.equal(currencies.indices, pa.scalar(index, pa.int16()))
+        money_array = _as_money_array(amounts.filter(mask), code)
+        result[money_array.currency.code] = money_array
+    return result
+
+
+def write_parquet(where, **columns: MoneyArray) -> None:
+    """Writes money arrays as money columns of a Parquet file.
+
+    Example:
+        >>> write_parquet("settlements.parquet", gross=gross, fees=fees)
+    """
+    table = pa.table({name: to_arrow(column) for name, column in columns.items()})
+    pq.write_table(table, where)
+
+
+def read_parquet(where, columns: list[str] | None = None) -> dict[str, MoneyArray]:
+    """Reads the money columns of a Parquet file written by `write_parquet`.
+
+    Columns of other types are ignored.
+    """
+    table = pq.read_table(where, columns=columns)
+    return {
+        name: from_arrow(table.column(name))
+        for name in table.column_names
+        if isinstance(table.schema.field(name).type, MoneyType)
+    }
@@ -1,7 +1,29 @@
 from __future__ import annotations
+from decimal import (
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP,
+)
 from kudi.types import Amount
+from typing import Callable
 import math
 
+ROUNDING_MODES = frozenset(
+    (
+        ROUND_HALF_UP,
+        ROUND_HALF_EVEN,
+        ROUND_HALF_DOWN,
+        ROUND_FLOOR,
+        ROUND_CEILING,
+        ROUND_DOWN,
+        ROUND_UP,
+    )
+)
+
 
 class Calculator:
     @staticmethod
@@ -18,7 +40,75 @@ class Calculator:
 
     @staticmethod
     def divide(a: Amount, d: int) -> Amount:
-        return int(a / d)
+        """Divides with ints, truncating towards zero"""
+        return Calculator.divide_rounded(a, d, ROUND_DOWN)
+
+    @staticmethod
+    def divide_rounded(a: Amount, d: int, rounding: str = ROUND_HALF_UP) -> Amount:
+        """Divides exactly with ints, rounding the quotient with one of the rounding modes of
+        the `decimal` module, e.g. `ROUND_HALF_EVEN`."""
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"`{rounding}` is not a supported rounding mode")
+        if d < 0:
+            a, d = -a, -d
+        q, r = divmod(a, d)
+        if r == 0:
+            return q
+        # q is the floor of the quotient, so every mode either keeps it or adds 1
+        if rounding == ROUND_HALF_UP:
+            return q + 1 if 2 * r > d or (2 * r == d and a > 0) else q
+        if rounding == ROUND_HALF_EVEN:
+            return q + 1 if 2 * r > d or (2 * r == d and q & 1) else q
+        if rounding == ROUND_HALF_DOWN:
+            return q + 1 if 2 * r > d or (2 * r == d and a < 0) else q
+        if rounding == ROUND_FLOOR:
+            return q
+        if rounding == ROUND_CEILING:
+            return q + 1
+        if rounding == ROUND_DOWN:
+            return q + 1 if a < 0 else q
+        # ROUND_UP
+        return q if a < 0 else q + 1
+
+    @staticmethod
+    def round_to_increment(
+        a: Amount, increment: int, rounding: str = ROUND_HALF_UP
+    ) -> Amount:
+        """Rounds to a multiple of a positive increment with one of the rounding modes of the
+        `decimal` module."""
+        return Calculator.divide_rounded(a, increment, rounding) * increment
+
+    @staticmethod
+    def increment_rounder(
+        increment: int, rounding: str = ROUND_HALF_UP
+    ) -> Callable[[Amount], Amount]:
+        """Returns a function equivalent to `round_to_increment` for a fixed positive increment
+        and rounding mode, specialized to a couple of int operations per amount."""
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"`{rounding}` is not a supported rounding mode")
+        if rounding == ROUND_FLOOR:
+            return lambda a: a - a % increment
+        if rounding == ROUND_CEILING:
+            return lambda a: a + -a % increment
+        if rounding == ROUND_HALF_EVEN:
+            return lambda a: Calculator.round_to_increment(a, increment, rounding)
+        # the remaining modes are symmetric about zero, so they round the magnitude towards
+        # negative infinity after adding an offset
+        offset = {
+            ROUND_HALF_UP: increment // 2,
+            ROUND_HALF_DOWN: (increment - 1) // 2,
+            ROUND_DOWN: 0,
+            ROUND_UP: increment - 1,
+        }[rounding]
+
+        def round_(a: Amount) -> Amount:
+            if a < 0:
+                a = offset - a
+                return a % increment - a
+            a += offset
+            return a - a % increment
+
+        return round_
 
     @staticmethod
     def modulus(a: Amount, d: int) -> Amount:
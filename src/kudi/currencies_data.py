@@ -19,12 +19,12 @@ def _get_numeric_code(code: CurrencyCode) -> str:
 
 
 def _get_currency_code_from_numeric_code(numeric_code: str) -> CurrencyCode:
-    for currency_code, currency_data in CURRENCIES_DATA.items():
-        if currency_data["numeric_code"] == numeric_code:
-            return currency_code
-    raise InvalidCurrencyNumericCodeError(
-        f"`{numeric_code}` is an invalid numeric currency code, please use 3-digit ISO code e.g.`840` for `USD`"
-    )
+    currency_code = _CURRENCY_CODES_BY_NUMERIC_CODE.get(numeric_code)
+    if currency_code is None:
+        raise InvalidCurrencyNumericCodeError(
+            f"`{numeric_code}` is an invalid numeric currency code, please use 3-digit ISO code e.g.`840` for `USD`"
+        )
+    return currency_code
 
 
 CURRENCIES_DATA: dict[CurrencyCode, CurrencyData] = {
@@ -1445,3 +1445,268 @@ CURRENCIES_DATA: dict[CurrencyCode, CurrencyData] = {
         "template": "$1",
     },
 }
+
+# the smallest physical denomination in the subunit, for currencies whose cash is rounded to
+# more than the subunit
+CASH_INCREMENTS: dict[CurrencyCode, int] = {
+    CurrencyCode.AUD: 5,
+    CurrencyCode.CAD: 5,
+    CurrencyCode.CHF: 5,
+    CurrencyCode.CZK: 100,
+    CurrencyCode.DKK: 50,
+    CurrencyCode.HUF: 500,
+    CurrencyCode.NGN: 50,
+    CurrencyCode.NOK: 100,
+    CurrencyCode.NZD: 10,
+    CurrencyCode.SEK: 100,
+    CurrencyCode.ZAR: 10,
+}
+
+# the notes and coins in circulation in the subunit, in decreasing order
+DENOMINATIONS: dict[CurrencyCode, tuple[int, ...]] = {
+    CurrencyCode.AUD: (10000, 5000, 2000, 1000, 500, 200, 100, 50, 20, 10, 5),
+    CurrencyCode.CAD: (10000, 5000, 2000, 1000, 500, 200, 100, 25, 10, 5),
+    CurrencyCode.CHF: (
+        100000,
+        20000,
+        10000,
+        5000,
+        2000,
+        1000,
+        500,
+        200,
+        100,
+        50,
+        20,
+        10,
+        5,
+    ),
+    CurrencyCode.EUR: (
+        50000,
+        20000,
+        10000,
+        5000,
+        2000,
+        1000,
+        500,
+        200,
+        100,
+        50,
+        20,
+        10,
+        5,
+        2,
+        1,
+    ),
+    CurrencyCode.GBP: (5000, 2000, 1000, 500, 200, 100, 50, 20, 10, 5, 2, 1),
+    CurrencyCode.INR: (50000, 20000, 10000, 5000, 2000, 1000, 500, 200, 100),
+    CurrencyCode.JPY: (10000, 5000, 2000, 1000, 500, 100, 50, 10, 5, 1),
+    CurrencyCode.NGN: (
+        100000,
+        50000,
+        20000,
+        10000,
+        5000,
+        2000,
+        1000,
+        500,
+        200,
+        100,
+        50,
+    ),
+    CurrencyCode.USD: (10000, 5000, 2000, 1000, 500, 200, 100, 25, 10, 5, 1),
+}
+
+
+def _index_by_numeric_code() -> dict[str, CurrencyCode]:
+    # a few numeric codes are shared, e.g. by a currency and its successor, the first wins
+    index: dict[str, CurrencyCode] = {}
+    for currency_code, currency_data in CURRENCIES_DATA.items():
+        if currency_data["numeric_code"]:
+            index.setdefault(currency_data["numeric_code"], currency_code)
+    return index
+
+
+_CURRENCY_CODES_BY_NUMERIC_CODE = _index_by_numeric_code()
+
+# the order currency ids are assigned in. ids are stored in columns and files, so new currencies
+# must be appended and existing ones never removed or reordered
+CURRENCY_ID_ORDER: tuple[CurrencyCode, ...] = (
+    CurrencyCode.AED,
+    CurrencyCode.AFN,
+    CurrencyCode.ALL,
+    CurrencyCode.AMD,
+    CurrencyCode.ANG,
+    CurrencyCode.AOA,
+    CurrencyCode.ARS,
+    CurrencyCode.AUD,
+    CurrencyCode.AWG,
+    CurrencyCode.AZN,
+    CurrencyCode.BAM,
+    CurrencyCode.BBD,
+    CurrencyCode.BDT,
+    CurrencyCode.BGN,
+    CurrencyCode.BHD,
+    CurrencyCode.BIF,
+    CurrencyCode.BMD,
+    CurrencyCode.BND,
+    CurrencyCode.BOB,
+    CurrencyCode.BRL,
+    CurrencyCode.BSD,
+    CurrencyCode.BTN,
+    CurrencyCode.BWP,
+    CurrencyCode.BYN,
+    CurrencyCode.BYR,
+    CurrencyCode.BZD,
+    CurrencyCode.CAD,
+    CurrencyCode.CDF,
+    CurrencyCode.CHF,
+    CurrencyCode.CLF,
+    CurrencyCode.CLP,
+    CurrencyCode.CNY,
+    CurrencyCode.COP,
+    CurrencyCode.CRC,
+    CurrencyCode.CUC,
+    CurrencyCode.CUP,
+    CurrencyCode.CVE,
+    CurrencyCode.CZK,
+    CurrencyCode.DJF,
+    CurrencyCode.DKK,
+    CurrencyCode.DOP,
+    CurrencyCode.DZD,
+    CurrencyCode.EEK,
+    CurrencyCode.EGP,
+    CurrencyCode.ERN,
+    CurrencyCode.ETB,
+    CurrencyCode.EUR,
+    CurrencyCode.FJD,
+    CurrencyCode.FKP,
+    CurrencyCode.GBP,
+    CurrencyCode.GEL,
+    CurrencyCode.GGP,
+    CurrencyCode.GHC,
+    CurrencyCode.GHS,
+    CurrencyCode.GIP,
+    CurrencyCode.GMD,
+    CurrencyCode.GNF,
+    CurrencyCode.GTQ,
+    CurrencyCode.GYD,
+    CurrencyCode.HKD,
+    CurrencyCode.HNL,
+    CurrencyCode.HRK,
+    CurrencyCode.HTG,
+    CurrencyCode.HUF,
+    CurrencyCode.IDR,
+    CurrencyCode.ILS,
+    CurrencyCode.IMP,
+    CurrencyCode.INR,
+    CurrencyCode.IQD,
+    CurrencyCode.IRR,
+    CurrencyCode.ISK,
+    CurrencyCode.JEP,
+    CurrencyCode.JMD,
+    CurrencyCode.JOD,
+    CurrencyCode.JPY,
+    CurrencyCode.KES,
+    CurrencyCode.KGS,
+    CurrencyCode.KHR,
+    CurrencyCode.KMF,
+    CurrencyCode.KPW,
+    CurrencyCode.KRW,
+    CurrencyCode.KWD,
+    CurrencyCode.KYD,
+    CurrencyCode.KZT,
+    CurrencyCode.LAK,
+    CurrencyCode.LBP,
+    CurrencyCode.LKR,
+    CurrencyCode.LRD,
+    CurrencyCode.LSL,
+    CurrencyCode.LTL,
+    CurrencyCode.LVL,
+    CurrencyCode.LYD,
+    CurrencyCode.MAD,
+    CurrencyCode.MDL,
+    CurrencyCode.MGA,
+    CurrencyCode.MKD,
+    CurrencyCode.MMK,
+    CurrencyCode.MNT,
+    CurrencyCode.MOP,
+    CurrencyCode.MUR,
+    CurrencyCode.MRU,
+    CurrencyCode.MVR,
+    CurrencyCode.MWK,
+    CurrencyCode.MXN,
+    CurrencyCode.MYR,
+    CurrencyCode.MZN,
+    CurrencyCode.NAD,
+    CurrencyCode.NGN,
+    CurrencyCode.NIO,
+    CurrencyCode.NOK,
+    CurrencyCode.NPR,
+    CurrencyCode.NZD,
+    CurrencyCode.OMR,
+    CurrencyCode.PAB,
+    CurrencyCode.PEN,
+    CurrencyCode.PGK,
+    CurrencyCode.PHP,
+    CurrencyCode.PKR,
+    CurrencyCode.PLN,
+    CurrencyCode.PYG,
+    CurrencyCode.QAR,
+    CurrencyCode.RON,
+    CurrencyCode.RSD,
+    CurrencyCode.RUB,
+    CurrencyCode.RUR,
+    CurrencyCode.RWF,
+    CurrencyCode.SAR,
+    CurrencyCode.SBD,
+    CurrencyCode.SCR,
+    CurrencyCode.SDG,
+    CurrencyCode.SEK,
+    CurrencyCode.SGD,
+    CurrencyCode.SHP,
+    CurrencyCode.SKK,
+    CurrencyCode.SLE,
+    CurrencyCode.SLL,
+    CurrencyCode.SOS,
+    CurrencyCode.SRD,
+    CurrencyCode.SSP,
+    CurrencyCode.STD,
+    CurrencyCode.STN,
+    CurrencyCode.SVC,
+    CurrencyCode.SYP,
+    CurrencyCode.SZL,
+    CurrencyCode.THB,
+    CurrencyCode.TJS,
+    CurrencyCode.TMT,
+    CurrencyCode.TND,
+    CurrencyCode.TOP,
+    CurrencyCode.TRL,
+    CurrencyCode.TRY,
+    CurrencyCode.TTD,
+    CurrencyCode.TWD,
+    CurrencyCode.TZS,
+    CurrencyCode.UAH,
+    CurrencyCode.UGX,
+    CurrencyCode.USD,
+    CurrencyCode.UYU,
+    CurrencyCode.UZS,
+    CurrencyCode.VEF,
+    CurrencyCode.VES,
+    CurrencyCode.VND,
+    CurrencyCode.VUV,
+    CurrencyCode.WST,
+    CurrencyCode.XAF,
+    CurrencyCode.XAG,
+    CurrencyCode.XAU,
+    CurrencyCode.XCD,
+    CurrencyCode.XCG,
+    CurrencyCode.XDR,
+    CurrencyCode.XOF,
+    CurrencyCode.XPF,
+    CurrencyCode.YER,
+    CurrencyCode.ZAR,
+    CurrencyCode.ZMW,
+    CurrencyCode.ZWD,
+    CurrencyCode.ZWL,
+)
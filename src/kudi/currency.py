@@ -1,10 +1,18 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import cached_property
 
-from kudi.exceptions import KudiException
+from kudi.exceptions import KudiException, InvalidCurrencyCodeError
 from kudi.currency_codes import CurrencyCode
-from kudi.currencies_data import CURRENCIES_DATA, CurrencyData
+from kudi.currencies_data import (
+    CASH_INCREMENTS,
+    CURRENCIES_DATA,
+    CURRENCY_ID_ORDER,
+    DENOMINATIONS,
+    CurrencyData,
+)
 from kudi.formatter import Formatter
+from kudi.parser import Parser, _symbol_of
 
 
 @dataclass(frozen=True)
@@ -15,8 +23,14 @@ class Currency:
     template: str
     minor_unit_separator: str
     thousand_delimiter: str
+    cash_increment: int = 1
+    """the smallest amount cash payments are rounded to, in the subunit"""
+    denominations: tuple[int, ...] = ()
+    """the notes and coins in circulation in the subunit, in decreasing order"""
+    id: int = -1
+    """a small stable integer for the currency, from 0 up, for columns and array engines"""
 
-    @property
+    @cached_property
     def formatter(self) -> Formatter:
         return Formatter(
             self.minor_unit,
@@ -26,6 +40,16 @@ class Currency:
             self.template,
         )
 
+    @cached_property
+    def parser(self) -> Parser:
+        return Parser(
+            self.minor_unit,
+            self.minor_unit_separator,
+            self.thousand_delimiter,
+            self.symbol,
+            self.code.value,
+        )
+
     def __eq__(self, other):
         return (
             self.code == other.code
@@ -34,13 +58,18 @@ class Currency:
             and self.template == other.template
             and self.minor_unit_separator == other.minor_unit_separator
             and self.thousand_delimiter == other.thousand_delimiter
-            and self.thousand_delimiter == other.thousand_delimiter
+            and self.cash_increment == other.cash_increment
+            and self.denominations == other.denominations
+            and self.id == other.id
         )
 
     def __str__(self):
         return f"{self.code}"
 
 
+_CURRENCY_IDS = {code: i for i, code in enumerate(CURRENCY_ID_ORDER)}
+
+
 def _get_currency_init_kwargs(code: CurrencyCode, data: CurrencyData) -> dict:
     return {
         "code": code,
@@ -49,6 +78,9 @@ def _get_currency_init_kwargs(code: CurrencyCode, data: CurrencyData) -> dict:
         "template": data["template"],
         "minor_unit_separator": data["minor_unit_separator"],
         "thousand_delimiter": data["thousand_delimiter"],
+        "cash_increment": CASH_INCREMENTS.get(code, 1),
+        "denominations": DENOMINATIONS.get(code, ()),
+        "id": _CURRENCY_IDS[code],
     }
 
 
@@ -58,8 +90,52 @@ CURRENCIES = {
 }
 
 
+# the currencies by id, ids index into it directly
+CURRENCIES_BY_ID: tuple[Currency, ...] = tuple(
+    CURRENCIES[code] for code in CURRENCY_ID_ORDER
+)
+
+
+def _get_currency_by_id(currency_id: int) -> Currency:
+    try:
+        if currency_id >= 0:
+            return CURRENCIES_BY_ID[currency_id]
+    except IndexError:
+        pass
+    raise InvalidCurrencyCodeError(f"`{currency_id}` is an invalid currency id")
+
+
 def _get_currency(code: CurrencyCode) -> Currency:
     currency = CURRENCIES.get(code, None)
     if not currency:
         raise KudiException(f"Unknown currency code: {code}")
     return currency
+
+
+def _index_by_symbol() -> dict[str, tuple[Currency, ...]]:
+    index: dict[str, list[Currency]] = {}
+    for currency in CURRENCIES.values():
+        for key in (currency.symbol, currency.code.value):
+            currencies = index.setdefault(key, [])
+            if currency not in currencies:
+                currencies.append(currency)
+    return {key: tuple(currencies) for key, currencies in index.items()}
+
+
+_CURRENCIES_BY_SYMBOL = _index_by_symbol()
+
+
+def _infer_currency(text: str) -> Currency:
+    """Determines the currency of a formatted amount from its symbol or alpha code."""
+    symbol = _symbol_of(text)
+    currencies = _CURRENCIES_BY_SYMBOL.get(symbol, ())
+    if len(currencies) == 1:
+        return currencies[0]
+    if not currencies:
+        raise InvalidCurrencyCodeError(
+            f"cannot determine the currency of `{text}`, please pass `code`"
+        )
+    codes = ", ".join(currency.code.value for currency in currencies)
+    raise InvalidCurrencyCodeError(
+        f"cannot determine the currency of `{text}`, `{symbol}` is used by {codes}, please pass `code`"
+    )
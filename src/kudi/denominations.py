@@ -0,0 +1,240 @@
+"""Breaking amounts into the fewest notes and coins.
+
+Amounts and denominations are ints in the subunit of a currency. Denomination systems where
+picking the largest note or coin that fits is always optimal, like most real currencies, are
+broken down greedily. Other systems, and breakdowns from a limited inventory, are solved exactly
+with dynamic programming that is cached per set of denominations and inventory, so repeated
+breakdowns such as ATM withdrawals reuse it.
+
+Example:
+    >>> breakdown((2000, 1000, 500, 100, 25, 10, 5, 1), 3_785)
+    (1, 1, 1, 2, 3, 1, 0, 0)
+"""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+
+
+def _validate(denominations: tuple[int, ...]):
+    if not denominations:
+        raise ValueError("no denominations specified")
+    if any(d <= 0 for d in denominations):
+        raise ValueError("denominations must be positive")
+    if any(a <= b for a, b in zip(denominations, denominations[1:])):
+        raise ValueError("denominations must be distinct and in decreasing order")
+
+
+def _greedy(denominations: tuple[int, ...], amount: int) -> list[int]:
+    counts = [0] * len(denominations)
+    for i, d in enumerate(denominations):
+        if d <= amount:
+            counts[i], amount = divmod(amount, d)
+    return counts
+
+
+def is_canonical(denominations: tuple[int, ...]) -> bool:
+    """Whether the greedy breakdown is the one with the fewest pieces for every amount.
+
+    Uses Pearson's O(n³) test, "A polynomial-time algorithm for the change-making problem"
+    (1994), which only checks the candidate counterexamples built from greedy breakdowns.
+    """
+    n = len(denominations)
+    if denominations[-1] != 1:
+        return False
+    for i in range(1, n):
+        greedy = _greedy(denominations, denominations[i - 1] - 1)
+        for j in range(i, n):
+            candidate = greedy[:j] + [greedy[j] + 1] + [0] * (n - j - 1)
+            value = sum(d * c for d, c in zip(denominations, candidate))
+            if sum(_greedy(denominations, value)) > sum(candidate):
+                return False
+    return True
+
+
+class _Table:
+    """The cached breakdown strategy for a set of denominations without limits"""
+
+    def __init__(self, denominations: tuple[int, ...]):
+        _validate(denominations)
+        # amounts that are not multiples of the smallest common unit cannot be made up, and the
+        # rest are broken down in that unit, e.g. in 50 kobo for NGN
+        self.unit = math.gcd(*denominations)
+        self.denominations = denominations
+        denominations = tuple(d // self.unit for d in denominations)
+        self.units = denominations
+        self.canonical = is_canonical(denominations)
+        if self.canonical:
+            return
+        # an optimal breakdown holds fewer than lcm(d, largest) / d pieces of any smaller
+        # denomination d, or they could be swapped for fewer of the largest, so only the
+        # part made of smaller pieces, at most `bound`, needs dynamic programming
+        largest = denominations[0]
+        self.bound = sum((math.lcm(largest, d) // d - 1) * d for d in denominations[1:])
+        pieces = [0] + [math.inf] * self.bound
+        last = [-1] * (self.bound + 1)
+        for value in range(1, self.bound + 1):
+            for i, d in enumerate(denominations):
+                if d <= value and pieces[value - d] + 1 < pieces[value]:
+                    pieces[value] = pieces[value - d] + 1
+                    last[value] = i
+        self.pieces = pieces
+        self.last = last
+
+    def breakdown(self, amount: int) -> list[int] | None:
+        amount, remainder = divmod(amount, self.unit)
+        if remainder:
+            return None
+        if self.canonical:
+            return _greedy(self.units, amount)
+        largest = self.units[0]
+        best, best_value = math.inf, -1
+        value = amount % largest if amount > self.bound else amount
+        while value <= self.bound and value <= amount:
+            total = (amount - value) // largest + self.pieces[value]
+            if total < best:
+                best, best_value = total, value
+            value += largest
+        if best_value < 0:
+            return None
+        counts = [0] * len(self.units)
+        counts[0] = (amount - best_value) // largest
+        while best_value:
+            i = self.last[best_value]
+            counts[i] += 1
+            best_value -= self.units[i]
+        return counts
+
+
+@lru_cache(maxsize=64)
+def _table(denominations: tuple[int, ...]) -> _Table:
+    return _Table(denominations)
+
+
+@lru_cache(maxsize=4096)
+def breakdown(denominations: tuple[int, ...], amount: int) -> tuple[int, ...] | None:
+    """Breaks an amount into the fewest pieces of unlimited denominations.
+
+    Args:
+        denominations: the values of the notes and coins, in decreasing order.
+        amount: the non-negative amount to break down.
+    Returns:
+        The number of pieces of each denomination, or `None` when the amount cannot be made
+        up of the denominations.
+    """
+    if amount < 0:
+        raise ValueError("cannot break down a negative amount")
+    counts = _table(denominations).breakdown(amount)
+    return None if counts is None else tuple(counts)
+
+
+class _Inventory:
+    """The cached breakdown strategy for a limited inventory of denominations.
+
+    Only the denominations with pieces left take part, in units of their gcd. The fewest pieces
+    making up an amount from the denominations at index `i` onwards are memoized by
+    `(i, amount)`, so every amount is solved in time bounded by the number of such states
+    rather than by the number of combinations of pieces, and later breakdowns from the same
+    inventory reuse the states solved before.
+    """
+
+    # the memo is cleared once it holds this many states, to bound its memory
+    max_states = 1 << 20
+
+    def __init__(self, denominations: tuple[int, ...], available: tuple[int, ...]):
+        _validate(denominations)
+        if len(available) != len(denominations) or any(a < 0 for a in available):
+            raise ValueError("the available pieces must be non-negative counts")
+        self.size = len(denominations)
+        self.indices = tuple(i for i, a in enumerate(available) if a > 0)
+        stocked = tuple(denominations[i] for i in self.indices)
+        self.unit = math.gcd(*stocked) if stocked else 1
+        self.units = tuple(d // self.unit for d in stocked)
+        self.available = tuple(available[i] for i in self.indices)
+        n = len(stocked)
+        # what the smaller denominations can make up at most, and the unit of what they can
+        # make up, to rule out amounts without searching
+        self.reachable = [0] * (n + 1)
+        self.divisors = [0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            self.reachable[i] = (
+                self.reachable[i + 1] + self.units[i] * self.available[i]
+            )
+            self.divisors[i] = math.gcd(self.divisors[i + 1], self.units[i])
+        self.memo: dict[tuple[int, int], tuple[float, int]] = {}
+
+    def _solve(self, i: int, amount: int) -> tuple[float, int]:
+        """Returns the fewest pieces making up the amount from the denominations at index `i`
+        onwards, and how many of the denomination at `i` they hold."""
+        if amount == 0:
+            return 0, 0
+        if (
+            i == len(self.units)
+            or amount > self.reachable[i]
+            or amount % self.divisors[i]
+        ):
+            return math.inf, 0
+        key = (i, amount)
+        solved = self.memo.get(key)
+        if solved is not None:
+            return solved
+        d = self.units[i]
+        high = min(self.available[i], amount // d)
+        # fewer pieces of this denomination than this leave more than the rest can make up
+        low = max(0, -(-(amount - self.reachable[i + 1]) // d))
+        best, best_count = math.inf, 0
+        smaller = self.units[i + 1] if i + 1 < len(self.units) else 0
+        for count in range(high, low - 1, -1):
+            rest = amount - count * d
+            # the rest needs at least rest / smaller pieces, a bound that only grows as
+            # the count goes down, so no smaller count can do better
+            if smaller and count + -(-rest // smaller) >= best:
+                break
+            pieces = count + self._solve(i + 1, rest)[0]
+            if pieces < best:
+                best, best_count = pieces, count
+        solved = self.memo[key] = (best, best_count)
+        return solved
+
+    def breakdown(self, amount: int) -> list[int] | None:
+        amount, remainder = divmod(amount, self.unit)
+        if remainder:
+            return None
+        if len(self.memo) > self.max_states:
+            self.memo.clear()
+        if self._solve(0, amount)[0] == math.inf:
+            return None
+        counts = [0] * self.size
+        for i, index in enumerate(self.indices):
+            count = self._solve(i, amount)[1]
+            counts[index] = count
+            amount -= count * self.units[i]
+        return counts
+
+
+@lru_cache(maxsize=64)
+def _inventory(
+    denominations: tuple[int, ...], available: tuple[int, ...]
+) -> _Inventory:
+    return _Inventory(denominations, available)
+
+
+@lru_cache(maxsize=4096)
+def breakdown_available(
+    denominations: tuple[int, ...], available: tuple[int, ...], amount: int
+) -> tuple[int, ...] | None:
+    """Breaks an amount into the fewest pieces of a limited inventory.
+
+    Args:
+        denominations: the values of the notes and coins, in decreasing order.
+        available: the number of pieces of each denomination in the inventory.
+        amount: the non-negative amount to break down.
+    Returns:
+        The number of pieces of each denomination, or `None` when the amount cannot be made
+        up of the inventory.
+    """
+    if amount < 0:
+        raise ValueError("cannot break down a negative amount")
+    counts = _inventory(denominations, available).breakdown(amount)
+    return None if counts is None else tuple(counts)
@@ -15,3 +15,7 @@ class InvalidCurrencyNumericCodeError(InvalidCurrencyCodeError):
 
 class CurrencyMismatchError(KudiException):
     """Raised when you try to perform arithmetic operations on two different currencies"""
+
+
+class InvalidLedgerFileError(KudiException, ValueError):
+    """Raised when a ledger file cannot be read or written"""
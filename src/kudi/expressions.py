@@ -0,0 +1,250 @@
+"""Lazy money expressions evaluated in a single pass.
+
+`a + b - c + d * 3` over monies builds a new `Money` for every operator. `expr` records the
+operations instead, as a chain of nodes that costs O(1) per operator, and `evaluate` checks the
+currencies once and computes the result as a single int, or fills a single int64 buffer for
+money arrays in one pass over their elements, without any intermediate monies or arrays.
+Rates such as `Decimal("0.075")` are applied exactly, so the result is rounded once.
+
+Example:
+    >>> ((expr(Money(1_000, "USD")) + Money(250, "USD") - Money(75, "USD")) * 3).evaluate()
+    Money(amount=3525, code="USD")
+"""
+
+from __future__ import annotations
+
+import operator
+from array import array
+from decimal import ROUND_HALF_UP, Decimal
+from fractions import Fraction
+from itertools import repeat
+from typing import Iterator
+
+from kudi.calculator import Calculator
+from kudi.currency import Currency
+from kudi.exceptions import CurrencyMismatchError
+from kudi.money import Money
+from kudi.money_array import MoneyArray
+
+
+class Expr:
+    """Expr is a lazily evaluated arithmetic expression over monies and money arrays.
+
+    Expressions support `+` and `-` with monies, money arrays and other expressions, `*` and `/`
+    by ints, `Decimal`s and `Fraction`s, and negation. Money arrays in an expression must have
+    the same length, monies are added to every element.
+    """
+
+    __slots__ = ("_parent", "_op", "_arg")
+
+    def __init__(self, parent: Expr | None, op: str, arg):
+        self._parent = parent
+        self._op = op
+        self._arg = arg
+
+    def __add__(self, other: Money | MoneyArray | Expr) -> Expr:
+        if not isinstance(other, _OPERANDS):
+            return NotImplemented
+        return _node(self, "+", other)
+
+    def __radd__(self, other: Money | MoneyArray) -> Expr:
+        if not isinstance(other, (Money, MoneyArray)):
+            return NotImplemented
+        return Expr(self, "+", other)
+
+    def __sub__(self, other: Money | MoneyArray | Expr) -> Expr:
+        if not isinstance(other, _OPERANDS):
+            return NotImplemented
+        return _node(self, "-", other)
+
+    def __rsub__(self, other: Money | MoneyArray) -> Expr:
+        if not isinstance(other, (Money, MoneyArray)):
+            return NotImplemented
+        return Expr(Expr(self, "*", (-1, 1)), "+", other)
+
+    def __mul__(self, by: int | Decimal | Fraction) -> Expr:
+        if not isinstance(by, (int, Decimal, Fraction)):
+            return NotImplemented
+        return Expr(self, "*", Money._as_ratio(by))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, by: int | Decimal | Fraction) -> Expr:
+        if not isinstance(by, (int, Decimal, Fraction)):
+            return NotImplemented
+        numerator, denominator = Money._as_ratio(by)
+        if numerator == 0:
+            raise ZeroDivisionError("division of money by zero")
+        return Expr(self, "*", (denominator, numerator))
+
+    def __neg__(self) -> Expr:
+        return Expr(self, "*", (-1, 1))
+
+    def _nodes(self) -> list[Expr]:
+        nodes = []
+        node = self
+        while node is not None:
+            nodes.append(node)
+            node = node._parent
+        nodes.reverse()
+        return nodes
+
+    def _linear(self, state: list) -> tuple[int, list[list], int]:
+        """Returns the expression in the form `(constant + Σ coefficient × array) / denominator`.
+
+        Only `+`, `-` and rates are allowed, so an expression is linear in its operands: the
+        monies fold into the int `constant`, each money array becomes a `[coefficient,
+        amounts]` term and `denominator` is positive. `state` holds the currency and the array
+        length.
+        """
+        constant = 0
+        terms: list[list] = []
+        denominator = 1
+        for node in self._nodes():
+            op, arg = node._op, node._arg
+            if op == "*":
+                numerator, divisor = arg
+                if divisor < 0:
+                    numerator, divisor = -numerator, -divisor
+                if numerator != 1:
+                    constant *= numerator
+                    for term in terms:
+                        term[0] *= numerator
+                denominator *= divisor
+                continue
+            sign = 1 if op == "+" else -1
+            if isinstance(arg, Expr):
+                sub_constant, sub_terms, sub_denominator = arg._linear(state)
+                # bring both to the common denominator
+                if sub_denominator != 1:
+                    constant *= sub_denominator
+                    for term in terms:
+                        term[0] *= sub_denominator
+                scale = sign * denominator
+                constant += sub_constant * scale
+                terms.extend([c * scale, amounts] for c, amounts in sub_terms)
+                denominator *= sub_denominator
+                continue
+            currency = state[0]
+            if currency is None:
+                state[0] = arg._currency
+            elif arg._currency is not currency and arg._currency != currency:
+                raise CurrencyMismatchError(
+                    "operations on monies with different currencies is not allowed"
+                )
+            if isinstance(arg, Money):
+                # the common case of a chain of monies stays in plain ints
+                constant += sign * arg._amount * denominator
+                continue
+            if state[1] is None:
+                state[1] = len(arg)
+            elif len(arg) != state[1]:
+                raise ValueError("MoneyArray operands must have the same length")
+            terms.append([sign * denominator, arg._amounts])
+        return constant, terms, denominator
+
+    def evaluate(self, rounding: str = ROUND_HALF_UP) -> Money | MoneyArray:
+        """Evaluates the expression, rounding once when it has rates or divisions.
+
+        Money arrays are evaluated element by element in a single pass that writes straight
+        into the int64 buffer of the result.
+
+        Args:
+            rounding: one of the rounding modes of the `decimal` module, e.g. `ROUND_HALF_EVEN`.
+        Returns:
+            A money, or a money array when the expression has money arrays.
+        Raises:
+            CurrencyMismatchError: when the operands are in different currencies.
+            ValueError: when the money arrays have different lengths.
+        """
+        state: list = [None, None]
+        constant, terms, denominator = self._linear(state)
+        currency: Currency = state[0]
+        if state[1] is None:
+            if denominator != 1:
+                constant = Calculator.divide_rounded(constant, denominator, rounding)
+            return Money._from_minor_units(constant, currency)
+        values = _elements(constant, terms, state[1])
+        if denominator != 1:
+            values = map(
+                Calculator.divide_rounded,
+                values,
+                repeat(denominator),
+                repeat(rounding),
+            )
+        return MoneyArray._from_view(memoryview(array("q", values)), currency)
+
+    def __repr__(self):
+        parts = []
+        for node in self._nodes():
+            if node._parent is None:
+                parts.append(repr(node._arg))
+            elif node._op == "*":
+                numerator, denominator = node._arg
+                rate = (
+                    f"{numerator}" if denominator == 1 else f"{numerator}/{denominator}"
+                )
+                parts = ["(", *parts, f") * {rate}"]
+            else:
+                parts.append(f" {node._op} {node._arg!r}")
+        return f"expr({''.join(parts)})"
+
+
+_OPERANDS = (Money, MoneyArray, Expr)
+
+
+def _node(parent: Expr, op: str, arg) -> Expr:
+    # skips `__init__`, nodes are created for every operator of a chain
+    node = object.__new__(Expr)
+    node._parent = parent
+    node._op = op
+    node._arg = arg
+    return node
+
+
+# iterating nested maps recurses once per term, longer sums use a function per element
+_MAX_CHAINED_TERMS = 64
+
+
+def _elements(constant: int, terms: list[list], length: int) -> Iterator[int]:
+    """Lazily computes `constant + Σ coefficient × amount` for every element of the arrays"""
+    # an array used several times in the expression is read once
+    coefficients: dict[int, list] = {}
+    for coefficient, amounts in terms:
+        term = coefficients.setdefault(id(amounts), [0, amounts])
+        term[0] += coefficient
+    terms = [term for term in coefficients.values() if term[0]]
+    if not terms:
+        return repeat(constant, length)
+    if len(terms) > _MAX_CHAINED_TERMS:
+        multipliers = [coefficient for coefficient, _ in terms]
+
+        def element(*row: int) -> int:
+            return constant + sum(map(operator.mul, multipliers, row))
+
+        return map(element, *(amounts for _, amounts in terms))
+    # a chain of lazy maps, so each element goes through every term before the next one is
+    # read and no intermediate list is built
+    values = None
+    for coefficient, amounts in terms:
+        if values is None:
+            values = amounts if coefficient == 1 else map(coefficient.__mul__, amounts)
+        elif coefficient == 1:
+            values = map(operator.add, values, amounts)
+        elif coefficient == -1:
+            values = map(operator.sub, values, amounts)
+        else:
+            values = map(operator.add, values, map(coefficient.__mul__, amounts))
+    return map(constant.__add__, values) if constant else iter(values)
+
+
+def expr(operand: Money | MoneyArray) -> Expr:
+    """Starts a lazy expression, see `Expr`.
+
+    Example:
+        >>> total = (expr(subtotal) + shipping - discount) * Decimal("1.075")
+        >>> total.evaluate()
+    """
+    if not isinstance(operand, (Money, MoneyArray)):
+        raise TypeError(f"`{type(operand)}` is not a money or a money array")
+    return Expr(None, "+", operand)
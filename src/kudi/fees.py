@@ -0,0 +1,208 @@
+"""Tiered fee schedules applied to monies or whole money arrays.
+
+A schedule is compiled once into integer multipliers per tier, so applying it is a single pass of
+int arithmetic with no `Decimal` or `Money` objects per row, and the net amounts always reconcile
+exactly with the gross: `fee + net == gross`.
+
+Example:
+    >>> schedule = FeeSchedule("NGN", Tier(bps=150, fixed=10_000, maximum=200_000))
+    >>> schedule.apply(Money(1_000_000, "NGN"))
+    Fees(fee=Money(amount=25000, code="NGN"), net=Money(amount=975000, code="NGN"))
+"""
+
+from __future__ import annotations
+
+import math
+import operator
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from decimal import (
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    Decimal,
+)
+from fractions import Fraction
+from typing import NamedTuple
+
+from kudi.calculator import ROUNDING_MODES
+from kudi.currency import Currency
+from kudi.currency_codes import CurrencyCode
+from kudi.exceptions import CurrencyMismatchError
+from kudi.money import Money, minor_units
+from kudi.money_array import MoneyArray
+
+
+class Fees(NamedTuple):
+    fee: Money | MoneyArray
+    net: Money | MoneyArray
+
+
+@dataclass(frozen=True)
+class Tier:
+    """A tier of a fee schedule.
+
+    Amounts are ints in the subunit of the schedule's currency or monies in that currency.
+
+    Attributes:
+        up_to: the largest gross amount the tier applies to, `None` for no limit.
+        bps: the percentage part of the fee in basis points, e.g. `150` for 1.5%.
+        fixed: the fixed part of the fee.
+        minimum: the smallest fee charged in the tier.
+        maximum: the largest fee charged in the tier.
+    """
+
+    up_to: int | Money | None = None
+    bps: int | Decimal | Fraction = 0
+    fixed: int | Money = 0
+    minimum: int | Money | None = None
+    maximum: int | Money | None = None
+
+
+class FeeSchedule:
+    """FeeSchedule computes tiered fees for a single currency.
+
+    The tier is chosen by the size of the gross amount and its fee is
+    `gross * bps / 10_000 + fixed`, with the percentage part rounded once to the subunit of the
+    currency and the total clamped to the tier's minimum and maximum. Fees on negative amounts
+    such as refunds mirror the fees on positive ones, so the rounding mode applies to the size
+    of the fee, e.g. `ROUND_FLOOR` and `ROUND_DOWN` both round it towards zero.
+    """
+
+    def __init__(
+        self,
+        code: int | str | CurrencyCode,
+        *tiers: Tier,
+        rounding: str = ROUND_HALF_UP,
+    ):
+        """Compiles a fee schedule.
+
+        Args:
+            code: the currency of the amounts the schedule applies to, see `Money`.
+            tiers: the tiers in increasing order of `up_to`, the last one without a limit.
+            rounding: one of the rounding modes of the `decimal` module.
+        """
+        if not tiers:
+            raise ValueError("no tiers specified")
+        if tiers[-1].up_to is not None or any(t.up_to is None for t in tiers[:-1]):
+            raise ValueError("every tier but the last must have a limit")
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"`{rounding}` is not a supported rounding mode")
+        self._currency: Currency = Money._resolve_currency(code)
+        self.tiers = tiers
+        self.rounding = rounding
+        self._thresholds = [minor_units(t.up_to, self._currency) for t in tiers[:-1]]
+        if self._thresholds != sorted(set(self._thresholds)):
+            raise ValueError("tiers must be in increasing order of `up_to`")
+        self._compiled = [self._compile(tier) for tier in tiers]
+
+    def _compile(self, tier: Tier) -> tuple:
+        numerator, denominator = Money._as_ratio(tier.bps)
+        if numerator < 0:
+            raise ValueError("negative rates are not allowed")
+        denominator *= 10_000
+        # the rounded percentage part is (gross * multiplier + offset) // divisor, except for
+        # ROUND_HALF_EVEN, which also needs the remainder
+        if self.rounding in (ROUND_HALF_UP, ROUND_HALF_EVEN):
+            multiplier, offset, divisor = 2 * numerator, denominator, 2 * denominator
+        elif self.rounding == ROUND_HALF_DOWN:
+            multiplier, offset, divisor = (
+                2 * numerator,
+                denominator - 1,
+                2 * denominator,
+            )
+        elif self.rounding in (ROUND_DOWN, ROUND_FLOOR):
+            multiplier, offset, divisor = numerator, 0, denominator
+        else:  # ROUND_UP, ROUND_CEILING
+            multiplier, offset, divisor = numerator, denominator - 1, denominator
+        fixed = minor_units(tier.fixed, self._currency)
+        minimum = (
+            0 if tier.minimum is None else minor_units(tier.minimum, self._currency)
+        )
+        maximum = (
+            math.inf
+            if tier.maximum is None
+            else minor_units(tier.maximum, self._currency)
+        )
+        if minimum > maximum:
+            raise ValueError("the minimum fee of a tier must not exceed its maximum")
+        return (
+            multiplier,
+            offset,
+            divisor,
+            fixed,
+            minimum,
+            maximum,
+            numerator,
+            denominator,
+        )
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    def _fees(self, amounts, fees: array | list):
+        thresholds = self._thresholds
+        compiled = self._compiled
+        first = compiled[0]
+        half_even = self.rounding == ROUND_HALF_EVEN
+        append = fees.append
+        for amount in amounts:
+            size = -amount if amount < 0 else amount
+            if thresholds:
+                tier = compiled[bisect_left(thresholds, size)]
+            else:
+                tier = first
+            multiplier, offset, divisor, fixed, minimum, maximum, num, den = tier
+            if half_even:
+                fee, remainder = divmod(size * num, den)
+                if 2 * remainder > den or (2 * remainder == den and fee & 1):
+                    fee += 1
+                fee += fixed
+            else:
+                fee = (size * multiplier + offset) // divisor + fixed
+            if fee < minimum:
+                fee = minimum
+            elif fee > maximum:
+                fee = maximum
+            append(-fee if amount < 0 else fee)
+
+    def _assert_is_same_currency_with(self, other: Money | MoneyArray):
+        if other.currency is not self._currency and other.currency != self._currency:
+            raise CurrencyMismatchError(
+                "operations on monies with different currencies is not allowed"
+            )
+
+    def apply(self, gross: Money | MoneyArray) -> Fees:
+        """Computes the fee and the net of a money or of every money in an array.
+
+        Returns:
+            The fees and nets, as monies or money arrays like `gross`. For every amount,
+            `fee + net == gross`.
+        Raises:
+            CurrencyMismatchError: when `gross` is not in the currency of the schedule.
+        """
+        self._assert_is_same_currency_with(gross)
+        currency = self._currency
+        if isinstance(gross, Money):
+            fees = []
+            self._fees((gross.amount,), fees)
+            fee = fees[0]
+            return Fees(
+                Money._from_minor_units(fee, currency),
+                Money._from_minor_units(gross.amount - fee, currency),
+            )
+        amounts = gross.amounts
+        fees = array("q")
+        self._fees(amounts, fees)
+        nets = array("q", map(operator.sub, amounts, fees))
+        return Fees(
+            MoneyArray._from_view(memoryview(fees), currency),
+            MoneyArray._from_view(memoryview(nets), currency),
+        )
+
+    def __repr__(self):
+        return f'FeeSchedule(code="{self._currency.code}", tiers={self.tiers!r}, rounding="{self.rounding}")'
@@ -1,11 +1,191 @@
 from __future__ import annotations
 import math
+from dataclasses import dataclass, field
 from decimal import Decimal, ROUND_HALF_UP
+from typing import Callable, Iterable
 
-from kudi.calculator import Calculator
+from kudi import hooks
 from kudi.types import Amount
 
 
+def _escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+@dataclass(frozen=True)
+class FormatPlan:
+    """A currency template compiled into the text around the digits.
+
+    The symbol is already substituted into `prefix` and `suffix`, and the placement of the
+    negative sign is decided up front, so formatting an amount is a single `str.format` call.
+    Plans are immutable and can be shared by batch renderers.
+    """
+
+    prefix: str
+    suffix: str
+    negative_prefix: str
+    negative_suffix: str
+    minor_unit: int
+    minor_unit_separator: str
+    thousand_delimiter: str
+    primary_group: int = 3
+    secondary_group: int = 3
+    _scale: int = field(init=False, repr=False, compare=False)
+    _regroup: bool = field(init=False, repr=False, compare=False)
+    _positive: Callable[..., str] = field(init=False, repr=False, compare=False)
+    _negative: Callable[..., str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Each sign gets a single `str.format` pattern with the text around the digits
+        # baked in; only delimiters other than `,` and groups other than 3 digits need
+        # the major digits regrouped first.
+        if self.primary_group <= 0 or self.secondary_group <= 0:
+            raise ValueError("group sizes must be greater than 0")
+        regroup = self.thousand_delimiter != "" and (
+            self.thousand_delimiter != ","
+            or self.primary_group != 3
+            or self.secondary_group != 3
+        )
+        major = "{0}" if regroup or not self.thousand_delimiter else "{0:,}"
+        minor = ""
+        if self.minor_unit > 0:
+            minor = f"{_escape(self.minor_unit_separator)}{{1:0{self.minor_unit}d}}"
+        digits = f"{major}{minor}"
+        setattr_ = object.__setattr__
+        setattr_(self, "_scale", 10 ** max(self.minor_unit, 0))
+        setattr_(self, "_regroup", regroup)
+        setattr_(
+            self,
+            "_positive",
+            f"{_escape(self.prefix)}{digits}{_escape(self.suffix)}".format,
+        )
+        setattr_(
+            self,
+            "_negative",
+            f"{_escape(self.negative_prefix)}{digits}{_escape(self.negative_suffix)}".format,
+        )
+
+    @classmethod
+    def compile(
+        cls,
+        minor_unit: int,
+        minor_unit_separator: str,
+        thousand_delimiter: str,
+        symbol: str,
+        template: str,
+        primary_group: int = 3,
+        secondary_group: int | None = None,
+        negative_style: str = "sign",
+    ) -> FormatPlan:
+        """Compiles a currency template such as `$1` or `1 $`, where `1` stands for the
+        digits and `$` for the symbol.
+
+        Args:
+            primary_group: the size of the group of digits next to the minor unit separator.
+            secondary_group: the size of the other groups, defaults to `primary_group`.
+                e.g. `12,34,56,789` has a primary group of 3 and a secondary group of 2.
+            negative_style: `sign` for `-$1.00` or `parentheses` for `($1.00)`.
+        """
+        before, digits, after = template.partition("1")
+        if not digits:
+            raise ValueError(f"`{template}` is not a valid template, it has no `1`")
+        if "$" in before:
+            before = before.replace("$", symbol, 1)
+        else:
+            after = after.replace("$", symbol, 1)
+        if negative_style == "sign":
+            negative_prefix, negative_suffix = f"-{before}", after
+        elif negative_style == "parentheses":
+            negative_prefix, negative_suffix = f"({before}", f"{after})"
+        else:
+            raise ValueError(
+                f"`{negative_style}` is not a valid negative style, use `sign` or `parentheses`"
+            )
+        return cls(
+            prefix=before,
+            suffix=after,
+            negative_prefix=negative_prefix,
+            negative_suffix=negative_suffix,
+            minor_unit=minor_unit,
+            minor_unit_separator=minor_unit_separator,
+            thousand_delimiter=thousand_delimiter,
+            primary_group=primary_group,
+            secondary_group=primary_group
+            if secondary_group is None
+            else secondary_group,
+        )
+
+    def _group(self, major: int) -> str:
+        if self.primary_group == 3 and self.secondary_group == 3:
+            return f"{major:,}".replace(",", self.thousand_delimiter)
+        s = f"{major}"
+        if len(s) <= self.primary_group:
+            return s
+        head, tail = s[: -self.primary_group], s[-self.primary_group :]
+        size = self.secondary_group
+        first = len(head) % size or size
+        groups = [head[:first]]
+        groups.extend(head[i : i + size] for i in range(first, len(head), size))
+        groups.append(tail)
+        return self.thousand_delimiter.join(groups)
+
+    def digits(self, amount: Amount) -> str:
+        """Renders a non-negative amount in the subunit without the symbol"""
+        major, minor = divmod(amount, self._scale)
+        if self._regroup:
+            major = self._group(major)
+        elif self.thousand_delimiter:
+            major = f"{major:,}"
+        if self.minor_unit > 0:
+            return f"{major}{self.minor_unit_separator}{minor:0{self.minor_unit}d}"
+        return f"{major}"
+
+    def format(self, amount: Amount) -> str:
+        if amount < 0:
+            render = self._negative
+            amount = -amount
+        else:
+            render = self._positive
+        major, minor = divmod(amount, self._scale)
+        if self._regroup:
+            major = self._group(major)
+        return render(major, minor)
+
+    def format_many(self, amounts: Iterable[Amount]) -> list[str]:
+        """Formats many amounts with the same plan"""
+        start = hooks._start() if hooks._hooks else 0
+        fmt = self.format
+        formatted = [fmt(amount) for amount in amounts]
+        if start:
+            hooks._emit("format_many", len(formatted), None, start)
+        return formatted
+
+
+@dataclass(frozen=True)
+class FormatStyle:
+    """Locale conventions applied on top of a currency's template.
+
+    `None` keeps the currency's own delimiter or separator. Formatters compile each style
+    once and cache the resulting plan.
+    """
+
+    primary_group: int = 3
+    secondary_group: int | None = None
+    thousand_delimiter: str | None = None
+    minor_unit_separator: str | None = None
+    negative_style: str = "sign"
+
+
+INDIAN_STYLE = FormatStyle(primary_group=3, secondary_group=2)
+"""Lakh/crore grouping, e.g. `12,34,56,789.00`"""
+ACCOUNTING_STYLE = FormatStyle(negative_style="parentheses")
+"""Negative amounts in parentheses, e.g. `($1.00)`"""
+NBSP_STYLE = FormatStyle(thousand_delimiter="\u00a0")
+"""Groups delimited by non-breaking spaces, e.g. `1 234 567.89`"""
+DECIMAL_COMMA_STYLE = FormatStyle(thousand_delimiter=".", minor_unit_separator=",")
+"""A comma before the minor unit and dots between groups, e.g. `1.234.567,89`"""
+
+
 class Formatter:
     def __init__(
         self,
@@ -20,31 +200,37 @@ class Formatter:
         self.thousand_delimiter = thousand_delimiter
         self.symbol = symbol
         self.template = template
+        self.plan = FormatPlan.compile(
+            minor_unit, minor_unit_separator, thousand_delimiter, symbol, template
+        )
+        self._plans: dict[FormatStyle, FormatPlan] = {}
 
-    def format(self, amount: Amount) -> str:
-        sa = f"{Calculator.absolute(amount)}"
-
-        if len(sa) <= self.minor_unit:
-            sa = f"{'0' * (self.minor_unit - len(sa) + 1)}{sa}"
-
-        if self.thousand_delimiter != "":
-            i = len(sa) - self.minor_unit - 3
-            while i > 0:
-                sa = sa[:i] + self.thousand_delimiter + sa[i:]
-
-        if self.minor_unit > 0:
-            sa = (
-                sa[: len(sa) - self.minor_unit]
-                + self.minor_unit_separator
-                + sa[len(sa) - self.minor_unit :]
+    def plan_for(self, style: FormatStyle | None) -> FormatPlan:
+        """Returns the plan for the given style, compiling it on first use"""
+        if style is None:
+            return self.plan
+        plan = self._plans.get(style)
+        if plan is None:
+            plan = self._plans[style] = FormatPlan.compile(
+                self.minor_unit,
+                self.minor_unit_separator
+                if style.minor_unit_separator is None
+                else style.minor_unit_separator,
+                self.thousand_delimiter
+                if style.thousand_delimiter is None
+                else style.thousand_delimiter,
+                self.symbol,
+                self.template,
+                primary_group=style.primary_group,
+                secondary_group=style.secondary_group,
+                negative_style=style.negative_style,
             )
+        return plan
 
-        sa = self.template.replace("1", sa, 1)
-        sa = sa.replace("$", self.symbol, 1)
-
-        if amount < 0:
-            sa = f"-{sa}"
-        return sa
+    def format(self, amount: Amount, style: FormatStyle | None = None) -> str:
+        if style is None:
+            return self.plan.format(amount)
+        return self.plan_for(style).format(amount)
 
     def to_major_units(self, amount: Amount) -> Decimal:
         if self.minor_unit < 0:
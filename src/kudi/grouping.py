@@ -0,0 +1,104 @@
+"""Single pass partitioning and aggregation of monies in mixed currencies.
+
+Currencies are shared objects, so monies are grouped by the identity of their currency rather
+than by comparing currencies, and amounts are accumulated as python ints. `Money` objects are
+only built for the results.
+
+Example:
+    >>> totals_by_currency([Money(150, "USD"), Money(300, "NGN"), Money(-20, "USD")])
+    {<CurrencyCode.USD: 'USD'>: Money(amount=130, code="USD"), <CurrencyCode.NGN: 'NGN'>: Money(amount=300, code="NGN")}
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple
+
+from kudi.currency import Currency
+from kudi.currency_codes import CurrencyCode
+from kudi.money import Money
+
+
+class CurrencySummary(NamedTuple):
+    count: int
+    total: Money
+    min: Money
+    max: Money
+
+
+def _by_code(groups: dict[int, Currency]) -> dict[CurrencyCode, list[int]]:
+    # equal currencies that are distinct objects are merged by their code
+    keys: dict[CurrencyCode, list[int]] = {}
+    for key, currency in groups.items():
+        keys.setdefault(currency.code, []).append(key)
+    return keys
+
+
+def group_by_currency(monies: Iterable[Money]) -> dict[CurrencyCode, list[Money]]:
+    """Partitions monies by currency, keeping their order within each currency."""
+    groups: dict[CurrencyCode, list[Money]] = {}
+    # equal currencies that are distinct objects share their code's list, so the monies stay in
+    # input order even when they interleave
+    by_identity: dict[int, list[Money]] = {}
+    for money in monies:
+        currency = money._currency
+        group = by_identity.get(id(currency))
+        if group is None:
+            group = by_identity[id(currency)] = groups.setdefault(currency.code, [])
+        group.append(money)
+    return groups
+
+
+def totals_by_currency(monies: Iterable[Money]) -> dict[CurrencyCode, Money]:
+    """Sums monies per currency."""
+    totals: dict[int, int] = {}
+    currencies: dict[int, Currency] = {}
+    get = totals.get
+    for money in monies:
+        currency = money._currency
+        key = id(currency)
+        total = get(key)
+        if total is None:
+            currencies[key] = currency
+            totals[key] = money._amount
+        else:
+            totals[key] = total + money._amount
+    return {
+        code: Money._from_minor_units(
+            sum(totals[key] for key in keys), currencies[keys[0]]
+        )
+        for code, keys in _by_code(currencies).items()
+    }
+
+
+def summarize_by_currency(
+    monies: Iterable[Money],
+) -> dict[CurrencyCode, CurrencySummary]:
+    """Counts, sums and finds the extremes of monies per currency."""
+    stats: dict[int, list[int]] = {}
+    currencies: dict[int, Currency] = {}
+    get = stats.get
+    for money in monies:
+        currency = money._currency
+        amount = money._amount
+        entry = get(id(currency))
+        if entry is None:
+            currencies[id(currency)] = currency
+            stats[id(currency)] = [1, amount, amount, amount]
+            continue
+        entry[0] += 1
+        entry[1] += amount
+        if amount < entry[2]:
+            entry[2] = amount
+        elif amount > entry[3]:
+            entry[3] = amount
+    result = {}
+    for code, keys in _by_code(currencies).items():
+        currency = currencies[keys[0]]
+        entries = [stats[key] for key in keys]
+        result[code] = CurrencySummary(
+            count=sum(entry[0] for entry in entries),
+            total=Money._from_minor_units(sum(entry[1] for entry in entries), currency),
+            min=Money._from_minor_units(min(entry[2] for entry in entries), currency),
+            max=Money._from_minor_units(max(entry[3] for entry in entries), currency),
+        )
+    return result
@@ -0,0 +1,87 @@
+"""Hooks for tracing expensive money operations.
+
+Callbacks registered with `on_operation` are called after `Money.split`, `Money.allocate`,
+`FormatPlan.format_many` and `ParsePlan.parse_many` with the name of the operation, the size of
+its input, the currency and the elapsed time. Operations only check whether any hook is
+registered, so they cost nothing extra when none is.
+
+Example:
+    >>> def trace(operation: Operation):
+    ...     span.add_event(operation.name, {"size": operation.size, "ns": operation.elapsed_ns})
+    >>> remove = on_operation(trace, sample_rate=0.01)
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable, NamedTuple
+
+
+class Operation(NamedTuple):
+    name: str
+    """e.g. `split`, `allocate`, `format_many` or `parse_many`"""
+    size: int
+    """the number of parties, ratios or amounts"""
+    code: str | None
+    """the alpha code of the currency, `None` when the operation is not tied to one"""
+    elapsed_ns: int
+
+
+Hook = Callable[[Operation], object]
+
+_hooks: list[tuple[Hook, float]] = []
+_max_sample_rate = 0.0
+
+
+def _update_max_sample_rate():
+    global _max_sample_rate
+    _max_sample_rate = max((rate for _, rate in _hooks), default=0.0)
+
+
+def on_operation(callback: Hook, *, sample_rate: float = 1.0) -> Callable[[], None]:
+    """Registers a callback for expensive operations.
+
+    Args:
+        callback: called with an `Operation` after each sampled operation.
+        sample_rate: the fraction of operations the callback is called for, between 0
+            and 1. Operations that no hook samples are not timed.
+    Returns:
+        A function that removes the callback.
+    """
+    if not 0 < sample_rate <= 1:
+        raise ValueError("sample_rate must be greater than 0 and at most 1")
+    entry = (callback, sample_rate)
+    _hooks.append(entry)
+    _update_max_sample_rate()
+
+    def remove():
+        if entry in _hooks:
+            _hooks.remove(entry)
+            _update_max_sample_rate()
+
+    return remove
+
+
+def clear():
+    """Removes every registered callback"""
+    _hooks.clear()
+    _update_max_sample_rate()
+
+
+def _start() -> int:
+    """Returns the start time of an operation, or 0 when no hook samples it. Callers check
+    `_hooks` first so the common path is a single truth test."""
+    if _max_sample_rate >= 1 or random.random() < _max_sample_rate:
+        return time.perf_counter_ns()
+    return 0
+
+
+def _emit(name: str, size: int, code: str | None, start: int):
+    elapsed_ns = time.perf_counter_ns() - start
+    operation = Operation(name, size, code, elapsed_ns)
+    for callback, rate in tuple(_hooks):
+        # the operation was sampled at the highest rate, so each hook is sampled again
+        # relative to it
+        if rate >= _max_sample_rate or random.random() * _max_sample_rate < rate:
+            callback(operation)
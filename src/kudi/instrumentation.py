@@ -0,0 +1,210 @@
+"""Opt-in counters for money construction, currency lookups and formatting.
+
+Instrumentation is off by default and costs nothing while off: `enable()` swaps counting
+wrappers in for `Money.__init__`, `Money._from_minor_units`, `Money._resolve_currency` and
+`Formatter.format`, and `disable()` puts the original methods back.
+
+The wrappers are installed on the classes, so instrumentation is process-global: while it is
+enabled, monies built in every thread are counted. `enable()` and `disable()` are thread-safe
+and nest, the original methods are only put back by the `disable()` matching the first
+`enable()`. Counters are updated under a lock, so counts from concurrent threads are exact.
+
+Example:
+    >>> import kudi
+    >>> from kudi import instrumentation
+    >>> instrumentation.enable()
+    >>> str(Money(150, "usd"))
+    '$1.50'
+    >>> kudi.stats().lookups
+    {'alpha_normalized': 1}
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from functools import wraps
+
+from kudi.currency import CURRENCIES
+from kudi.currency_codes import CurrencyCode
+from kudi.formatter import Formatter
+from kudi.money import Money
+
+_counters: Counter = Counter()
+_originals: dict = {}
+_lock = threading.Lock()
+# guards `_counters`, `Counter` updates are read-modify-writes that threads could interleave
+_counters_lock = threading.Lock()
+# the number of `enable()` calls not yet matched by a `disable()`
+_depth = 0
+
+
+@dataclass(frozen=True)
+class Stats:
+    """A snapshot of the counters collected while instrumentation was enabled.
+
+    Attributes:
+        constructions: the monies constructed by the type of their amount, monies built
+            internally from amounts already in the subunit are counted as `minor_units`.
+        lookups: the currency lookups by path, `enum` for `CurrencyCode` members, `alpha` for
+            exact alpha codes, `alpha_normalized` for codes that had to be normalized first and
+            `numeric` for numeric codes.
+        lookup_ns: the time spent in currency lookups in nanoseconds.
+        formats: the calls to `Formatter.format`.
+        format_cache_hits: the styled formats that reused a cached plan.
+        format_cache_misses: the styled formats that compiled a new plan.
+        format_ns: the time spent formatting in nanoseconds.
+    """
+
+    constructions: dict[str, int]
+    lookups: dict[str, int]
+    lookup_ns: int
+    formats: int
+    format_cache_hits: int
+    format_cache_misses: int
+    format_ns: int
+
+
+def _lookup_path(code) -> str:
+    if isinstance(code, CurrencyCode):
+        return "enum"
+    if isinstance(code, int) or (isinstance(code, str) and code.isnumeric()):
+        return "numeric"
+    if isinstance(code, str) and code in CURRENCIES:
+        return "alpha"
+    return "alpha_normalized"
+
+
+def _count(key: str, n: int = 1):
+    with _counters_lock:
+        _counters[key] += n
+
+
+def _instrument_init(init):
+    @wraps(init)
+    def __init__(self, amount, code):
+        _count(f"construction.{type(amount).__name__}")
+        init(self, amount, code)
+
+    return __init__
+
+
+def _instrument_from_minor_units(from_minor_units):
+    @wraps(from_minor_units)
+    def _from_minor_units(cls, amount, currency):
+        _count("construction.minor_units")
+        return from_minor_units(cls, amount, currency)
+
+    return classmethod(_from_minor_units)
+
+
+def _instrument_resolve_currency(resolve_currency):
+    @wraps(resolve_currency)
+    def _resolve_currency(code):
+        _count(f"lookup.{_lookup_path(code)}")
+        start = time.perf_counter_ns()
+        try:
+            return resolve_currency(code)
+        finally:
+            _count("lookup_ns", time.perf_counter_ns() - start)
+
+    return staticmethod(_resolve_currency)
+
+
+def _instrument_format(format_):
+    @wraps(format_)
+    def format(self, amount, style=None):
+        _count("formats")
+        if style is not None:
+            if style in self._plans:
+                _count("format_cache_hits")
+            else:
+                _count("format_cache_misses")
+        start = time.perf_counter_ns()
+        try:
+            return format_(self, amount, style)
+        finally:
+            _count("format_ns", time.perf_counter_ns() - start)
+
+    return format
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def enable():
+    """Starts counting. Counters keep the values collected before, see `reset`.
+
+    Calls nest, each one must be matched by a call to `disable`.
+    """
+    global _depth
+    with _lock:
+        _depth += 1
+        if _depth > 1:
+            return
+        _originals[Money, "__init__"] = Money.__dict__["__init__"]
+        _originals[Money, "_from_minor_units"] = Money.__dict__["_from_minor_units"]
+        _originals[Money, "_resolve_currency"] = Money.__dict__["_resolve_currency"]
+        _originals[Formatter, "format"] = Formatter.__dict__["format"]
+        Money.__init__ = _instrument_init(Money.__init__)
+        Money._from_minor_units = _instrument_from_minor_units(
+            Money.__dict__["_from_minor_units"].__func__
+        )
+        Money._resolve_currency = _instrument_resolve_currency(
+            Money.__dict__["_resolve_currency"].__func__
+        )
+        Formatter.format = _instrument_format(Formatter.format)
+
+
+def disable():
+    """Stops counting and restores the original methods once every `enable` is matched.
+
+    Calling it while instrumentation is disabled does nothing.
+    """
+    global _depth
+    with _lock:
+        if _depth == 0:
+            return
+        _depth -= 1
+        if _depth > 0:
+            return
+        for (cls, name), original in _originals.items():
+            setattr(cls, name, original)
+        _originals.clear()
+
+
+def reset():
+    with _counters_lock:
+        _counters.clear()
+
+
+def stats(reset: bool = False) -> Stats:
+    """Returns a snapshot of the counters.
+
+    Args:
+        reset: whether to clear the counters after taking the snapshot.
+    """
+    with _counters_lock:
+        counters = dict(_counters)
+        if reset:
+            _counters.clear()
+
+    def prefixed(prefix: str) -> dict[str, int]:
+        return {
+            key[len(prefix) :]: value
+            for key, value in counters.items()
+            if key.startswith(prefix)
+        }
+
+    return Stats(
+        constructions=prefixed("construction."),
+        lookups=prefixed("lookup."),
+        lookup_ns=counters.get("lookup_ns", 0),
+        formats=counters.get("formats", 0),
+        format_cache_hits=counters.get("format_cache_hits", 0),
+        format_cache_misses=counters.get("format_cache_misses", 0),
+        format_ns=counters.get("format_ns", 0),
+    )
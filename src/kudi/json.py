@@ -0,0 +1,112 @@
+"""JSON support for Money.
+
+Monies are encoded as `{"amount": <int>, "currency": "<alpha code>"}` where `amount` is in the
+subunit of the currency. The encoding never goes through the `Formatter` or `Decimal`, so it is
+cheap enough to use on large streams of monies.
+
+Example:
+    >>> import json
+    >>> from kudi import Money
+    >>> from kudi.json import default, object_hook
+    >>> json.dumps({"total": Money(150, "USD")}, default=default)
+    '{"total": {"amount": 150, "currency": "USD"}}'
+    >>> json.loads('{"amount": 150, "currency": "USD"}', object_hook=object_hook)
+    Money(amount=150, code="USD")
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, IO, Iterable, Iterator
+
+from kudi.currency import CURRENCIES
+from kudi.money import Money
+
+AMOUNT_KEY = "amount"
+CURRENCY_KEY = "currency"
+
+
+def default(obj: Any) -> dict:
+    """Encoder hook for `json.dumps(default=...)` and `orjson.dumps(default=...)`.
+
+    Raises:
+        TypeError: when `obj` is not a `Money`, as both encoders expect.
+    """
+    if isinstance(obj, Money):
+        return {AMOUNT_KEY: obj.amount, CURRENCY_KEY: obj.currency.code.value}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def from_dict(obj: dict) -> Money:
+    """Builds a money from its encoded dict form.
+
+    Exact alpha codes take a fast path that skips the currency lookup done by `Money.__init__`;
+    other codes go through `Money` so invalid currencies raise the usual errors.
+
+    Raises:
+        ValueError: when the amount is not an int. Amounts are encoded in the subunit of the
+            currency, so a float such as `1.5` cannot be one.
+    """
+    amount = obj[AMOUNT_KEY]
+    code = obj[CURRENCY_KEY]
+    if type(amount) is not int:
+        raise ValueError(
+            f"`{amount!r}` is not a valid amount, amounts are ints in the subunit"
+        )
+    if isinstance(code, str):
+        currency = CURRENCIES.get(code)
+        if currency is not None:
+            return Money._from_minor_units(amount, currency)
+    return Money(amount, code)
+
+
+def object_hook(obj: dict) -> Money | dict:
+    """Decoder hook for `json.loads(object_hook=...)`.
+
+    Only objects with exactly the `amount` and `currency` keys are turned into monies, every
+    other object is returned as is. For decoders without an object hook, e.g. `orjson.loads`,
+    call `from_dict` on the decoded dicts instead.
+    """
+    if len(obj) == 2 and AMOUNT_KEY in obj and CURRENCY_KEY in obj:
+        return from_dict(obj)
+    return obj
+
+
+def dumps(obj: Any, **kwargs) -> str:
+    """`json.dumps` with monies encoded by `default`."""
+    return json.dumps(obj, default=default, **kwargs)
+
+
+def loads(s: str | bytes, **kwargs) -> Any:
+    """`json.loads` with monies decoded by `object_hook`."""
+    return json.loads(s, object_hook=object_hook, **kwargs)
+
+
+def dump_ndjson(monies: Iterable[Money], fp: IO[str]) -> int:
+    """Writes monies to `fp` as newline delimited JSON, one money per line.
+
+    Lines are built directly from the amount and the alpha code, so no encoder is involved.
+
+    Returns:
+        The number of monies written.
+    """
+    count = 0
+    write = fp.write
+    for money in monies:
+        write(
+            f'{{"{AMOUNT_KEY}": {money.amount}, "{CURRENCY_KEY}": "{money.currency.code.value}"}}\n'
+        )
+        count += 1
+    return count
+
+
+def load_ndjson(fp: Iterable[str | bytes]) -> Iterator[Money]:
+    """Lazily reads monies from newline delimited JSON, skipping blank lines.
+
+    `fp` may be any iterable of lines, such as an open file, so files larger than memory can be
+    streamed.
+    """
+    decode = json.loads
+    for line in fp:
+        if line.strip():
+            yield from_dict(decode(line))
@@ -0,0 +1,237 @@
+"""Memory-mapped ledger files for money columns larger than memory.
+
+A ledger file holds amounts of a single currency. It starts with a fixed 32 byte header::
+
+    offset  size  field
+    0       8     magic, b"KUDILDG\\x00"
+    8       2     format version, little-endian uint16
+    10      3     alpha code of the currency, ASCII
+    13      3     padding
+    16      8     number of amounts, little-endian uint64
+    24      8     padding
+
+followed by the amounts in the subunit of the currency as little-endian int64 values. The file
+is mapped with `mmap`, so reading a ledger never loads more of it than the pages being touched,
+and reductions walk the amounts in chunks to keep memory bounded.
+
+Example:
+    >>> with Ledger.create("payouts.ledger", "NGN") as ledger:
+    ...     ledger.append(MoneyArray([150, -20, 0], "NGN"))
+    >>> with Ledger("payouts.ledger") as ledger:
+    ...     ledger.sum()
+    Money(amount=130, code="NGN")
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import IO, Iterable, Iterator, NamedTuple
+
+from kudi.currency import Currency
+from kudi.currency_codes import CurrencyCode
+from kudi.exceptions import CurrencyMismatchError, InvalidLedgerFileError
+from kudi.money import Money
+from kudi.money_array import MoneyArray
+
+MAGIC = b"KUDILDG\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sH3s3xQ8x")
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+_COUNT_OFFSET = 16
+_IS_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class SignCounts(NamedTuple):
+    negative: int
+    zero: int
+    positive: int
+
+
+def _to_little_endian(amounts: array) -> bytes:
+    if not _IS_LITTLE_ENDIAN:
+        amounts.byteswap()
+    return amounts.tobytes()
+
+
+class Ledger:
+    """Ledger is a memory-mapped file of amounts in a single currency."""
+
+    def __init__(self, path: str | os.PathLike, writable: bool = False):
+        """Opens an existing ledger file.
+
+        Args:
+            path: the path of the ledger file.
+            writable: whether amounts can be appended to the ledger.
+        Raises:
+            InvalidLedgerFileError: when the file is not a ledger or is truncated.
+        """
+        self._path = path
+        self._writable = writable
+        self._file: IO[bytes] = open(path, "r+b" if writable else "rb")
+        self._mmap: mmap.mmap | None = None
+        try:
+            header = self._file.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise InvalidLedgerFileError(f"`{path}` is too small to be a ledger")
+            magic, version, code, count = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise InvalidLedgerFileError(f"`{path}` is not a ledger")
+            if version != VERSION:
+                raise InvalidLedgerFileError(
+                    f"`{path}` uses unsupported ledger format version {version}"
+                )
+            self._currency: Currency = Money._resolve_currency(code.decode("ascii"))
+            self._count: int = count
+            if os.fstat(self._file.fileno()).st_size < HEADER.size + count * 8:
+                raise InvalidLedgerFileError(f"`{path}` is truncated")
+            self._map()
+        except BaseException:
+            self._file.close()
+            raise
+
+    @classmethod
+    def create(cls, path: str | os.PathLike, code: int | str | CurrencyCode) -> Ledger:
+        """Creates an empty ledger file, replacing any existing file, and opens it for
+        appending."""
+        currency = Money._resolve_currency(code)
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, currency.code.value.encode("ascii"), 0))
+        return cls(path, writable=True)
+
+    def _map(self):
+        old = self._mmap
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if old is not None:
+            self._release(old)
+
+    @staticmethod
+    def _release(mapping: mmap.mmap):
+        try:
+            mapping.close()
+        except BufferError:
+            # money arrays still view the mapping, it is unmapped once they are gone
+            pass
+
+    @property
+    def currency(self) -> Currency:
+        """Returns the currency of the amounts in the ledger"""
+        return self._currency
+
+    def __len__(self) -> int:
+        return self._count
+
+    def money_array(self, start: int = 0, stop: int | None = None) -> MoneyArray:
+        """Returns the amounts between `start` and `stop` as a MoneyArray.
+
+        On little-endian hosts the array is a view of the mapped file, nothing is copied.
+        """
+        start, stop, _ = slice(start, stop).indices(self._count)
+        stop = max(start, stop)
+        view = memoryview(self._mmap)[
+            HEADER.size + start * 8 : HEADER.size + stop * 8
+        ].cast("q")
+        if not _IS_LITTLE_ENDIAN:
+            amounts = array("q", view)
+            amounts.byteswap()
+            view = memoryview(amounts)
+        return MoneyArray._from_view(view, self._currency)
+
+    def chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[MoneyArray]:
+        """Yields the amounts of the ledger as consecutive money arrays of at most `chunk_size`
+        amounts."""
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be greater than 0")
+        for start in range(0, self._count, chunk_size):
+            yield self.money_array(start, start + chunk_size)
+
+    def append(self, amounts: MoneyArray | Money | Iterable[int]) -> int:
+        """Appends amounts to the end of the ledger.
+
+        Args:
+            amounts: a money array or money in the currency of the ledger, or ints in the
+                subunit of the currency.
+        Returns:
+            The number of amounts appended.
+        Raises:
+            CurrencyMismatchError: when the amounts are in a different currency.
+        """
+        if not self._writable:
+            raise InvalidLedgerFileError(f"`{self._path}` was not opened for appending")
+        if isinstance(amounts, (Money, MoneyArray)):
+            if (
+                amounts.currency is not self._currency
+                and amounts.currency != self._currency
+            ):
+                raise CurrencyMismatchError(
+                    "operations on monies with different currencies is not allowed"
+                )
+            if isinstance(amounts, Money):
+                amounts = [amounts.amount]
+            else:
+                amounts = amounts.amounts
+        if isinstance(amounts, memoryview) and _IS_LITTLE_ENDIAN:
+            data = amounts.tobytes()
+        else:
+            data = _to_little_endian(array("q", amounts))
+        n = len(data) // 8
+        if n == 0:
+            return 0
+        self._file.seek(HEADER.size + self._count * 8)
+        self._file.write(data)
+        self._count += n
+        self._file.seek(_COUNT_OFFSET)
+        self._file.write(struct.pack("<Q", self._count))
+        self._file.flush()
+        self._map()
+        return n
+
+    def sum(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Money:
+        """Returns the exact total of the amounts in the ledger"""
+        return Money._from_minor_units(
+            sum(sum(chunk.amounts) for chunk in self.chunks(chunk_size)), self._currency
+        )
+
+    def min(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Money:
+        if not self._count:
+            raise ValueError("min() of an empty Ledger")
+        return Money._from_minor_units(
+            min(min(chunk.amounts) for chunk in self.chunks(chunk_size)), self._currency
+        )
+
+    def max(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Money:
+        if not self._count:
+            raise ValueError("max() of an empty Ledger")
+        return Money._from_minor_units(
+            max(max(chunk.amounts) for chunk in self.chunks(chunk_size)), self._currency
+        )
+
+    def count_by_sign(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> SignCounts:
+        """Counts the negative, zero and positive amounts in the ledger"""
+        negative = zero = 0
+        is_negative = (0).__gt__
+        is_zero = (0).__eq__
+        for chunk in self.chunks(chunk_size):
+            amounts = chunk.amounts
+            negative += sum(map(is_negative, amounts))
+            zero += sum(map(is_zero, amounts))
+        return SignCounts(negative, zero, self._count - negative - zero)
+
+    def close(self):
+        if self._mmap is not None:
+            self._release(self._mmap)
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> Ledger:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f'Ledger(path="{self._path}", code="{self._currency.code}", count={self._count})'
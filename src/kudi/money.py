@@ -1,18 +1,64 @@
 from __future__ import annotations
 
-import math
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal, InvalidOperation, ROUND_FLOOR, ROUND_HALF_UP
+from fractions import Fraction
+from functools import lru_cache
+from typing import TYPE_CHECKING, Mapping
 
+from kudi import hooks
 from kudi.calculator import Calculator
 from kudi.currencies_data import _get_currency_code_from_numeric_code
 from kudi.currency_codes import CurrencyCode
-
-from kudi.currency import _get_currency, Currency
+from kudi.denominations import breakdown, breakdown_available
+
+from kudi.currency import (
+    CURRENCIES,
+    _get_currency,
+    _get_currency_by_id,
+    _infer_currency,
+    Currency,
+)
 from kudi.exceptions import (
     InvalidCurrencyAlphaCodeError,
     InvalidCurrencyNumericCodeError,
     CurrencyMismatchError,
 )
+from kudi.formatter import FormatStyle
+
+if TYPE_CHECKING:
+    from kudi.precise import PreciseMoney
+
+
+@lru_cache(maxsize=256)
+def _decimal_ratio(rate: Decimal) -> tuple[int, int]:
+    # the same few rates tend to be applied to many monies
+    try:
+        return rate.as_integer_ratio()
+    except (ValueError, OverflowError):
+        raise ValueError(f"`{rate}` is not a valid rate")
+
+
+@lru_cache(maxsize=256)
+def _denomination_monies(code: CurrencyCode, denominations: tuple[int, ...]) -> tuple:
+    # monies are immutable, so breakdowns share the monies of the notes and coins
+    currency = _get_currency(code)
+    return tuple(Money._from_minor_units(d, currency) for d in denominations)
+
+
+def minor_units(value: int | Money, currency: Currency) -> int:
+    """Returns an amount given either as an int in the subunit of a currency or as a money in
+    that currency, as an int in the subunit.
+
+    Raises:
+        CurrencyMismatchError: when `value` is a money in another currency.
+    """
+    if isinstance(value, Money):
+        if value._currency is not currency and value._currency != currency:
+            raise CurrencyMismatchError(
+                "operations on monies with different currencies is not allowed"
+            )
+        return value._amount
+    return value
 
 
 class Money:
@@ -33,9 +79,67 @@ class Money:
             code: the currency code of the monetary value. a 3-digit iso code like 'USD', 'EUR', 'GBP',
                 e.t.c or the 3-digit numeric code like 840, 978. or any variant of the CurrencyCode is valid.
         """
-        self._currency: Currency = _get_currency(self._normalize_code(code))
+        self._currency: Currency = self._resolve_currency(code)
         self._amount: int = self._normalize_amount(amount, self._currency)
 
+    @classmethod
+    def _from_minor_units(cls, amount: int, currency: Currency) -> Money:
+        """Builds a money from an amount already in the subunit and a resolved currency,
+        skipping the normalization done by `__init__`."""
+        money = cls.__new__(cls)
+        money._currency = currency
+        money._amount = amount
+        return money
+
+    @classmethod
+    def from_currency_id(
+        cls, amount: str | int | float | Decimal, currency_id: int
+    ) -> Money:
+        """Builds a money from the id of its currency instead of its code, see `Currency.id`.
+
+        Args:
+            amount: the value of the money, see `Money`.
+            currency_id: the id of the currency.
+        Raises:
+            InvalidCurrencyCodeError: when there is no currency with the id.
+        """
+        currency = _get_currency_by_id(currency_id)
+        money = cls.__new__(cls)
+        money._currency = currency
+        money._amount = (
+            amount if type(amount) is int else money._normalize_amount(amount, currency)
+        )
+        return money
+
+    @classmethod
+    def parse(
+        cls,
+        text: str,
+        code: int | str | CurrencyCode | None = None,
+        style: FormatStyle | None = None,
+    ) -> Money:
+        """Parses a formatted money string such as `₦1,234,567.89` or `-$12.00`.
+
+        Args:
+            text: the formatted amount. The symbol or alpha code may appear on either side of
+                the digits and negative amounts may use a sign or parentheses.
+            code: the currency of the amount. When omitted, it is inferred from the symbol or
+                alpha code in the text.
+            style: the separator, delimiter and grouping of the text when they differ from
+                the currency's own, e.g. `DECIMAL_COMMA_STYLE` for `1.234,56 €` or
+                `INDIAN_STYLE` for `₹12,34,567.89`.
+        Raises:
+            InvalidCurrencyCodeError: when `code` is omitted and the symbol is missing or
+                shared by several currencies, e.g. `$`.
+            ValueError: when the text is not a formatted amount of the currency, including
+                when its digits are grouped differently, e.g. `1,50` for USD.
+        """
+        if code is None:
+            currency = _infer_currency(text)
+        else:
+            currency = cls._resolve_currency(code)
+        return cls._from_minor_units(currency.parser.parse(text, style), currency)
+
     @property
     def amount(self) -> int:
         """Returns the money value in its subunit"""
@@ -46,9 +150,24 @@ class Money:
         """Returns the currency used by the money"""
         return self._currency
 
+    @property
+    def currency_id(self) -> int:
+        """Returns the id of the currency, see `Currency.id`"""
+        return self._currency.id
+
     def is_same_currency_with(self, other: Money) -> bool:
         """Checks if the other money provided is of the same currency with this one."""
-        return self.currency == other.currency
+        # currencies are shared, so the field by field comparison is rarely needed
+        return self._currency is other._currency or self._currency == other._currency
+
+    def sort_key(self) -> tuple[str, int]:
+        """Returns a key that orders monies by currency code then amount.
+
+        Sorting with `key=Money.sort_key` compares tuples of plain values instead of calling
+        `Money.__lt__`, and monies of different currencies are grouped rather than raising
+        `CurrencyMismatchError`. See `kudi.sorted_money`.
+        """
+        return self._currency.code.value, self._amount
 
     @property
     def is_zero(self) -> bool:
@@ -80,6 +199,7 @@ class Money:
         """
         if n <= 0:
             raise ValueError("n must be greater than 0")
+        start = hooks._start() if hooks._hooks else 0
         a = Calculator.divide(self.amount, n)
         ms = []
         i = 0
@@ -87,15 +207,9 @@ class Money:
             ms.append(Money(a, self.currency.code))
             i += 1
 
-        # Python % operation on negative values always results in a positive value,
-        # so for example, -101 % 4 will result in 3 instead of -1 like in other
-        # languages like GO, JS, Java e.t.c. to account for this, we solve for
-        # it differently when amount is negative
-        if self.is_negative:
-            remainder = self.amount - int(self.amount / n) * n
-        else:
-            remainder = Calculator.modulus(self.amount, n)
-        leftover = Calculator.absolute(remainder)
+        # `a` is truncated towards zero, so the remainder has the sign of the amount,
+        # unlike Python's % whose result takes the sign of n.
+        leftover = Calculator.absolute(self.amount - a * n)
 
         # Add leftovers to the first parties.
         v = 1
@@ -106,12 +220,16 @@ class Money:
             ms[p] = Money(Calculator.add(ms[p].amount, v), ms[p].currency.code)
             leftover -= 1
             p += 1
+        if start:
+            hooks._emit("split", n, self.currency.code.value, start)
         return ms
 
     def allocate(self, *rs: int) -> list[Money]:
         """Split money by the given ratios without losing pennies.
 
-        Leftover pennies
+        Leftover pennies are distributed round-robin amongst the parties with a non-zero
+        ratio, starting from the first. To allocate many monies with the same ratios, see
+        `kudi.AllocationPlan`.
 
         Args:
             rs: the rations you want to allocate the mo
@@ -125,6 +243,7 @@ class Money:
             if r < 0:
                 raise ValueError("negative ratios not allowed, ratios must be positive")
         sum_ = sum(rs)
+        start = hooks._start() if hooks._hooks else 0
 
         total = 0
         ms = []
@@ -135,31 +254,196 @@ class Money:
 
         # if the sum of all ratios is zero, then we just return zeros and don't do anything
         # with the leftover
-        if sum_ == 0:
-            return ms
+        if sum_ != 0:
+            # Calculate leftover value and divide to first parties, skipping the ones with
+            # a zero ratio.
+            lo = self.amount - total
+            sub = 1
+            if lo < 0:
+                sub = -sub
+
+            parties = [i for i, r in enumerate(rs) if r != 0]
+            p = 0
+            while lo != 0:
+                i = parties[p % len(parties)]
+                ms[i] = Money(Calculator.add(ms[i].amount, sub), self.currency.code)
+                lo -= sub
+                p += 1
+        if start:
+            hooks._emit("allocate", len(rs), self.currency.code.value, start)
+        return ms
 
-        # Calculate leftover value and divide to first parties.
-        lo = self.amount - total
-        sub = 1
-        if lo < 0:
-            sub = -sub
+    def multiply(
+        self, by: int | Decimal | Fraction, rounding: str = ROUND_HALF_UP
+    ) -> Money:
+        """Multiplies the money by a rate such as `Decimal("0.075")` or `Fraction(1, 3)`.
 
-        p = 0
-        while lo != 0:
-            ms[p] = Money(Calculator.add(ms[p].amount, sub), self.currency.code)
-            lo -= sub
-        return ms
+        The product is computed exactly with the numerator and denominator of the rate and
+        rounded once to the subunit of the currency.
+
+        Args:
+            by: the rate to multiply by.
+            rounding: one of the rounding modes of the `decimal` module, e.g. `ROUND_HALF_EVEN`.
+        """
+        numerator, denominator = self._as_ratio(by)
+        return Money._from_minor_units(
+            Calculator.divide_rounded(self._amount * numerator, denominator, rounding),
+            self._currency,
+        )
+
+    def divide(
+        self, by: int | Decimal | Fraction, rounding: str = ROUND_HALF_UP
+    ) -> Money:
+        """Divides the money by a number, rounding the quotient to the subunit of the currency.
+
+        The quotient is computed exactly with ints, so it is correct for amounts of any size.
+        `money / by` rounds half up and `money // by` rounds down like `ROUND_FLOOR`.
+
+        Args:
+            by: the number to divide by.
+            rounding: one of the rounding modes of the `decimal` module, e.g. `ROUND_HALF_EVEN`.
+        Raises:
+            ZeroDivisionError: when `by` is zero.
+        """
+        numerator, denominator = self._as_ratio(by)
+        if numerator == 0:
+            raise ZeroDivisionError("division of money by zero")
+        return Money._from_minor_units(
+            Calculator.divide_rounded(self._amount * denominator, numerator, rounding),
+            self._currency,
+        )
+
+    def basis_points(
+        self, bps: int | Decimal | Fraction, rounding: str = ROUND_HALF_UP
+    ) -> Money:
+        """Returns `bps` hundredths of a percent of the money, e.g. `35` for 0.35%.
+
+        Args:
+            bps: the number of basis points.
+            rounding: one of the rounding modes of the `decimal` module, e.g. `ROUND_HALF_EVEN`.
+        """
+        numerator, denominator = self._as_ratio(bps)
+        return Money._from_minor_units(
+            Calculator.divide_rounded(
+                self._amount * numerator, denominator * 10_000, rounding
+            ),
+            self._currency,
+        )
+
+    def _increment(self, increment: int | Money | None) -> int:
+        if increment is None:
+            return self._currency.cash_increment
+        if isinstance(increment, Money):
+            self._assert_is_same_currency_with(increment)
+            increment = increment._amount
+        if increment <= 0:
+            raise ValueError("the increment to round to must be positive")
+        return increment
+
+    def with_scale(self, extra_digits: int) -> PreciseMoney:
+        """Converts the money to a `PreciseMoney` carrying extra digits below the subunit, for
+        chained calculations that should only be rounded once.
+
+        Args:
+            extra_digits: the number of digits kept below the subunit of the currency.
+        """
+        from kudi.precise import PreciseMoney
+
+        if not isinstance(extra_digits, int) or extra_digits < 0:
+            raise ValueError("the scale must be a non-negative int")
+        return PreciseMoney._from_value(
+            self._amount * 10**extra_digits, extra_digits, self._currency
+        )
+
+    def round_to(
+        self, increment: int | Money | None = None, rounding: str = ROUND_HALF_UP
+    ) -> Money:
+        """Rounds the money to a multiple of an increment, e.g. to the smallest coin in cash.
+
+        Args:
+            increment: the increment in the subunit of the currency or as a money, e.g. `5`
+                for CHF 0.05. Defaults to the currency's `cash_increment`.
+            rounding: one of the rounding modes of the `decimal` module, e.g. `ROUND_HALF_EVEN`.
+        """
+        return Money._from_minor_units(
+            Calculator.round_to_increment(
+                self._amount, self._increment(increment), rounding
+            ),
+            self._currency,
+        )
+
+    def breakdown(
+        self, available: Mapping[int, int] | None = None
+    ) -> list[tuple[Money, int]]:
+        """Breaks the money into the fewest notes and coins.
+
+        Args:
+            available: the number of notes or coins available by their value in the subunit,
+                e.g. the inventory of an ATM. Defaults to unlimited notes and coins of every
+                denomination of the currency, see `Currency.denominations`.
+        Returns:
+            The notes or coins and how many of each, from the largest.
+        Raises:
+            ValueError: when the money is negative or cannot be made up of the denominations.
+        """
+        if available is None:
+            denominations = self._currency.denominations
+            if not denominations:
+                raise ValueError(
+                    f"the denominations of {self._currency.code} are not known, please pass `available`"
+                )
+            counts = breakdown(denominations, self._amount)
+        else:
+            denominations = tuple(sorted(available, reverse=True))
+            counts = breakdown_available(
+                denominations, tuple(available[d] for d in denominations), self._amount
+            )
+        if counts is None:
+            raise ValueError(f"{self} cannot be made up of the denominations")
+        monies = _denomination_monies(self._currency.code, denominations)
+        return [(money, count) for money, count in zip(monies, counts) if count]
+
+    @staticmethod
+    def _as_ratio(by: int | Decimal | Fraction) -> tuple[int, int]:
+        if isinstance(by, int):
+            return by, 1
+        if isinstance(by, Fraction):
+            return by.numerator, by.denominator
+        if isinstance(by, Decimal):
+            return _decimal_ratio(by)
+        raise TypeError(
+            f"`{type(by)}` is not a valid rate, use `int`, `Decimal` or `Fraction`"
+        )
 
     def as_major_units(self):
         """Converts the money value from its subunit value that it's stored in to the major units"""
         return self.currency.formatter.to_major_units(self.amount)
 
+    def format(self, style: FormatStyle | None = None) -> str:
+        """Formats the money using the currency's template.
+
+        Args:
+            style: locale conventions such as `INDIAN_STYLE` or `ACCOUNTING_STYLE` applied
+                on top of the currency's template, see `FormatStyle`.
+        """
+        return self.currency.formatter.format(self.amount, style)
+
     def negative(self):
         """Not to be confused with the unary negative operation"""
         amount = -Calculator.absolute(self.amount)
         return Money(amount=amount, code=self.currency.code)
 
-    def _normalize_code(self, code: int | str | CurrencyCode) -> CurrencyCode:
+    @staticmethod
+    def _resolve_currency(code: int | str | CurrencyCode) -> Currency:
+        # `CurrencyCode` members hash like their values, so exact alpha codes
+        # resolve with a single dict lookup before falling back to normalization.
+        currency = CURRENCIES.get(code) if isinstance(code, str) else None
+        if currency is None:
+            currency = _get_currency(Money._normalize_code(code))
+        return currency
+
+    @staticmethod
+    def _normalize_code(code: int | str | CurrencyCode) -> CurrencyCode:
         if isinstance(code, CurrencyCode):
             return code
         if isinstance(code, int):
@@ -191,29 +475,24 @@ class Money:
         if isinstance(amount, int):
             return amount
         if isinstance(amount, str):
-            if not amount.isnumeric():
+            try:
+                amount = Decimal(amount)
+            except InvalidOperation:
+                raise ValueError(f"`{amount}` is not a valid amount")
+            if not amount.is_finite():
                 raise ValueError(f"`{amount}` is not a valid amount")
         if isinstance(amount, float):
             amount = Decimal(str(amount))
         if isinstance(amount, Decimal):
-            amount = amount.quantize(
-                Decimal("0." + "0" * currency.minor_unit),
-                rounding=ROUND_HALF_UP,
-            )
-            decimal_tuple = amount.as_tuple()
-            major_digits = decimal_tuple.digits[0 : decimal_tuple.exponent]
-            minor_digits = decimal_tuple.digits[decimal_tuple.exponent :]
-            major_digits_equivalent = 0
-            minor_digits_equivalent = 0
-            if major_digits:
-                major_digits_equivalent = int(
-                    "".join([str(digit) for digit in major_digits])
-                ) * math.pow(10, currency.minor_unit)
-            if minor_digits:
-                minor_digits_equivalent = int(
-                    "".join([str(digit) for digit in minor_digits])
+            try:
+                return int(
+                    amount.scaleb(currency.minor_unit).quantize(
+                        Decimal(1), rounding=ROUND_HALF_UP
+                    )
                 )
-            return major_digits_equivalent + minor_digits_equivalent
+            except InvalidOperation:
+                # more digits than the decimal context's precision, e.g. `1e30`
+                raise ValueError(f"`{amount}` is not a valid amount")
         raise ValueError(f"`{amount}` is not a valid amount")
 
     def _assert_is_same_currency_with(self, other: "Money"):
@@ -224,32 +503,35 @@ class Money:
                 "operations on monies with different currencies is not allowed"
             )
 
-    def _compare(self, other: Money) -> int:
-        if self.amount > other.amount:
-            return 1
-        if self.amount < other.amount:
-            return -1
-        return 0
-
     def __eq__(self, other: Money) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
         self._assert_is_same_currency_with(other)
-        return self._compare(other) == 0
+        return self._amount == other._amount
 
     def __gt__(self, other: Money) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
         self._assert_is_same_currency_with(other)
-        return self._compare(other) == 1
+        return self._amount > other._amount
 
     def __ge__(self, other: Money) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
         self._assert_is_same_currency_with(other)
-        return self._compare(other) >= 0
+        return self._amount >= other._amount
 
     def __lt__(self, other: Money) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
         self._assert_is_same_currency_with(other)
-        return self._compare(other) == -1
+        return self._amount < other._amount
 
     def __le__(self, other: Money) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
         self._assert_is_same_currency_with(other)
-        return self._compare(other) <= 0
+        return self._amount <= other._amount
 
     def __abs__(self):
         return Money(Calculator.absolute(self.amount), self.currency.code)
@@ -258,22 +540,73 @@ class Money:
         return Money(-self.amount, self.currency.code)
 
     def __add__(self, other: Money) -> Money:
+        if not isinstance(other, Money):
+            return NotImplemented
         self._assert_is_same_currency_with(other)
         return Money(Calculator.add(self.amount, other.amount), self.currency.code)
 
     def __sub__(self, other: Money):
+        if not isinstance(other, Money):
+            return NotImplemented
         self._assert_is_same_currency_with(other)
         return Money(Calculator.subtract(self.amount, other.amount), self.currency.code)
 
-    def __mul__(self, by: int | Money) -> Money:
+    def __mul__(self, by: int | Decimal | Fraction | Money) -> Money:
         if isinstance(by, int):
             return Money(Calculator.multiply(self.amount, by), self.currency.code)
+        if isinstance(by, (Decimal, Fraction)):
+            return self.multiply(by)
         if isinstance(by, Money):
             return Money(
                 Calculator.multiply(self.amount, by.amount), self.currency.code
             )
         raise TypeError(f"multiplication not supported between Money and {type(by)}")
 
+    def __rmul__(self, by: int | Decimal | Fraction) -> Money:
+        if isinstance(by, (int, Decimal, Fraction)):
+            return self * by
+        return NotImplemented
+
+    def __truediv__(self, by: int | Decimal | Fraction) -> Money:
+        if isinstance(by, (int, Decimal, Fraction)):
+            return self.divide(by)
+        return NotImplemented
+
+    def __floordiv__(self, by: int | Decimal | Fraction) -> Money:
+        if isinstance(by, (int, Decimal, Fraction)):
+            return self.divide(by, ROUND_FLOOR)
+        return NotImplemented
+
+    def __mod__(self, by: int | Decimal | Fraction) -> Money:
+        result = self.__divmod__(by)
+        return result if result is NotImplemented else result[1]
+
+    def __divmod__(self, by: int | Decimal | Fraction) -> tuple[Money, Money]:
+        """Returns `self // by` and the exact remainder `self - (self // by) * by`.
+
+        Raises:
+            ZeroDivisionError: when `by` is zero.
+            ValueError: when the remainder is not a whole number of the subunit, e.g. for
+                `divmod(Money(100, "USD"), Decimal("0.3"))`, whose remainder is 0.1 cent.
+        """
+        if not isinstance(by, (int, Decimal, Fraction)):
+            return NotImplemented
+        numerator, denominator = self._as_ratio(by)
+        if numerator == 0:
+            raise ZeroDivisionError("division of money by zero")
+        # with by = numerator / denominator, amount = quotient * by + remainder
+        scaled = self._amount * denominator
+        quotient = scaled // numerator
+        remainder, fraction = divmod(scaled - quotient * numerator, denominator)
+        if fraction:
+            raise ValueError(
+                f"the remainder of {self} divided by {by} is not a whole number of the subunit"
+            )
+        return (
+            Money._from_minor_units(quotient, self._currency),
+            Money._from_minor_units(remainder, self._currency),
+        )
+
     def __round__(self, n=None):
         return Money(
             Calculator.round(self.amount, self.currency.minor_unit), self.currency.code
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import operator
+import struct
+from array import array
+from decimal import ROUND_HALF_UP
+from typing import Iterable, Iterator, overload
+
+from kudi.calculator import Calculator
+from kudi.currency import Currency
+from kudi.currency_codes import CurrencyCode
+from kudi.exceptions import CurrencyMismatchError
+from kudi.money import Money
+
+
+_RAW_BYTES = ("B", "b", "c")
+_SIGNED_INT64 = ("q", "l", "n")
+_INTEGER_FORMATS = "bBhHiIlLqQnN"
+
+
+def _as_int64_view(amounts) -> memoryview:
+    """Returns a zero-copy int64 view over objects exposing the buffer protocol, copying any
+    other iterable of ints, or strided buffers, into a new int64 buffer.
+
+    Buffers of native 8-byte signed ints and raw byte buffers, e.g. `bytes` or `mmap`, are
+    viewed as they are. Buffers of other integer types are converted by value.
+    """
+    try:
+        view = memoryview(amounts)
+    except TypeError:
+        return memoryview(array("q", amounts))
+    kind = view.format.lstrip("@")
+    if kind in _RAW_BYTES or (kind in _SIGNED_INT64 and view.itemsize == 8):
+        if not view.contiguous:
+            return _contiguous(view)
+        if kind == "q" and view.ndim == 1:
+            return view
+        return view.cast("B").cast("q")
+    if kind[-1:] not in _INTEGER_FORMATS:
+        raise TypeError(
+            f"cannot view a buffer of `{view.format}` items as amounts, use integers"
+        )
+    # other integer sizes and byte orders are copied by value, whatever their layout
+    values = struct.iter_unpack(view.format, view.tobytes())
+    return memoryview(array("q", [value for (value,) in values]))
+
+
+def _contiguous(view: memoryview) -> memoryview:
+    # `tobytes` copies the items in logical order, whatever the strides
+    return memoryview(array("q", view.tobytes()))
+
+
+class MoneyArray:
+    """MoneyArray is a vector of monetary values sharing a single currency.
+
+    The amounts are stored in the subunit of the currency as contiguous native int64 values,
+    so they can be shared without copying with anything that speaks the buffer protocol,
+    e.g. `array.array`, `mmap`, Arrow buffers or numpy arrays. Like `Money`, a MoneyArray is
+    immutable; operations return new arrays.
+    """
+
+    __slots__ = ("_amounts", "_currency")
+
+    def __init__(self, amounts, code: int | str | CurrencyCode):
+        """MoneyArray is a vector of monetary values sharing a single currency.
+
+        Args:
+            amounts: the values of the monies in the subunit of the currency. Objects exposing
+                the buffer protocol, such as `array.array("q")`, `bytes`, `mmap` or numpy
+                int64 arrays are viewed without copying. Buffers of other integer types and
+                any other iterable of ints are copied into a new int64 buffer.
+            code: the currency code of the monetary values, see `Money`.
+        Raises:
+            TypeError: when `amounts` is a buffer of floats or other non-integer items.
+        """
+        self._currency: Currency = Money._resolve_currency(code)
+        self._amounts: memoryview = _as_int64_view(amounts)
+
+    @classmethod
+    def _from_view(cls, amounts: memoryview, currency: Currency) -> MoneyArray:
+        money_array = cls.__new__(cls)
+        money_array._amounts = amounts
+        money_array._currency = currency
+        return money_array
+
+    @classmethod
+    def from_monies(
+        cls, monies: Iterable[Money], code: int | str | CurrencyCode | None = None
+    ) -> MoneyArray:
+        """Packs monies of a single currency into a MoneyArray.
+
+        Args:
+            monies: the monies to pack.
+            code: the currency of the array, required when `monies` may be empty. Defaults
+                to the currency of the first money.
+        Raises:
+            CurrencyMismatchError: when the monies are not all in the same currency.
+        """
+        currency = None if code is None else Money._resolve_currency(code)
+        amounts = array("q")
+        append = amounts.append
+        for money in monies:
+            if currency is None:
+                currency = money.currency
+            elif money.currency is not currency and money.currency != currency:
+                raise CurrencyMismatchError(
+                    "operations on monies with different currencies is not allowed"
+                )
+            append(money.amount)
+        if currency is None:
+            raise ValueError("`code` is required to pack an empty sequence of monies")
+        return cls._from_view(memoryview(amounts), currency)
+
+    @property
+    def amounts(self) -> memoryview:
+        """Returns a read-only int64 view of the values in their subunit"""
+        return self._amounts.toreadonly()
+
+    @property
+    def currency(self) -> Currency:
+        """Returns the currency shared by the values"""
+        return self._currency
+
+    @property
+    def currency_id(self) -> int:
+        """Returns the id of the currency, see `Currency.id`"""
+        return self._currency.id
+
+    def tolist(self) -> list[int]:
+        """Returns the values in their subunit as a list of ints"""
+        return self._amounts.tolist()
+
+    def to_monies(self) -> list[Money]:
+        """Unpacks the array into a list of `Money`"""
+        currency = self._currency
+        from_minor_units = Money._from_minor_units
+        return [from_minor_units(amount, currency) for amount in self._amounts]
+
+    def sum(self) -> Money:
+        """Returns the exact total of the values, it never overflows"""
+        return Money._from_minor_units(sum(self._amounts), self._currency)
+
+    def min(self) -> Money:
+        if not len(self._amounts):
+            raise ValueError("min() of an empty MoneyArray")
+        return Money._from_minor_units(min(self._amounts), self._currency)
+
+    def max(self) -> Money:
+        if not len(self._amounts):
+            raise ValueError("max() of an empty MoneyArray")
+        return Money._from_minor_units(max(self._amounts), self._currency)
+
+    def _assert_is_same_currency_with(self, other: MoneyArray | Money):
+        if other.currency is not self._currency and other.currency != self._currency:
+            raise CurrencyMismatchError(
+                "operations on monies with different currencies is not allowed"
+            )
+
+    def _binary_op(self, other: MoneyArray | Money, op) -> MoneyArray:
+        self._assert_is_same_currency_with(other)
+        if isinstance(other, Money):
+            amount = other.amount
+            result = array("q", [op(a, amount) for a in self._amounts])
+        else:
+            if len(other) != len(self):
+                raise ValueError("MoneyArray operands must have the same length")
+            result = array("q", map(op, self._amounts, other._amounts))
+        return MoneyArray._from_view(memoryview(result), self._currency)
+
+    def __len__(self) -> int:
+        return len(self._amounts)
+
+    @overload
+    def __getitem__(self, index: int) -> Money: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> MoneyArray: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            amounts = self._amounts[index]
+            if not amounts.contiguous:
+                # stepped slices are copied, so the amounts stay contiguous for consumers of
+                # the buffer such as Arrow, numpy or ledger files
+                amounts = _contiguous(amounts)
+            return MoneyArray._from_view(amounts, self._currency)
+        return Money._from_minor_units(self._amounts[index], self._currency)
+
+    def __iter__(self) -> Iterator[Money]:
+        currency = self._currency
+        from_minor_units = Money._from_minor_units
+        for amount in self._amounts:
+            yield from_minor_units(amount, currency)
+
+    def __neg__(self) -> MoneyArray:
+        result = array("q", [-a for a in self._amounts])
+        return MoneyArray._from_view(memoryview(result), self._currency)
+
+    def __add__(self, other: MoneyArray | Money) -> MoneyArray:
+        if not isinstance(other, (MoneyArray, Money)):
+            return NotImplemented
+        return self._binary_op(other, operator.add)
+
+    def __sub__(self, other: MoneyArray | Money) -> MoneyArray:
+        if not isinstance(other, (MoneyArray, Money)):
+            return NotImplemented
+        return self._binary_op(other, operator.sub)
+
+    def __mul__(self, by: int) -> MoneyArray:
+        if not isinstance(by, int):
+            raise TypeError(
+                f"multiplication not supported between MoneyArray and {type(by)}"
+            )
+        result = array("q", [a * by for a in self._amounts])
+        return MoneyArray._from_view(memoryview(result), self._currency)
+
+    def round_to(
+        self, increment: int | Money | None = None, rounding: str = ROUND_HALF_UP
+    ) -> MoneyArray:
+        """Rounds every money to a multiple of an increment, see `Money.round_to`."""
+        if increment is None:
+            increment = self._currency.cash_increment
+        elif isinstance(increment, Money):
+            self._assert_is_same_currency_with(increment)
+            increment = increment.amount
+        if increment <= 0:
+            raise ValueError("the increment to round to must be positive")
+        round_ = Calculator.increment_rounder(increment, rounding)
+        result = array("q", map(round_, self._amounts))
+        return MoneyArray._from_view(memoryview(result), self._currency)
+
+    def __repr__(self):
+        return f'MoneyArray(amounts={self.tolist()}, code="{self._currency.code}")'
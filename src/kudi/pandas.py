@@ -0,0 +1,468 @@
+"""pandas support for Money columns.
+
+`MoneyDtype` is a pandas extension dtype parameterized by currency, e.g. `money[USD]`. Columns
+of this dtype are backed by an int64 array of amounts in the subunit of the currency plus a
+mask of missing values, so arithmetic, reductions and group-by aggregations run on the int64
+values instead of looping over `Money` objects.
+
+This module requires pandas, which can be installed with the `pandas` extra, e.g.
+`uv add kudi[pandas]`.
+
+Example:
+    >>> import pandas as pd
+    >>> import kudi.pandas
+    >>> s = pd.Series([Money(150, "USD"), Money(250, "USD")], dtype="money[USD]")
+    >>> s.sum()
+    Money(amount=400, code="USD")
+"""
+
+from __future__ import annotations
+
+import numbers
+import re
+
+from kudi.currency import Currency
+from kudi.currency_codes import CurrencyCode
+from kudi.exceptions import CurrencyMismatchError
+from kudi.money import Money
+from kudi.money_array import MoneyArray
+
+try:
+    import numpy as np
+    import pandas as pd
+    from pandas.api.extensions import (
+        ExtensionArray,
+        ExtensionDtype,
+        register_extension_dtype,
+        take,
+    )
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "kudi.pandas requires pandas, install it with `uv add kudi[pandas]`"
+    ) from e
+
+
+def _raise_currency_mismatch():
+    raise CurrencyMismatchError(
+        "operations on monies with different currencies is not allowed"
+    )
+
+
+def _exact_sum(data: np.ndarray) -> int:
+    if not len(data):
+        return 0
+    peak = max(int(data.max()), -int(data.min()))
+    if peak * len(data) <= np.iinfo(np.int64).max:
+        return int(data.sum())
+    # python ints keep the total exact when it may no longer fit in an int64
+    return sum(data.tolist())
+
+
+def _raise_on_overflow(overflow: np.ndarray, mask: np.ndarray | bool):
+    # amounts under the mask are not values, whatever they wrapped to
+    if (overflow & ~mask).any():
+        raise OverflowError("money amounts do not fit in an int64")
+
+
+@register_extension_dtype
+class MoneyDtype(ExtensionDtype):
+    """pandas extension dtype for monetary values in a single currency."""
+
+    type = Money
+    kind = "O"
+    na_value = pd.NA
+    _metadata = ("code",)
+    _match = re.compile(r"^money\[(?P<code>\w+)\]$")
+
+    def __init__(self, code: int | str | CurrencyCode):
+        self._currency: Currency = Money._resolve_currency(code)
+
+    @property
+    def code(self) -> CurrencyCode:
+        return self._currency.code
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    @property
+    def name(self) -> str:
+        return f"money[{self.code.value}]"
+
+    @classmethod
+    def construct_array_type(cls) -> type[MoneyExtensionArray]:
+        return MoneyExtensionArray
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> MoneyDtype:
+        if not isinstance(string, str):
+            raise TypeError(
+                f"'construct_from_string' expects a string, got {type(string)}"
+            )
+        match = cls._match.match(string)
+        if match is None:
+            raise TypeError(f"Cannot construct a '{cls.__name__}' from '{string}'")
+        return cls(match.group("code"))
+
+    def __repr__(self):
+        return f'MoneyDtype(code="{self.code.value}")'
+
+
+class MoneyExtensionArray(ExtensionArray):
+    """pandas extension array for monetary values in a single currency.
+
+    Amounts are stored in the subunit of the currency in an int64 numpy array, missing values
+    are tracked in a separate boolean mask.
+    """
+
+    def __init__(self, data: np.ndarray, mask: np.ndarray, dtype: MoneyDtype):
+        self._data = data
+        self._mask = mask
+        self._dtype = dtype
+
+    @classmethod
+    def from_money_array(cls, money_array: MoneyArray) -> MoneyExtensionArray:
+        """Wraps a MoneyArray without copying its amounts.
+
+        The resulting array is read-only until it is copied.
+        """
+        data = np.frombuffer(money_array.amounts, dtype=np.int64)
+        return cls(
+            data, np.zeros(len(data), dtype=bool), MoneyDtype(money_array.currency.code)
+        )
+
+    def to_money_array(self) -> MoneyArray:
+        """Returns the values as a MoneyArray sharing the amounts buffer.
+
+        Raises:
+            ValueError: when the array has missing values.
+        """
+        if self._mask.any():
+            raise ValueError(
+                "cannot convert an array with missing values to a MoneyArray"
+            )
+        return MoneyArray(np.ascontiguousarray(self._data), self._dtype.code)
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False) -> MoneyExtensionArray:
+        if isinstance(dtype, str):
+            dtype = MoneyDtype.construct_from_string(dtype)
+        if isinstance(scalars, MoneyExtensionArray):
+            if dtype is not None and dtype != scalars.dtype:
+                _raise_currency_mismatch()
+            return scalars.copy() if copy else scalars
+        if isinstance(scalars, MoneyArray):
+            result = cls.from_money_array(scalars)
+            if dtype is not None and dtype != result.dtype:
+                _raise_currency_mismatch()
+            return result.copy() if copy else result
+
+        currency = None if dtype is None else dtype.currency
+        n = len(scalars)
+        data = np.zeros(n, dtype=np.int64)
+        mask = np.zeros(n, dtype=bool)
+        for i, scalar in enumerate(scalars):
+            if isinstance(scalar, Money):
+                if currency is None:
+                    currency = scalar.currency
+                elif scalar.currency is not currency and scalar.currency != currency:
+                    _raise_currency_mismatch()
+                data[i] = scalar.amount
+            elif isinstance(scalar, numbers.Integral) and not isinstance(scalar, bool):
+                data[i] = scalar
+            elif pd.isna(scalar):
+                mask[i] = True
+            else:
+                raise TypeError(f"cannot convert {scalar!r} to Money")
+        if currency is None:
+            raise ValueError("`dtype` is required when no value is a Money")
+        return cls(data, mask, MoneyDtype(currency.code))
+
+    @classmethod
+    def _from_factorized(
+        cls, values, original: MoneyExtensionArray
+    ) -> MoneyExtensionArray:
+        return cls(
+            np.asarray(values, dtype=np.int64),
+            np.zeros(len(values), dtype=bool),
+            original.dtype,
+        )
+
+    @property
+    def dtype(self) -> MoneyDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes + self._mask.nbytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            if self._mask[item]:
+                return pd.NA
+            return Money._from_minor_units(int(self._data[item]), self._dtype.currency)
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return type(self)(self._data[item], self._mask[item], self._dtype)
+
+    def _validate_values(self, value) -> tuple[np.ndarray | int, np.ndarray | bool]:
+        if isinstance(value, Money):
+            self._assert_is_same_currency_with(value)
+            return value.amount, False
+        if not pd.api.types.is_list_like(value) and pd.isna(value):
+            return 0, True
+        if not isinstance(value, MoneyExtensionArray):
+            value = type(self)._from_sequence(value, dtype=self._dtype)
+        self._assert_is_same_currency_with(value)
+        return value._data, value._mask
+
+    def __setitem__(self, key, value) -> None:
+        key = pd.api.indexers.check_array_indexer(self, key)
+        data, mask = self._validate_values(value)
+        self._data[key] = data
+        self._mask[key] = mask
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array(list(self), dtype=object)
+
+    def isna(self) -> np.ndarray:
+        return self._mask.copy()
+
+    def take(
+        self, indices, *, allow_fill=False, fill_value=None
+    ) -> MoneyExtensionArray:
+        if allow_fill:
+            fill_amount, fill_mask = (
+                (0, True) if fill_value is None else self._validate_values(fill_value)
+            )
+        else:
+            fill_amount, fill_mask = 0, True
+        data = take(self._data, indices, allow_fill=allow_fill, fill_value=fill_amount)
+        mask = take(self._mask, indices, allow_fill=allow_fill, fill_value=fill_mask)
+        return type(self)(data, mask, self._dtype)
+
+    def copy(self) -> MoneyExtensionArray:
+        return type(self)(self._data.copy(), self._mask.copy(), self._dtype)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat) -> MoneyExtensionArray:
+        dtype = to_concat[0].dtype
+        for array in to_concat:
+            if array.dtype != dtype:
+                _raise_currency_mismatch()
+        return cls(
+            np.concatenate([array._data for array in to_concat]),
+            np.concatenate([array._mask for array in to_concat]),
+            dtype,
+        )
+
+    def factorize(self, use_na_sentinel: bool = True):
+        valid = ~self._mask
+        codes = np.full(len(self), -1, dtype=np.intp)
+        valid_codes, uniques = pd.factorize(self._data[valid])
+        codes[valid] = valid_codes
+        uniques_mask = np.zeros(len(uniques), dtype=bool)
+        if not use_na_sentinel and self._mask.any():
+            codes[self._mask] = len(uniques)
+            uniques = np.append(uniques, 0)
+            uniques_mask = np.append(uniques_mask, True)
+        return codes, type(self)(uniques, uniques_mask, self._dtype)
+
+    def unique(self) -> MoneyExtensionArray:
+        return self.factorize(use_na_sentinel=False)[1]
+
+    def value_counts(self, dropna: bool = True) -> pd.Series:
+        codes, uniques = self.factorize(use_na_sentinel=dropna)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        return pd.Series(counts, index=pd.Index(uniques), name="count")
+
+    def _values_for_argsort(self) -> np.ndarray:
+        return self._data
+
+    def _formatter(self, boxed: bool = False):
+        formatter = self._dtype.currency.formatter
+
+        def format_(value):
+            if value is pd.NA:
+                return str(value)
+            return formatter.format(value.amount)
+
+        return format_
+
+    def _assert_is_same_currency_with(self, other: MoneyExtensionArray | Money):
+        currency = other.currency if isinstance(other, Money) else other.dtype.currency
+        if currency is not self._dtype.currency and currency != self._dtype.currency:
+            _raise_currency_mismatch()
+
+    def _unbox(self, other) -> tuple[np.ndarray | int, np.ndarray | bool]:
+        if isinstance(other, (pd.Series, pd.Index)):
+            other = other.array
+        if isinstance(other, Money):
+            self._assert_is_same_currency_with(other)
+            return other.amount, False
+        if isinstance(other, MoneyExtensionArray):
+            self._assert_is_same_currency_with(other)
+            if len(other) != len(self):
+                raise ValueError("Lengths must match")
+            return other._data, other._mask
+        return NotImplemented, False
+
+    def _money_op(self, other, op, reflected: bool = False):
+        data, mask = self._unbox(other)
+        if data is NotImplemented:
+            return NotImplemented
+        mask = self._mask | mask
+        a, b = (data, self._data) if reflected else (self._data, data)
+        result = op(a, b)
+        # int64 arithmetic wraps around, which flips the sign bit in a way that the
+        # operands' signs cannot explain
+        if op is np.add:
+            overflow = ((a ^ result) & (b ^ result)) < 0
+        else:
+            overflow = ((a ^ b) & (a ^ result)) < 0
+        _raise_on_overflow(overflow, mask)
+        return type(self)(result, mask, self._dtype)
+
+    def _multiply(self, by: int | np.ndarray) -> MoneyExtensionArray:
+        a = self._data
+        if isinstance(by, numbers.Integral):
+            if not -(2**63) <= by < 2**63:
+                raise OverflowError("money amounts do not fit in an int64")
+            by = np.int64(by)
+        result = a * by
+        # a wrapped product is not a multiple of `by` that divides back to the amount, except
+        # for the one quotient that wraps too
+        nonzero = by != 0
+        quotient = np.floor_divide(result, by, where=nonzero, out=np.zeros_like(a))
+        overflow = nonzero & (quotient != a)
+        overflow |= (a == np.iinfo(np.int64).min) & (by == -1)
+        _raise_on_overflow(overflow, self._mask)
+        return type(self)(result, self._mask.copy(), self._dtype)
+
+    def _compare(self, other, op):
+        data, mask = self._unbox(other)
+        if data is NotImplemented:
+            return NotImplemented
+        return pd.arrays.BooleanArray(op(self._data, data), self._mask | mask)
+
+    def __add__(self, other):
+        return self._money_op(other, np.add)
+
+    def __radd__(self, other):
+        return self._money_op(other, np.add)
+
+    def __sub__(self, other):
+        return self._money_op(other, np.subtract)
+
+    def __rsub__(self, other):
+        return self._money_op(other, np.subtract, reflected=True)
+
+    def __mul__(self, by):
+        if isinstance(by, (pd.Series, pd.Index)):
+            by = by.array
+        if isinstance(by, numbers.Integral) and not isinstance(by, bool):
+            return self._multiply(int(by))
+        if isinstance(by, (np.ndarray, pd.api.extensions.ExtensionArray)):
+            by = np.asarray(by)
+            if by.dtype.kind in "iu":
+                if by.dtype == np.uint64 and (by > np.iinfo(np.int64).max).any():
+                    raise OverflowError("money amounts do not fit in an int64")
+                return self._multiply(by.astype(np.int64, copy=False))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        # the smallest int64 is the only amount without an int64 negation
+        _raise_on_overflow(self._data == np.iinfo(np.int64).min, self._mask)
+        return type(self)(-self._data, self._mask.copy(), self._dtype)
+
+    def __abs__(self):
+        _raise_on_overflow(self._data == np.iinfo(np.int64).min, self._mask)
+        return type(self)(np.abs(self._data), self._mask.copy(), self._dtype)
+
+    def __eq__(self, other):
+        return self._compare(other, np.equal)
+
+    def __ne__(self, other):
+        return self._compare(other, np.not_equal)
+
+    def __lt__(self, other):
+        return self._compare(other, np.less)
+
+    def __le__(self, other):
+        return self._compare(other, np.less_equal)
+
+    def __gt__(self, other):
+        return self._compare(other, np.greater)
+
+    def __ge__(self, other):
+        return self._compare(other, np.greater_equal)
+
+    def _reduce(
+        self, name: str, *, skipna: bool = True, keepdims: bool = False, **kwargs
+    ):
+        if name not in ("sum", "min", "max"):
+            raise TypeError(
+                f"'{type(self).__name__}' does not support reduction '{name}'"
+            )
+        if self._mask.any() and not skipna:
+            result = pd.NA
+        else:
+            data = self._data[~self._mask]
+            min_count = kwargs.get("min_count", 0)
+            if name == "sum" and len(data) >= min_count:
+                result = _exact_sum(data)
+            elif name != "sum" and len(data):
+                result = int(getattr(data, name)())
+            else:
+                result = pd.NA
+        if result is not pd.NA:
+            result = Money._from_minor_units(result, self._dtype.currency)
+        if keepdims:
+            return type(self)._from_sequence([result], dtype=self._dtype)
+        return result
+
+    def _groupby_op(self, *, how, has_dropped_na, min_count, ngroups, ids, **kwargs):
+        # group totals are accumulated in int64, like the column itself, unless they could
+        # overflow it
+        if how not in ("sum", "min", "max"):
+            return super()._groupby_op(
+                how=how,
+                has_dropped_na=has_dropped_na,
+                min_count=min_count,
+                ngroups=ngroups,
+                ids=ids,
+                **kwargs,
+            )
+        valid = (ids >= 0) & ~self._mask
+        group_ids = ids[valid]
+        data = self._data[valid]
+        counts = np.bincount(group_ids, minlength=ngroups)
+        if how == "sum":
+            info = np.iinfo(np.int64)
+            peak = max(int(data.max()), -int(data.min())) if len(data) else 0
+            if peak * len(data) <= info.max:
+                result = np.zeros(ngroups, dtype=np.int64)
+                np.add.at(result, group_ids, data)
+            else:
+                # python ints keep the totals exact, like `_exact_sum`, and only totals
+                # that do not fit in the int64 column are rejected
+                totals = [0] * ngroups
+                for group, amount in zip(group_ids.tolist(), data.tolist()):
+                    totals[group] += amount
+                if any(not info.min <= total <= info.max for total in totals):
+                    raise OverflowError("money amounts do not fit in an int64")
+                result = np.array(totals, dtype=np.int64)
+            mask = counts < max(min_count, 0)
+        else:
+            info = np.iinfo(np.int64)
+            initial = info.max if how == "min" else info.min
+            result = np.full(ngroups, initial, dtype=np.int64)
+            ufunc = np.minimum if how == "min" else np.maximum
+            ufunc.at(result, group_ids, data)
+            mask = counts < max(min_count, 1)
+        result[mask] = 0
+        return type(self)(result, mask, self._dtype)
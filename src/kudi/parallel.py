@@ -0,0 +1,172 @@
+"""Parallel per-currency aggregation across processes.
+
+Inputs are split into chunks that are reduced to per-currency integer totals in a
+`ProcessPoolExecutor`. Only raw amounts, codes and ints cross process boundaries, never `Money`
+objects, and the partial totals are merged exactly with python ints.
+
+Example:
+    >>> sum_by_currency([(150, "USD"), (-20, "usd"), (300, "NGN")], workers=2)
+    {<CurrencyCode.USD: 'USD'>: Money(amount=130, code="USD"), <CurrencyCode.NGN: 'NGN'>: Money(amount=300, code="NGN")}
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from typing import Callable, Iterable, Iterator
+
+from kudi.currency_codes import CurrencyCode
+from kudi.ledger import Ledger
+from kudi.money import Money
+from kudi.money_array import MoneyArray
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+Code = int | str | CurrencyCode
+
+
+def _sum_amounts(code: str, data: bytes) -> dict[str, int]:
+    return {code: sum(memoryview(data).cast("q"))}
+
+
+def _sum_records(records: list[tuple[int, Code]]) -> dict[Code, int]:
+    totals: dict[Code, int] = {}
+    get = totals.get
+    for amount, code in records:
+        totals[code] = get(code, 0) + amount
+    return totals
+
+
+def _sum_ledger(path: str, start: int, stop: int) -> dict[str, int]:
+    with Ledger(path) as ledger:
+        chunk = ledger.money_array(start, stop)
+        return {ledger.currency.code.value: sum(chunk.amounts)}
+
+
+def _map_bounded(
+    executor: Executor, fn: Callable, tasks: Iterable[tuple], max_pending: int
+) -> Iterator:
+    """Like `executor.map` but without submitting more than `max_pending` tasks ahead, so
+    lazily generated chunks are never all held in memory at once. Results are yielded in
+    completion order."""
+    pending = set()
+    for task in tasks:
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+        pending.add(executor.submit(fn, *task))
+    for future in pending:
+        yield future.result()
+
+
+def _reduce(
+    fn: Callable,
+    tasks: Iterable[tuple],
+    workers: int | None,
+    executor: Executor | None,
+) -> dict[CurrencyCode, Money]:
+    totals: dict[Code, int] = {}
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    try:
+        for partial in _map_bounded(executor, fn, tasks, max_pending):
+            for code, total in partial.items():
+                totals[code] = totals.get(code, 0) + total
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+    # the same currency may have been spelled differently across records
+    result: dict[CurrencyCode, int] = {}
+    currencies = {}
+    for code, total in totals.items():
+        currency = Money._resolve_currency(code)
+        currencies[currency.code] = currency
+        result[currency.code] = result.get(currency.code, 0) + total
+    return {
+        code: Money._from_minor_units(total, currencies[code])
+        for code, total in result.items()
+    }
+
+
+def _money_array_tasks(
+    money_arrays: Iterable[MoneyArray], chunk_size: int
+) -> Iterator[tuple[str, bytes]]:
+    for money_array in money_arrays:
+        code = money_array.currency.code.value
+        amounts = money_array.amounts
+        for start in range(0, len(amounts), chunk_size):
+            yield code, amounts[start : start + chunk_size].tobytes()
+
+
+def _record_tasks(
+    records: Iterable[tuple[int, Code]], chunk_size: int
+) -> Iterator[tuple[list[tuple[int, Code]]]]:
+    iterator = iter(records)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield (chunk,)
+
+
+def sum_by_currency(
+    source: MoneyArray | Iterable[MoneyArray] | Iterable[tuple[int, Code]],
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None,
+) -> dict[CurrencyCode, Money]:
+    """Sums amounts per currency in parallel.
+
+    Args:
+        source: a money array, an iterable of money arrays, or an iterable of
+            `(amount, code)` records with amounts in the subunit of the currency. Iterables
+            are consumed lazily.
+        workers: the number of worker processes, defaults to the number of CPUs.
+        chunk_size: the number of amounts reduced by a worker at a time.
+        executor: an executor to reuse instead of starting a new process pool.
+    Returns:
+        The total of each currency in the source.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+    if isinstance(source, MoneyArray):
+        source = [source]
+    iterator = iter(source)
+    first = next(iterator, None)
+    if first is None:
+        return {}
+    iterator = itertools.chain([first], iterator)
+    if isinstance(first, MoneyArray):
+        tasks = _money_array_tasks(iterator, chunk_size)
+        return _reduce(_sum_amounts, tasks, workers, executor)
+    return _reduce(_sum_records, _record_tasks(iterator, chunk_size), workers, executor)
+
+
+def sum_ledgers(
+    paths: Iterable[str | os.PathLike],
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None,
+) -> dict[CurrencyCode, Money]:
+    """Sums the amounts of ledger files per currency in parallel.
+
+    Workers map the files themselves, so only file paths and ranges are sent to them.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+
+    def tasks():
+        for path in paths:
+            with Ledger(path) as ledger:
+                count = len(ledger)
+            for start in range(0, count, chunk_size):
+                yield os.fspath(path), start, start + chunk_size
+
+    return _reduce(_sum_ledger, tasks(), workers, executor)
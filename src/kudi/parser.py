@@ -0,0 +1,207 @@
+"""Parsing of formatted money strings such as `₦1,234,567.89` or `-$12.00`.
+
+Each currency compiles its symbol, alpha code, minor unit separator and thousand delimiter into
+a regular expression once, and parsing goes straight from the matched digits to an amount in the
+subunit of the currency without passing through floats or decimals.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from kudi import hooks
+from kudi.formatter import FormatStyle
+
+_SPACES = " \u00a0\u202f"
+_SYMBOL = re.compile(r"(\D*)\d(?:.*\d)?(\D*)", re.DOTALL)
+
+
+def _symbol_of(text: str) -> str:
+    """Returns the text around the digits of a formatted amount, without signs,
+    parentheses or spaces."""
+    match = _SYMBOL.fullmatch(text)
+    if match is None:
+        return ""
+    strip = f"(){_SPACES}\t\n-"
+    return match[1].strip(strip) or match[2].strip(strip)
+
+
+@dataclass(frozen=True)
+class ParsePlan:
+    """A currency's formatting conventions compiled into a regular expression.
+
+    The symbol or the alpha code may appear on either side of the digits and negative amounts
+    may use a sign or parentheses. The major digits are either not grouped at all or grouped
+    exactly like the formatter groups them: `primary_group` digits next to the minor unit
+    separator and `secondary_group` digits in every other group but the first, which has at
+    most that many, so strings in another currency's format are rejected rather than read as a
+    different amount. Any kind of space delimits groups when the delimiter is a space.
+    """
+
+    minor_unit: int
+    minor_unit_separator: str
+    thousand_delimiter: str
+    symbol: str
+    code: str
+    primary_group: int = 3
+    secondary_group: int = 3
+    _scale: int = field(init=False, repr=False, compare=False)
+    _match: Callable[[str], re.Match | None] = field(
+        init=False, repr=False, compare=False
+    )
+    _delimiters: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.primary_group <= 0 or self.secondary_group <= 0:
+            raise ValueError("group sizes must be greater than 0")
+        delimiters = self.thousand_delimiter
+        if delimiters and delimiters in _SPACES:
+            # formatted text often swaps spaces for non-breaking ones
+            delimiters = _SPACES
+        major = r"\d+"
+        if delimiters:
+            if delimiters == _SPACES:
+                delimiter = f"[{_SPACES}]"
+            else:
+                delimiter = re.escape(delimiters)
+            secondary = self.secondary_group
+            major = (
+                rf"\d{{1,{secondary}}}(?:{delimiter}\d{{{secondary}}})*"
+                rf"{delimiter}\d{{{self.primary_group}}}|\d+"
+            )
+        minor = ""
+        if self.minor_unit > 0:
+            minor = rf"(?:{re.escape(self.minor_unit_separator)}(?P<minor>\d+))?"
+        symbol = f"(?:{re.escape(self.symbol)}|{re.escape(self.code)})"
+        pattern = (
+            rf"\s*(?P<open>\()?\s*(?P<sign>-)?\s*(?:(?P<prefix>{symbol})\s*)?(?P<inner>-)?"
+            rf"(?P<major>{major}){minor}\s*(?(prefix)|(?:{symbol})?)\s*(?(open)\))\s*"
+        )
+        setattr_ = object.__setattr__
+        setattr_(self, "_scale", 10 ** max(self.minor_unit, 0))
+        setattr_(self, "_match", re.compile(pattern).fullmatch)
+        setattr_(self, "_delimiters", str.maketrans("", "", delimiters))
+
+    @classmethod
+    def compile(
+        cls,
+        minor_unit: int,
+        minor_unit_separator: str,
+        thousand_delimiter: str,
+        symbol: str,
+        code: str,
+        primary_group: int = 3,
+        secondary_group: int | None = None,
+    ) -> ParsePlan:
+        """Compiles the formatting conventions of a currency.
+
+        Args:
+            primary_group: the size of the group of digits next to the minor unit separator.
+            secondary_group: the size of the other groups, defaults to `primary_group`.
+        """
+        if minor_unit > 0 and minor_unit_separator == thousand_delimiter:
+            raise ValueError(
+                "the minor unit separator and the thousand delimiter must be different"
+            )
+        return cls(
+            minor_unit,
+            minor_unit_separator,
+            thousand_delimiter,
+            symbol,
+            code,
+            primary_group,
+            primary_group if secondary_group is None else secondary_group,
+        )
+
+    def parse(self, text: str) -> int:
+        """Parses a formatted amount into the subunit of the currency.
+
+        Raises:
+            ValueError: when the text is not a formatted amount of the currency, or has
+                more minor digits than the currency.
+        """
+        match = self._match(text)
+        if match is None:
+            raise ValueError(f"`{text}` is not a valid {self.code} amount")
+        open_, sign, _, inner, major, *minor = match.groups()
+        major = major.replace(self.thousand_delimiter, "")
+        if not major.isdigit():
+            major = major.translate(self._delimiters)
+        amount = int(major) * self._scale
+        if minor and minor[0]:
+            digits = minor[0]
+            if len(digits) > self.minor_unit:
+                raise ValueError(
+                    f"`{text}` has more minor digits than {self.code} allows"
+                )
+            amount += int(digits) * 10 ** (self.minor_unit - len(digits))
+        if open_ or sign or inner:
+            if bool(open_) + bool(sign) + bool(inner) > 1:
+                raise ValueError(f"`{text}` is not a valid {self.code} amount")
+            return -amount
+        return amount
+
+    def parse_many(self, texts: Iterable[str]) -> list[int]:
+        """Parses many formatted amounts with the same plan"""
+        start = hooks._start() if hooks._hooks else 0
+        parse = self.parse
+        amounts = [parse(text) for text in texts]
+        if start:
+            hooks._emit("parse_many", len(amounts), self.code, start)
+        return amounts
+
+
+class Parser:
+    def __init__(
+        self,
+        minor_unit: int,
+        minor_unit_separator: str,
+        thousand_delimiter: str,
+        symbol: str,
+        code: str,
+    ):
+        self.minor_unit = minor_unit
+        self.minor_unit_separator = minor_unit_separator
+        self.thousand_delimiter = thousand_delimiter
+        self.symbol = symbol
+        self.code = code
+        self.plan = ParsePlan.compile(
+            minor_unit, minor_unit_separator, thousand_delimiter, symbol, code
+        )
+        self._plans: dict[tuple[str, str, int, int | None], ParsePlan] = {}
+
+    def plan_for(self, style: FormatStyle | None) -> ParsePlan:
+        """Returns the plan for the separator, delimiter and grouping of the given style,
+        compiling it on first use"""
+        if style is None:
+            return self.plan
+        key = (
+            self.minor_unit_separator
+            if style.minor_unit_separator is None
+            else style.minor_unit_separator,
+            self.thousand_delimiter
+            if style.thousand_delimiter is None
+            else style.thousand_delimiter,
+            style.primary_group,
+            style.secondary_group,
+        )
+        plan = self._plans.get(key)
+        if plan is None:
+            separator, delimiter, primary_group, secondary_group = key
+            plan = self._plans[key] = ParsePlan.compile(
+                self.minor_unit,
+                separator,
+                delimiter,
+                self.symbol,
+                self.code,
+                primary_group,
+                secondary_group,
+            )
+        return plan
+
+    def parse(self, text: str, style: FormatStyle | None = None) -> int:
+        if style is None:
+            return self.plan.parse(text)
+        return self.plan_for(style).parse(text)
@@ -0,0 +1,241 @@
+"""Monies with extra fixed-point digits for chained calculations.
+
+`Money` rounds every result back to the subunit of its currency, so a chain like
+`principal * rate * days / 365` rounds at every step. `PreciseMoney` carries a number of extra
+digits below the subunit as a scaled int, rounds intermediate results to those digits only, and
+is rounded once back to the subunit with `to_money`.
+
+Example:
+    >>> principal = Money(1_000_000, "USD").with_scale(6)
+    >>> (principal * Decimal("0.0525") * 17 / 365).to_money()
+    Money(amount=2445, code="USD")
+"""
+
+from __future__ import annotations
+
+from decimal import ROUND_HALF_UP, Decimal
+from fractions import Fraction
+
+from kudi.calculator import Calculator
+from kudi.currency import Currency
+from kudi.exceptions import CurrencyMismatchError
+from kudi.money import Money
+
+
+_new = object.__new__
+
+
+def _divide_half_even(n: int, d: int) -> int:
+    # `Calculator.divide_rounded` for ROUND_HALF_EVEN and a positive d, inlined for the
+    # intermediate results of chained calculations
+    q, r = divmod(n, d)
+    if 2 * r > d or (2 * r == d and q & 1):
+        return q + 1
+    return q
+
+
+class PreciseMoney:
+    """PreciseMoney is a monetary value with `scale` extra digits below the subunit.
+
+    The value is stored as an int in units of `10 ** -scale` of the subunit. Operators mirror
+    those of `Money`; products and quotients are computed exactly and rounded half even to the
+    scale, so the only significant rounding is the final `to_money`.
+    """
+
+    __slots__ = ("_value", "_scale", "_currency")
+
+    def __init__(self, money: Money, scale: int):
+        """Converts a money to a precise money with `scale` extra digits, see `Money.with_scale`."""
+        if not isinstance(scale, int) or scale < 0:
+            raise ValueError("the scale must be a non-negative int")
+        self._value: int = money.amount * 10**scale
+        self._scale: int = scale
+        self._currency: Currency = money.currency
+
+    @classmethod
+    def _from_value(cls, value: int, scale: int, currency: Currency) -> PreciseMoney:
+        """Builds a precise money from a value already at the scale, every operator goes
+        through here."""
+        precise = _new(cls)
+        precise._value = value
+        precise._scale = scale
+        precise._currency = currency
+        return precise
+
+    @property
+    def value(self) -> int:
+        """the value in units of `10 ** -scale` of the subunit"""
+        return self._value
+
+    @property
+    def scale(self) -> int:
+        return self._scale
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    def to_money(self, rounding: str = ROUND_HALF_UP) -> Money:
+        """Rounds the value once to the subunit of the currency.
+
+        Args:
+            rounding: one of the rounding modes of the `decimal` module, e.g. `ROUND_HALF_EVEN`.
+        """
+        return Money._from_minor_units(
+            Calculator.divide_rounded(self._value, 10**self._scale, rounding),
+            self._currency,
+        )
+
+    def to_decimal(self) -> Decimal:
+        """Returns the exact value in the major unit of the currency"""
+        return Decimal(self._value).scaleb(-(self._scale + self._currency.minor_unit))
+
+    def _aligned(self, other: PreciseMoney | Money) -> tuple[int, int, int]:
+        """Returns both values at the larger of the two scales and that scale"""
+        if other._currency is not self._currency and other._currency != self._currency:
+            raise CurrencyMismatchError(
+                "operations on monies with different currencies is not allowed"
+            )
+        if isinstance(other, Money):
+            return self._value, other._amount * 10**self._scale, self._scale
+        if other._scale == self._scale:
+            return self._value, other._value, self._scale
+        if other._scale > self._scale:
+            return (
+                self._value * 10 ** (other._scale - self._scale),
+                other._value,
+                other._scale,
+            )
+        return (
+            self._value,
+            other._value * 10 ** (self._scale - other._scale),
+            self._scale,
+        )
+
+    def __add__(self, other: PreciseMoney | Money) -> PreciseMoney:
+        if not isinstance(other, (PreciseMoney, Money)):
+            return NotImplemented
+        a, b, scale = self._aligned(other)
+        return PreciseMoney._from_value(a + b, scale, self._currency)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: PreciseMoney | Money) -> PreciseMoney:
+        if not isinstance(other, (PreciseMoney, Money)):
+            return NotImplemented
+        a, b, scale = self._aligned(other)
+        return PreciseMoney._from_value(a - b, scale, self._currency)
+
+    def __rsub__(self, other: Money) -> PreciseMoney:
+        if not isinstance(other, Money):
+            return NotImplemented
+        a, b, scale = self._aligned(other)
+        return PreciseMoney._from_value(b - a, scale, self._currency)
+
+    def __mul__(self, by: int | Decimal | Fraction) -> PreciseMoney:
+        if isinstance(by, int):
+            value = self._value * by
+        elif isinstance(by, (Decimal, Fraction)):
+            numerator, denominator = Money._as_ratio(by)
+            value = _divide_half_even(self._value * numerator, denominator)
+        else:
+            return NotImplemented
+        return PreciseMoney._from_value(value, self._scale, self._currency)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, by: int | Decimal | Fraction) -> PreciseMoney:
+        if not isinstance(by, (int, Decimal, Fraction)):
+            return NotImplemented
+        numerator, denominator = Money._as_ratio(by)
+        if numerator == 0:
+            raise ZeroDivisionError("division of money by zero")
+        value = self._value * denominator
+        if numerator < 0:
+            value, numerator = -value, -numerator
+        return PreciseMoney._from_value(
+            _divide_half_even(value, numerator), self._scale, self._currency
+        )
+
+    def __floordiv__(self, by: int | Decimal | Fraction) -> PreciseMoney:
+        if not isinstance(by, (int, Decimal, Fraction)):
+            return NotImplemented
+        numerator, denominator = Money._as_ratio(by)
+        if numerator == 0:
+            raise ZeroDivisionError("division of money by zero")
+        return PreciseMoney._from_value(
+            self._value * denominator // numerator, self._scale, self._currency
+        )
+
+    def __mod__(self, by: int | Decimal | Fraction) -> PreciseMoney:
+        result = self.__divmod__(by)
+        return result if result is NotImplemented else result[1]
+
+    def __divmod__(
+        self, by: int | Decimal | Fraction
+    ) -> tuple[PreciseMoney, PreciseMoney]:
+        """Returns `self // by` and the exact remainder `self - (self // by) * by`, see
+        `Money.__divmod__`.
+
+        Raises:
+            ZeroDivisionError: when `by` is zero.
+            ValueError: when the remainder is not a whole number of units of the scale.
+        """
+        if not isinstance(by, (int, Decimal, Fraction)):
+            return NotImplemented
+        numerator, denominator = Money._as_ratio(by)
+        if numerator == 0:
+            raise ZeroDivisionError("division of money by zero")
+        scaled = self._value * denominator
+        quotient = scaled // numerator
+        remainder, fraction = divmod(scaled - quotient * numerator, denominator)
+        if fraction:
+            raise ValueError(
+                f"the remainder of {self} divided by {by} is not a whole number of units of the scale"
+            )
+        return (
+            PreciseMoney._from_value(quotient, self._scale, self._currency),
+            PreciseMoney._from_value(remainder, self._scale, self._currency),
+        )
+
+    def __neg__(self) -> PreciseMoney:
+        return PreciseMoney._from_value(-self._value, self._scale, self._currency)
+
+    def __abs__(self) -> PreciseMoney:
+        return PreciseMoney._from_value(abs(self._value), self._scale, self._currency)
+
+    def __eq__(self, other: PreciseMoney | Money) -> bool:
+        if not isinstance(other, (PreciseMoney, Money)):
+            return NotImplemented
+        a, b, _ = self._aligned(other)
+        return a == b
+
+    def __lt__(self, other: PreciseMoney | Money) -> bool:
+        if not isinstance(other, (PreciseMoney, Money)):
+            return NotImplemented
+        a, b, _ = self._aligned(other)
+        return a < b
+
+    def __le__(self, other: PreciseMoney | Money) -> bool:
+        if not isinstance(other, (PreciseMoney, Money)):
+            return NotImplemented
+        a, b, _ = self._aligned(other)
+        return a <= b
+
+    def __gt__(self, other: PreciseMoney | Money) -> bool:
+        if not isinstance(other, (PreciseMoney, Money)):
+            return NotImplemented
+        a, b, _ = self._aligned(other)
+        return a > b
+
+    def __ge__(self, other: PreciseMoney | Money) -> bool:
+        if not isinstance(other, (PreciseMoney, Money)):
+            return NotImplemented
+        a, b, _ = self._aligned(other)
+        return a >= b
+
+    def __str__(self) -> str:
+        return f"{self.to_decimal()} {self._currency.code}"
+
+    def __repr__(self):
+        return f'PreciseMoney(value={self._value}, scale={self._scale}, code="{self._currency.code}")'
@@ -0,0 +1,58 @@
+"""Sorting of money collections on plain ints.
+
+`sorted(monies)` calls `Money.__lt__` for every comparison, checking currencies each time.
+`sorted_money` checks the currencies once and then sorts on the integer amounts.
+
+Example:
+    >>> sorted_money([Money(300, "USD"), Money(-20, "USD"), Money(150, "USD")])
+    [Money(amount=-20, code="USD"), Money(amount=150, code="USD"), Money(amount=300, code="USD")]
+"""
+
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Iterable
+
+from kudi.exceptions import CurrencyMismatchError
+from kudi.grouping import group_by_currency
+from kudi.money import Money
+
+_amount_of = attrgetter("_amount")
+
+
+def sorted_money(
+    monies: Iterable[Money], *, mixed: str = "error", reverse: bool = False
+) -> list[Money]:
+    """Returns the monies sorted by amount.
+
+    Args:
+        monies: the monies to sort.
+        mixed: what to do when the monies are in different currencies. `error` raises
+            `CurrencyMismatchError` and `group` sorts each currency separately and orders the
+            groups by currency code.
+        reverse: whether to sort in descending order. With `group`, the groups are in
+            descending order of currency code too, like `key=Money.sort_key` would give.
+    Raises:
+        CurrencyMismatchError: when `mixed` is `error` and the monies are in different
+            currencies.
+    """
+    if mixed not in ("error", "group"):
+        raise ValueError(
+            f"`{mixed}` is not a valid value for mixed, use `error` or `group`"
+        )
+    monies = list(monies)
+    currencies = {id(money._currency): money._currency for money in monies}
+    if len(currencies) > 1:
+        first, *others = currencies.values()
+        if any(currency != first for currency in others):
+            if mixed == "error":
+                raise CurrencyMismatchError(
+                    "operations on monies with different currencies is not allowed"
+                )
+            groups = group_by_currency(monies)
+            result = []
+            for code in sorted(groups, reverse=reverse):
+                result.extend(sorted(groups[code], key=_amount_of, reverse=reverse))
+            return result
+    monies.sort(key=_amount_of, reverse=reverse)
+    return monies
@@ -0,0 +1,227 @@
+"""Waterfall allocation over priority tiers of capped parties.
+
+Each tier is a group of parties sharing by ratio, like `Money.allocate`. A party can have a floor
+it is paid before any ratio share and a cap it is never paid beyond. What a tier cannot take
+because all of its parties hit their caps cascades to the next tier, and what the last tier
+cannot take is returned as the remainder, so no minor unit is ever lost.
+
+Example:
+    >>> waterfall = Waterfall(
+    ...     "USD",
+    ...     [Party(cap=5_000), Party(ratio=3, cap=10_000)],
+    ...     [Party(floor=100)],
+    ... )
+    >>> waterfall.allocate(Money(20_000, "USD"))
+    WaterfallShares(shares=[[Money(amount=5000, code="USD"), Money(amount=10000, code="USD")], [Money(amount=5000, code="USD")]], remainder=Money(amount=0, code="USD"))
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import NamedTuple, Sequence
+
+from kudi import hooks
+from kudi.calculator import Calculator
+from kudi.currency import Currency
+from kudi.currency_codes import CurrencyCode
+from kudi.exceptions import CurrencyMismatchError
+from kudi.money import Money, minor_units
+
+
+@dataclass(frozen=True)
+class Party:
+    """A party of a waterfall tier.
+
+    Amounts are ints in the subunit of the waterfall's currency or monies in that currency.
+
+    Attributes:
+        ratio: the party's ratio of what its tier shares out after the floors are paid.
+        floor: the amount the party is paid before any tier shares by ratio.
+        cap: the most the party is paid, `None` for no limit.
+    """
+
+    ratio: int = 1
+    floor: int | Money = 0
+    cap: int | Money | None = None
+
+
+class WaterfallShares(NamedTuple):
+    shares: list[list[Money]]
+    remainder: Money
+
+
+class _Tier(NamedTuple):
+    floors: list[int]
+    floor_total: int
+    floor_order: tuple[int, ...]
+    # (index, ratio, headroom) of the parties with a non-zero ratio, in the order they reach
+    # their caps, the uncapped ones last
+    by_headroom: tuple[tuple[int, int, int | None], ...]
+    ratio_total: int
+    leftover_order: tuple[int, ...]
+
+
+class Waterfall:
+    """Waterfall allocates monies through priority tiers of parties with floors and caps.
+
+    An amount first pays the floors, tier by tier. When it cannot cover every floor of a tier,
+    that tier's floors are paid pro-rata to their size and nothing reaches later tiers. What is
+    left is then shared by ratio within the first tier, parties that would pass their cap are
+    paid the cap and the rest is shared again amongst the others. Only once every party of a
+    tier is capped does the overflow move on to the next tier. Leftover pennies go round-robin,
+    like `Money.allocate`, and never push a party past its cap. Negative amounts such as
+    clawbacks mirror positive ones.
+
+    Compiling sorts the parties of each tier by how soon they reach their caps, which is
+    O(parties log parties), so each allocation is a single O(parties) pass of int arithmetic.
+    """
+
+    def __init__(self, code: int | str | CurrencyCode, *tiers: Sequence[Party]):
+        """Compiles a waterfall.
+
+        Args:
+            code: the currency of the amounts the waterfall allocates, see `Money`.
+            tiers: the tiers in order of priority, each a sequence of parties.
+        """
+        if not tiers or any(len(tier) == 0 for tier in tiers):
+            raise ValueError("no parties specified")
+        self._currency: Currency = Money._resolve_currency(code)
+        self.tiers = tuple(tuple(tier) for tier in tiers)
+        self._compiled = [self._compile(tier) for tier in self.tiers]
+
+    def _compile(self, parties: Sequence[Party]) -> _Tier:
+        floors = []
+        by_headroom = []
+        for index, party in enumerate(parties):
+            if party.ratio < 0:
+                raise ValueError("negative ratios not allowed, ratios must be positive")
+            floor = minor_units(party.floor, self._currency)
+            if floor < 0:
+                raise ValueError("negative floors not allowed")
+            headroom = None
+            if party.cap is not None:
+                headroom = minor_units(party.cap, self._currency) - floor
+                if headroom < 0:
+                    raise ValueError("the floor of a party must not exceed its cap")
+            floors.append(floor)
+            if party.ratio != 0:
+                by_headroom.append((index, party.ratio, headroom))
+        capped = [p for p in by_headroom if p[2] is not None]
+        uncapped = [p for p in by_headroom if p[2] is None]
+        try:
+            # float keys sort much faster than fractions and are almost always exact enough,
+            # which checking neighbours with int arithmetic confirms
+            capped.sort(key=lambda p: p[2] / p[1])
+            exact = all(a[2] * b[1] <= b[2] * a[1] for a, b in zip(capped, capped[1:]))
+        except OverflowError:
+            exact = False
+        if not exact:
+            capped.sort(key=lambda p: Fraction(p[2], p[1]))
+        by_headroom = capped + uncapped
+        return _Tier(
+            floors=floors,
+            floor_total=sum(floors),
+            floor_order=tuple(i for i, floor in enumerate(floors) if floor != 0),
+            by_headroom=tuple(by_headroom),
+            ratio_total=sum(ratio for _, ratio, _ in by_headroom),
+            leftover_order=tuple(sorted(index for index, _, _ in by_headroom)),
+        )
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    @staticmethod
+    def _pay_floors(tier: _Tier, shares: list[int], amount: int):
+        # the amount is smaller than the floors of the tier
+        floors, total = tier.floors, tier.floor_total
+        paid = 0
+        for i, floor in enumerate(floors):
+            share = Calculator.allocate(amount, floor, total)
+            shares[i] = share
+            paid += share
+        for i in tier.floor_order[: amount - paid]:
+            shares[i] += 1
+
+    @staticmethod
+    def _fill(tier: _Tier, shares: list[int], amount: int) -> int:
+        """Shares an amount by ratio within a tier and returns the overflow"""
+        ratio_total = tier.ratio_total
+        by_headroom = tier.by_headroom
+        capped = 0
+        for index, ratio, headroom in by_headroom:
+            # the party's share of what is left, amount * ratio / ratio_total, reaches its cap
+            if headroom is None or headroom * ratio_total > amount * ratio:
+                break
+            shares[index] += headroom
+            amount -= headroom
+            ratio_total -= ratio
+            capped += 1
+        if ratio_total == 0:
+            return amount
+        paid = 0
+        for index, ratio, _ in by_headroom[capped:]:
+            share = Calculator.allocate(amount, ratio, ratio_total)
+            shares[index] += share
+            paid += share
+        leftover = amount - paid
+        if leftover:
+            # every uncapped share is below its cap, so a penny more cannot pass it
+            order = tier.leftover_order
+            if capped:
+                full = {index for index, _, _ in by_headroom[:capped]}
+                order = [index for index in order if index not in full]
+            for index in order[:leftover]:
+                shares[index] += 1
+        return 0
+
+    def allocate(self, money: Money) -> WaterfallShares:
+        """Allocates a money through the tiers of the waterfall.
+
+        Returns:
+            The share of each party, tier by tier in the order of the parties, and the
+            remainder no party could take. The shares and the remainder add up to the money.
+        Raises:
+            CurrencyMismatchError: when `money` is not in the currency of the waterfall.
+        """
+        currency = self._currency
+        if money.currency is not currency and money.currency != currency:
+            raise CurrencyMismatchError(
+                "operations on monies with different currencies is not allowed"
+            )
+        start = hooks._start() if hooks._hooks else 0
+        amount = money.amount
+        remaining = -amount if amount < 0 else amount
+        tiers = [[0] * len(tier.floors) for tier in self._compiled]
+        for tier, shares in zip(self._compiled, tiers):
+            if remaining < tier.floor_total:
+                self._pay_floors(tier, shares, remaining)
+                remaining = 0
+                break
+            shares[:] = tier.floors
+            remaining -= tier.floor_total
+        for tier, shares in zip(self._compiled, tiers):
+            if remaining == 0:
+                break
+            remaining = self._fill(tier, shares, remaining)
+        sign = -1 if amount < 0 else 1
+        from_minor_units = Money._from_minor_units
+        result = WaterfallShares(
+            [
+                [from_minor_units(sign * s, currency) for s in shares]
+                for shares in tiers
+            ],
+            from_minor_units(sign * remaining, currency),
+        )
+        if start:
+            hooks._emit(
+                "waterfall",
+                sum(len(shares) for shares in tiers),
+                currency.code.value,
+                start,
+            )
+        return result
+
+    def __repr__(self):
+        return f'Waterfall(code="{self._currency.code}", tiers={self.tiers!r})'
@@ -0,0 +1,54 @@
+import random
+from unittest import TestCase
+
+from kudi import CurrencyMismatchError, Money, MoneyAccumulator
+
+
+class MoneyAccumulatorTestCase(TestCase):
+    def test_accumulate(self):
+        rng = random.Random(0)
+        values = [rng.randint(-(10**6), 10**6) for _ in range(1_000)]
+        total = MoneyAccumulator("NGN")
+        for i, value in enumerate(values):
+            if i % 3 == 0:
+                total += value
+            elif i % 3 == 1:
+                total += Money(value, "NGN")
+            else:
+                total -= Money(-value, "NGN")
+        self.assertEqual(total.freeze(), Money(sum(values), "NGN"))
+        self.assertEqual(total.count, len(values))
+        self.assertEqual(total.min, Money(min(values), "NGN"))
+        self.assertEqual(total.max, Money(max(values), "NGN"))
+        self.assertEqual(total.sum_of_squares, sum(v * v for v in values))
+        self.assertEqual(
+            repr(total),
+            f'MoneyAccumulator(total={sum(values)}, count=1000, code="NGN")',
+        )
+
+    def test_update(self):
+        monies = [Money(150, "USD"), Money(-20, "USD"), 5]
+        total = MoneyAccumulator("USD").update(monies)
+        self.assertEqual(total.freeze(), Money(135, "USD"))
+        self.assertEqual(
+            (total.count, total.min, total.max),
+            (3, Money(-20, "USD"), Money(150, "USD")),
+        )
+        with self.assertRaises(CurrencyMismatchError):
+            total.update([Money(1, "USD"), Money(1, "NGN")])
+        # the values before the mismatch are kept
+        self.assertEqual(total.freeze(), Money(136, "USD"))
+        self.assertEqual(total.count, 4)
+
+    def test_empty(self):
+        total = MoneyAccumulator(840)
+        self.assertEqual(total.freeze(), Money(0, "USD"))
+        self.assertEqual((total.count, total.min, total.max), (0, None, None))
+
+    def test_errors(self):
+        total = MoneyAccumulator("USD")
+        with self.assertRaises(CurrencyMismatchError):
+            total += Money(1, "NGN")
+        with self.assertRaises(TypeError):
+            total += 1.5
+        self.assertEqual(total.count, 0)
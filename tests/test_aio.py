@@ -0,0 +1,77 @@
+import asyncio
+from decimal import Decimal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import IsolatedAsyncioTestCase
+
+import kudi
+from kudi import Money
+from kudi.exceptions import InvalidCurrencyAlphaCodeError
+
+
+async def produce(records, fail_with=None):
+    for record in records:
+        yield record
+        await asyncio.sleep(0)
+    if fail_with is not None:
+        raise fail_with
+
+
+class AParseTestCase(IsolatedAsyncioTestCase):
+    async def test_can_parse_records(self):
+        records = [
+            (150, "USD"),
+            (-20, "usd"),
+            {"amount": 300, "currency": "NGN"},
+            (Decimal("1.50"), 978),
+        ]
+        monies = [m async for m in kudi.aparse(produce(records), batch_size=2)]
+        self.assertEqual(
+            [repr(m) for m in monies],
+            [
+                'Money(amount=150, code="USD")',
+                'Money(amount=-20, code="USD")',
+                'Money(amount=300, code="NGN")',
+                'Money(amount=150, code="EUR")',
+            ],
+        )
+
+    async def test_can_offload_batches(self):
+        records = [(i, "GBP") for i in range(100)]
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            monies = [
+                m
+                async for m in kudi.aparse(
+                    produce(records), executor=executor, offload_threshold=1
+                )
+            ]
+        self.assertEqual([m.amount for m in monies], list(range(100)))
+        self.assertIs(monies[0].currency, Money(0, "GBP").currency)
+
+    async def test_can_offload_batches_to_processes(self):
+        records = [(i, "GBP") for i in range(50)] + [("1.25", "NGN")]
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            monies = [
+                m
+                async for m in kudi.aparse(
+                    produce(records), executor=executor, offload_threshold=1
+                )
+            ]
+        self.assertEqual([m.amount for m in monies], list(range(50)) + [125])
+        self.assertIs(monies[0].currency, Money(0, "GBP").currency)
+        self.assertIs(monies[-1].currency, Money(0, "NGN").currency)
+
+    async def test_reader_is_awaited_when_closed_early(self):
+        tasks = asyncio.all_tasks()
+        stream = kudi.aparse(produce([(i, "USD") for i in range(10_000)]))
+        self.assertEqual((await anext(stream)).amount, 0)
+        await stream.aclose()
+        self.assertEqual(asyncio.all_tasks(), tasks)
+
+    async def test_errors_are_propagated(self):
+        with self.assertRaises(InvalidCurrencyAlphaCodeError):
+            [m async for m in kudi.aparse(produce([(1, "BTC")]))]
+        parsed = []
+        with self.assertRaises(RuntimeError):
+            async for m in kudi.aparse(produce([(1, "USD")], RuntimeError("boom"))):
+                parsed.append(m)
+        self.assertEqual(len(parsed), 1)
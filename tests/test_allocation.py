@@ -0,0 +1,65 @@
+import random
+from unittest import TestCase
+
+from kudi import AllocationPlan, Money, MoneyArray
+
+
+class AllocationPlanTestCase(TestCase):
+    def test_allocate_matches_money_allocate(self):
+        rng = random.Random(0)
+        samples = [
+            (50, 50),
+            (30, 30, 30),
+            (25, 25, 50),
+            (0, 100),
+            (0, 0),
+            (0, 1, 1, 1),
+            (70, 20, 10),
+            (1,) * 17,
+        ]
+        amounts = [0, 1, -1, 5, 11, -11, 100, 10**20 + 3] + [
+            rng.randint(-(10**9), 10**9) for _ in range(50)
+        ]
+        for ratios in samples:
+            plan = AllocationPlan(*ratios)
+            for amount in amounts:
+                money = Money(amount, "USD")
+                with self.subTest(f"check {plan} allocates {amount}"):
+                    shares = plan.allocate(money)
+                    self.assertEqual(
+                        [share.amount for share in shares],
+                        [share.amount for share in money.allocate(*ratios)],
+                    )
+                    if sum(ratios):
+                        self.assertEqual(sum(share.amount for share in shares), amount)
+
+    def test_allocate_array(self):
+        rng = random.Random(1)
+        amounts = [0, 1, -1, 11, -11] + [
+            rng.randint(-(10**9), 10**9) for _ in range(500)
+        ]
+        for ratios in ((70, 20, 10), (0, 1, 1, 1), (0, 0), (3,)):
+            plan = AllocationPlan(*ratios)
+            with self.subTest(f"check {plan} allocates an array"):
+                columns = plan.allocate_array(MoneyArray(amounts, "NGN"))
+                self.assertEqual(len(columns), len(ratios))
+                for column in columns:
+                    self.assertEqual(column.currency.code, "NGN")
+                rows = list(zip(*(column.tolist() for column in columns)))
+                self.assertEqual(
+                    rows,
+                    [
+                        tuple(m.amount for m in plan.allocate(Money(amount, "NGN")))
+                        for amount in amounts
+                    ],
+                )
+
+    def test_allocate_empty_array(self):
+        columns = AllocationPlan(1, 2).allocate_array(MoneyArray([], "USD"))
+        self.assertEqual([len(column) for column in columns], [0, 0])
+
+    def test_invalid_ratios(self):
+        with self.assertRaises(ValueError):
+            AllocationPlan()
+        with self.assertRaises(ValueError):
+            AllocationPlan(1, -1)
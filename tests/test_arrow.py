@@ -0,0 +1,67 @@
+import os
+import tempfile
+from unittest import TestCase, skipUnless
+
+from kudi import MoneyArray
+from kudi.currency_codes import CurrencyCode
+from kudi.exceptions import CurrencyMismatchError
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+@skipUnless(pyarrow, "pyarrow is not installed")
+class ArrowTestCase(TestCase):
+    def test_round_trip_shares_amounts(self):
+        from kudi.arrow import MoneyType, from_arrow, to_arrow
+
+        ma = MoneyArray([1, -2, 3], "USD")
+        column = to_arrow(ma)
+        self.assertIsInstance(column.type, MoneyType)
+        result = from_arrow(column)
+        self.assertEqual(result.tolist(), [1, -2, 3])
+        self.assertEqual(result.currency.code, CurrencyCode.USD)
+        self.assertEqual(
+            column.storage.field(0).buffers()[1].address,
+            pyarrow.py_buffer(result.amounts).address,
+        )
+
+    def test_strided_slices(self):
+        from kudi.arrow import from_arrow, to_arrow
+
+        ma = MoneyArray(range(10), "USD")
+        for sliced in (
+            ma[::2],
+            ma[::-3],
+            MoneyArray._from_view(ma._amounts[1::4], ma.currency),
+        ):
+            with self.subTest(f"check {sliced.tolist()} is exported"):
+                self.assertEqual(from_arrow(to_arrow(sliced)).tolist(), sliced.tolist())
+        self.assertEqual(from_arrow(to_arrow(ma[::2])).tolist(), [0, 2, 4, 6, 8])
+
+    def test_mixed_currency_columns(self):
+        from kudi.arrow import from_arrow, to_arrow, to_money_arrays
+
+        column = to_arrow(
+            MoneyArray([1, 2], "USD"), MoneyArray([3], "EUR"), MoneyArray([4], "USD")
+        )
+        with self.assertRaises(CurrencyMismatchError):
+            from_arrow(column)
+        parts = to_money_arrays(column)
+        self.assertEqual(parts[CurrencyCode.USD].tolist(), [1, 2, 4])
+        self.assertEqual(parts[CurrencyCode.EUR].tolist(), [3])
+        self.assertEqual(from_arrow(column.slice(2, 1)).tolist(), [3])
+
+    def test_parquet_round_trip(self):
+        from kudi.arrow import read_parquet, write_parquet
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "monies.parquet")
+            write_parquet(
+                path, gross=MoneyArray([100, 200], "NGN"), fee=MoneyArray([1, 2], "NGN")
+            )
+            columns = read_parquet(path)
+        self.assertEqual(columns["gross"].tolist(), [100, 200])
+        self.assertEqual(columns["fee"].currency.code, CurrencyCode.NGN)
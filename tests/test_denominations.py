@@ -0,0 +1,152 @@
+import math
+import random
+import time
+from unittest import TestCase
+
+from kudi import Money
+from kudi.currencies_data import DENOMINATIONS
+from kudi.denominations import breakdown, breakdown_available, is_canonical
+
+
+def _fewest_pieces(denominations, limit: int) -> list[float]:
+    pieces = [0] + [math.inf] * limit
+    for value in range(1, limit + 1):
+        for d in denominations:
+            if d <= value:
+                pieces[value] = min(pieces[value], pieces[value - d] + 1)
+    return pieces
+
+
+def _fewest_pieces_available(denominations, available, amount: int) -> float:
+    pieces = [0] + [math.inf] * amount
+    for d, count in zip(denominations, available):
+        for _ in range(count):
+            for value in range(amount, d - 1, -1):
+                pieces[value] = min(pieces[value], pieces[value - d] + 1)
+    return pieces[amount]
+
+
+def _greedy(denominations, amount: int) -> list[int]:
+    counts = []
+    for d in denominations:
+        count, amount = divmod(amount, d)
+        counts.append(count)
+    return counts
+
+
+def _random_denominations(rng: random.Random) -> tuple[int, ...]:
+    return tuple(sorted(rng.sample(range(1, 60), rng.randint(1, 5)), reverse=True))
+
+
+class DenominationsTestCase(TestCase):
+    def test_currency_denominations_are_canonical(self):
+        for code, denominations in DENOMINATIONS.items():
+            with self.subTest(f"check {code} is broken down greedily"):
+                unit = math.gcd(*denominations)
+                self.assertTrue(is_canonical(tuple(d // unit for d in denominations)))
+
+    def test_is_canonical(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            denominations = _random_denominations(rng) + (1,)
+            denominations = tuple(sorted(set(denominations), reverse=True))
+            pieces = _fewest_pieces(denominations, 200)
+            greedy_is_optimal = all(
+                sum(_greedy(denominations, value)) == pieces[value]
+                for value in range(201)
+            )
+            with self.subTest(f"check whether {denominations} is canonical"):
+                self.assertEqual(is_canonical(denominations), greedy_is_optimal)
+
+    def test_breakdown_has_the_fewest_pieces(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            denominations = _random_denominations(rng)
+            pieces = _fewest_pieces(denominations, 500)
+            for amount in range(0, 500, 7):
+                with self.subTest(f"check {amount} by {denominations}"):
+                    counts = breakdown(denominations, amount)
+                    if pieces[amount] == math.inf:
+                        self.assertIsNone(counts)
+                        continue
+                    self.assertEqual(
+                        sum(d * c for d, c in zip(denominations, counts)), amount
+                    )
+                    self.assertEqual(sum(counts), pieces[amount])
+
+    def test_breakdown_available_has_the_fewest_pieces(self):
+        rng = random.Random(2)
+        for _ in range(100):
+            denominations = _random_denominations(rng)
+            available = tuple(rng.randint(0, 4) for _ in denominations)
+            for amount in range(0, 150, 11):
+                with self.subTest(f"check {amount} by {denominations} of {available}"):
+                    counts = breakdown_available(denominations, available, amount)
+                    fewest = _fewest_pieces_available(denominations, available, amount)
+                    if fewest == math.inf:
+                        self.assertIsNone(counts)
+                        continue
+                    self.assertEqual(
+                        sum(d * c for d, c in zip(denominations, counts)), amount
+                    )
+                    self.assertTrue(all(c <= a for c, a in zip(counts, available)))
+                    self.assertEqual(sum(counts), fewest)
+
+    def test_breakdown_available_of_unmakeable_amounts_is_fast(self):
+        samples = [
+            ((500, 200, 100, 50), (1000, 1000, 1000, 0), 700_050),
+            ((500, 200, 100, 50), (800, 800, 800, 0), 300_050),
+            ((700, 300, 70, 30), (300, 300, 300, 300), 123_457),
+            ((2000, 1000, 500, 100, 25, 10, 5, 1), (50,) * 7 + (3,), 99_999),
+        ]
+        for denominations, available, amount in samples:
+            with self.subTest(f"check {amount} by {denominations} of {available}"):
+                start = time.perf_counter()
+                self.assertIsNone(
+                    breakdown_available.__wrapped__(denominations, available, amount)
+                )
+                self.assertLess(time.perf_counter() - start, 1)
+
+    def test_invalid_denominations(self):
+        with self.assertRaises(ValueError):
+            breakdown((), 5)
+        with self.assertRaises(ValueError):
+            breakdown((1, 5), 5)
+        with self.assertRaises(ValueError):
+            breakdown((5, 1), -5)
+        with self.assertRaises(ValueError):
+            breakdown_available((5, 1), (1, -1), 5)
+
+
+class MoneyBreakdownTestCase(TestCase):
+    def test_breakdown(self):
+        self.assertEqual(
+            [(m.amount, c) for m, c in Money(3_785, "USD").breakdown()],
+            [(2000, 1), (1000, 1), (500, 1), (200, 1), (25, 3), (10, 1)],
+        )
+        self.assertEqual(
+            [(m.amount, c) for m, c in Money(1_755_000, "NGN").breakdown()],
+            [(100_000, 17), (50_000, 1), (5_000, 1)],
+        )
+        self.assertEqual(Money(0, "EUR").breakdown(), [])
+
+    def test_breakdown_from_an_inventory(self):
+        atm = {5_000: 3, 2_000: 10}
+        self.assertEqual(
+            [(m.amount, c) for m, c in Money(6_000, "USD").breakdown(atm)],
+            [(2_000, 3)],
+        )
+        self.assertEqual(
+            [(m.amount, c) for m, c in Money(11_000, "USD").breakdown(atm)],
+            [(5_000, 1), (2_000, 3)],
+        )
+        with self.assertRaises(ValueError):
+            Money(1_000, "USD").breakdown(atm)
+
+    def test_breakdown_errors(self):
+        with self.assertRaises(ValueError):
+            Money(-100, "USD").breakdown()
+        with self.assertRaises(ValueError):
+            Money(1_001, "CHF").breakdown()
+        with self.assertRaises(ValueError):
+            Money(1_000, "XAF").breakdown()
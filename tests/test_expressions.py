@@ -0,0 +1,86 @@
+import random
+from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+from fractions import Fraction
+from unittest import TestCase
+
+from kudi import CurrencyMismatchError, Expr, Money, MoneyArray, expr
+
+
+def _round(value: Fraction, rounding: str) -> int:
+    return int(
+        (Decimal(value.numerator) / Decimal(value.denominator)).quantize(1, rounding)
+    )
+
+
+class ExprTestCase(TestCase):
+    def test_evaluate_matches_eager_arithmetic(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            monies = [Money(rng.randint(-(10**6), 10**6), "USD") for _ in range(8)]
+            eager = monies[0]
+            lazy = expr(monies[0])
+            for money in monies[1:]:
+                op = rng.choice("+-*")
+                if op == "+":
+                    eager, lazy = eager + money, lazy + money
+                elif op == "-":
+                    eager, lazy = eager - money, lazy - money
+                else:
+                    by = rng.randint(-5, 5)
+                    eager, lazy = eager * by, lazy * by
+            with self.subTest(f"check {lazy}"):
+                self.assertEqual(lazy.evaluate(), eager)
+
+    def test_rates_are_rounded_once(self):
+        a, b = Money(1_999, "USD"), Money(1, "USD")
+        lazy = (expr(a) * Decimal("0.075") + expr(b) / 3 - expr(a) * Fraction(1, 7)) / 2
+        exact = (Fraction(1_999 * 3, 40) + Fraction(1, 3) - Fraction(1_999, 7)) / 2
+        for rounding in (ROUND_HALF_UP, ROUND_HALF_EVEN):
+            self.assertEqual(lazy.evaluate(rounding).amount, _round(exact, rounding))
+
+    def test_nested_expressions(self):
+        a, b, c = Money(100, "NGN"), Money(30, "NGN"), Money(7, "NGN")
+        inner = (expr(b) + c) * Fraction(1, 2)
+        self.assertEqual((expr(a) - inner).evaluate(), Money(82, "NGN"))
+        self.assertEqual((a - inner).evaluate(), Money(82, "NGN"))
+        self.assertEqual((c + expr(a) * 2).evaluate(), Money(207, "NGN"))
+        self.assertEqual((-expr(a)).evaluate(), Money(-100, "NGN"))
+        self.assertIsInstance(expr(a) + b, Expr)
+
+    def test_money_arrays(self):
+        rng = random.Random(1)
+        a = MoneyArray([rng.randint(-1000, 1000) for _ in range(100)], "EUR")
+        b = MoneyArray([rng.randint(-1000, 1000) for _ in range(100)], "EUR")
+        fee = Money(25, "EUR")
+        result = (expr(a) + b * 3 - fee).evaluate()
+        self.assertIsInstance(result, MoneyArray)
+        self.assertEqual(result.tolist(), (a + b * 3 - fee).tolist())
+        result = (fee - expr(a) * Decimal("0.5")).evaluate(ROUND_HALF_EVEN)
+        self.assertEqual(
+            result.tolist(),
+            [_round(25 - Fraction(x, 2), ROUND_HALF_EVEN) for x in a.tolist()],
+        )
+        self.assertEqual((expr(fee) + a * 0).evaluate().tolist(), [25] * 100)
+        self.assertEqual((expr(a) - a + b).evaluate().tolist(), b.tolist())
+
+    def test_many_money_arrays(self):
+        arrays = [MoneyArray([i, -i, 2 * i], "EUR") for i in range(200)]
+        lazy = expr(arrays[0])
+        for i, money_array in enumerate(arrays[1:]):
+            lazy = lazy + money_array if i % 2 else lazy - money_array * 3
+        expected = arrays[0]
+        for i, money_array in enumerate(arrays[1:]):
+            expected = expected + money_array if i % 2 else expected - money_array * 3
+        self.assertEqual(lazy.evaluate().tolist(), expected.tolist())
+
+    def test_errors(self):
+        with self.assertRaises(CurrencyMismatchError):
+            (expr(Money(1, "USD")) + Money(1, "NGN")).evaluate()
+        with self.assertRaises(ValueError):
+            (expr(MoneyArray([1, 2], "USD")) + MoneyArray([1], "USD")).evaluate()
+        with self.assertRaises(ZeroDivisionError):
+            expr(Money(1, "USD")) / 0
+        with self.assertRaises(TypeError):
+            expr(Money(1, "USD")) * 1.5
+        with self.assertRaises(TypeError):
+            expr(5)
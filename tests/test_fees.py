@@ -0,0 +1,97 @@
+import random
+from decimal import ROUND_CEILING, ROUND_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+from unittest import TestCase
+
+from kudi import CurrencyMismatchError, Money, MoneyArray
+from kudi.fees import FeeSchedule, Tier
+
+# fees mirror on refunds, so the rounding modes apply to the size of the fee
+ROUND_UP_BY_SIZE = {ROUND_CEILING: "ROUND_UP"}
+
+
+def _reference_fee(amount: int, tiers: list[tuple], rounding: str) -> int:
+    size = abs(amount)
+    for up_to, bps, fixed, minimum, maximum in tiers:
+        if up_to is None or size <= up_to:
+            break
+    fee = int((Decimal(size) * Decimal(bps) / 10_000).quantize(1, rounding=rounding))
+    fee += fixed
+    if minimum is not None:
+        fee = max(fee, minimum)
+    if maximum is not None:
+        fee = min(fee, maximum)
+    return -fee if amount < 0 else fee
+
+
+class FeeScheduleTestCase(TestCase):
+    def test_apply_to_money(self):
+        schedule = FeeSchedule("NGN", Tier(bps=150, fixed=10_000, maximum=200_000))
+        samples = [
+            {"amount": 1_000_000, "fee": 25_000},
+            {"amount": 100_000_000, "fee": 200_000},
+            {"amount": 0, "fee": 10_000},
+            {"amount": -1_000_000, "fee": -25_000},
+            {"amount": 33, "fee": 10_000},
+        ]
+        for sample in samples:
+            amount = sample["amount"]
+            with self.subTest(f"check the fee on {amount} is {sample['fee']}"):
+                fees = schedule.apply(Money(amount, "NGN"))
+                self.assertEqual(fees.fee.amount, sample["fee"])
+                self.assertEqual(fees.fee.amount + fees.net.amount, amount)
+
+    def test_apply_to_money_array_matches_decimal_reference(self):
+        tiers = [
+            (10_000, 290, 30, None, None),
+            (1_000_000, Decimal("250.5"), 30, None, None),
+            (None, 200, 0, 25_000, 50_000),
+        ]
+        rng = random.Random(0)
+        amounts = [rng.randint(-(10**8), 10**8) for _ in range(2000)]
+        amounts += [0, 1, 10_000, 10_001, 1_000_000, 1_000_001, -10_000]
+        for rounding in (ROUND_HALF_UP, ROUND_HALF_EVEN, ROUND_DOWN, ROUND_CEILING):
+            with self.subTest(f"check fees rounded with {rounding}"):
+                schedule = FeeSchedule(
+                    "USD",
+                    *(Tier(*tier) for tier in tiers),
+                    rounding=rounding,
+                )
+                fees = schedule.apply(MoneyArray(amounts, "USD"))
+                expected_rounding = ROUND_UP_BY_SIZE.get(rounding, rounding)
+                self.assertEqual(
+                    fees.fee.tolist(),
+                    [_reference_fee(a, tiers, expected_rounding) for a in amounts],
+                )
+                self.assertEqual(
+                    [f + n for f, n in zip(fees.fee.tolist(), fees.net.tolist())],
+                    amounts,
+                )
+
+    def test_tiers_accept_monies(self):
+        schedule = FeeSchedule(
+            "USD",
+            Tier(up_to=Money(10_000, "USD"), bps=100),
+            Tier(fixed=Money(500, "USD")),
+        )
+        self.assertEqual(schedule.apply(Money(10_000, "USD")).fee.amount, 100)
+        self.assertEqual(schedule.apply(Money(10_001, "USD")).fee.amount, 500)
+        with self.assertRaises(CurrencyMismatchError):
+            FeeSchedule("USD", Tier(fixed=Money(500, "EUR")))
+        with self.assertRaises(CurrencyMismatchError):
+            schedule.apply(Money(1, "EUR"))
+
+    def test_invalid_schedules(self):
+        samples = [
+            (),
+            (Tier(up_to=100),),
+            (Tier(), Tier()),
+            (Tier(up_to=100), Tier(up_to=50), Tier()),
+            (Tier(bps=-1),),
+            (Tier(minimum=10, maximum=5),),
+        ]
+        for tiers in samples:
+            with self.subTest(f"check {tiers} is rejected"):
+                with self.assertRaises(ValueError):
+                    FeeSchedule("USD", *tiers)
+        with self.assertRaises(ValueError):
+            FeeSchedule("USD", Tier(), rounding="ROUND_SIDEWAYS")
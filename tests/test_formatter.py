@@ -0,0 +1,147 @@
+from unittest import TestCase
+
+from kudi import Money
+from kudi.formatter import (
+    ACCOUNTING_STYLE,
+    INDIAN_STYLE,
+    NBSP_STYLE,
+    FormatPlan,
+    FormatStyle,
+    Formatter,
+)
+
+
+class FormatterTestCase(TestCase):
+    def test_compiles_template_into_plan(self):
+        samples = [
+            {"template": "$1", "expected": ("£", "", "-£", "")},
+            {"template": "1 $", "expected": ("", " £", "-", " £")},
+            {"template": "$ 1", "expected": ("£ ", "", "-£ ", "")},
+        ]
+        for sample in samples:
+            template = sample["template"]
+            with self.subTest(f"check the plan compiled from the template {template}"):
+                plan = FormatPlan.compile(2, ".", ",", "£", template)
+                self.assertEqual(
+                    (
+                        plan.prefix,
+                        plan.suffix,
+                        plan.negative_prefix,
+                        plan.negative_suffix,
+                    ),
+                    sample["expected"],
+                )
+
+    def test_symbol_containing_the_digit_placeholder(self):
+        formatter = Formatter(2, ".", ",", "C1$", "1 $")
+        self.assertEqual(formatter.format(-123456), "-1,234.56 C1$")
+
+    def test_format_across_currency_styles(self):
+        samples = [
+            {"amount": 123_456_789, "code": "USD", "expected": "$1,234,567.89"},
+            {"amount": -5, "code": "USD", "expected": "-$0.05"},
+            {"amount": 123_456, "code": "JPY", "expected": "¥123,456"},
+            {"amount": 1_234_567, "code": "BHD", "expected": "1,234.567 .د.ب"},
+            {"amount": 123_456_789, "code": "BRL", "expected": "R$1.234.567,89"},
+            {"amount": -100, "code": "AED", "expected": "-1.00 .د.إ"},
+        ]
+        for sample in samples:
+            amount = sample["amount"]
+            code = sample["code"]
+            expected = sample["expected"]
+            with self.subTest(f"check {code} {amount} is formatted as {expected}"):
+                self.assertEqual(str(Money(amount, code)), expected)
+
+    def test_plan_can_be_reused_for_batches(self):
+        plan = Money(0, "USD").currency.formatter.plan
+        self.assertEqual(
+            plan.format_many([1, -100, 100_000]), ["$0.01", "-$1.00", "$1,000.00"]
+        )
+        self.assertEqual(plan.digits(123_456), "1,234.56")
+
+    def test_currency_formatter_is_cached(self):
+        currency = Money(0, "EUR").currency
+        self.assertIs(currency.formatter, currency.formatter)
+
+    def test_format_with_styles(self):
+        samples = [
+            {
+                "amount": 123_456_789,
+                "code": "INR",
+                "style": INDIAN_STYLE,
+                "expected": "₹12,34,567.89",
+            },
+            {
+                "amount": 123_456_789_012,
+                "code": "INR",
+                "style": INDIAN_STYLE,
+                "expected": "₹1,23,45,67,890.12",
+            },
+            {
+                "amount": 99_999,
+                "code": "INR",
+                "style": INDIAN_STYLE,
+                "expected": "₹999.99",
+            },
+            {
+                "amount": -123_456,
+                "code": "USD",
+                "style": ACCOUNTING_STYLE,
+                "expected": "($1,234.56)",
+            },
+            {
+                "amount": 123_456,
+                "code": "USD",
+                "style": ACCOUNTING_STYLE,
+                "expected": "$1,234.56",
+            },
+            {
+                "amount": 123_456_789,
+                "code": "USD",
+                "style": NBSP_STYLE,
+                "expected": "$1\u00a0234\u00a0567.89",
+            },
+            {
+                "amount": 123_456_789,
+                "code": "USD",
+                "style": FormatStyle(thousand_delimiter=""),
+                "expected": "$1234567.89",
+            },
+            {
+                "amount": 123_456_789,
+                "code": "USD",
+                "style": FormatStyle(primary_group=4),
+                "expected": "$123,4567.89",
+            },
+            {
+                "amount": -100,
+                "code": "AED",
+                "style": ACCOUNTING_STYLE,
+                "expected": "(1.00 .د.إ)",
+            },
+        ]
+        for sample in samples:
+            amount = sample["amount"]
+            code = sample["code"]
+            expected = sample["expected"]
+            with self.subTest(f"check {code} {amount} is formatted as {expected}"):
+                self.assertEqual(Money(amount, code).format(sample["style"]), expected)
+
+    def test_style_plans_are_cached(self):
+        formatter = Money(0, "INR").currency.formatter
+        self.assertIs(formatter.plan_for(None), formatter.plan)
+        self.assertIs(
+            formatter.plan_for(INDIAN_STYLE), formatter.plan_for(INDIAN_STYLE)
+        )
+        self.assertIs(
+            formatter.plan_for(INDIAN_STYLE),
+            formatter.plan_for(FormatStyle(primary_group=3, secondary_group=2)),
+        )
+
+    def test_invalid_styles(self):
+        with self.assertRaises(ValueError):
+            Money(0, "USD").format(FormatStyle(primary_group=0))
+        with self.assertRaises(ValueError):
+            Money(0, "USD").format(FormatStyle(secondary_group=0))
+        with self.assertRaises(ValueError):
+            Money(0, "USD").format(FormatStyle(negative_style="brackets"))
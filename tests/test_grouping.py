@@ -0,0 +1,84 @@
+from dataclasses import replace
+from unittest import TestCase
+
+from kudi import (
+    CurrencyCode,
+    Money,
+    group_by_currency,
+    summarize_by_currency,
+    totals_by_currency,
+)
+
+
+def _monies() -> list[Money]:
+    return [
+        Money(150, "USD"),
+        Money(300, "NGN"),
+        Money(-20, "usd"),
+        Money(5, "JPY"),
+        Money(70, 840),
+        Money(-300, "NGN"),
+    ]
+
+
+class GroupingTestCase(TestCase):
+    def test_group_by_currency(self):
+        groups = group_by_currency(_monies())
+        self.assertEqual(
+            {code: [m.amount for m in monies] for code, monies in groups.items()},
+            {
+                CurrencyCode.USD: [150, -20, 70],
+                CurrencyCode.NGN: [300, -300],
+                CurrencyCode.JPY: [5],
+            },
+        )
+
+    def test_totals_by_currency(self):
+        totals = totals_by_currency(_monies())
+        self.assertEqual(
+            {code: (m.amount, m.currency.code) for code, m in totals.items()},
+            {
+                CurrencyCode.USD: (200, CurrencyCode.USD),
+                CurrencyCode.NGN: (0, CurrencyCode.NGN),
+                CurrencyCode.JPY: (5, CurrencyCode.JPY),
+            },
+        )
+
+    def test_summarize_by_currency(self):
+        summaries = summarize_by_currency(_monies())
+        usd = summaries[CurrencyCode.USD]
+        self.assertEqual(
+            (usd.count, usd.total.amount, usd.min.amount, usd.max.amount),
+            (3, 200, -20, 150),
+        )
+        jpy = summaries[CurrencyCode.JPY]
+        self.assertEqual(
+            (jpy.count, jpy.total.amount, jpy.min.amount, jpy.max.amount),
+            (1, 5, 5, 5),
+        )
+
+    def test_empty(self):
+        self.assertEqual(group_by_currency([]), {})
+        self.assertEqual(totals_by_currency(iter([])), {})
+        self.assertEqual(summarize_by_currency([]), {})
+
+    def test_equal_currencies_that_are_distinct_objects_are_merged(self):
+        usd = Money(0, "USD").currency
+        copy = replace(usd)
+        monies = [Money(1, "USD"), Money._from_minor_units(2, copy)]
+        self.assertEqual(totals_by_currency(monies)[CurrencyCode.USD].amount, 3)
+        self.assertEqual(len(group_by_currency(monies)[CurrencyCode.USD]), 2)
+        self.assertEqual(summarize_by_currency(monies)[CurrencyCode.USD].count, 2)
+
+    def test_grouping_keeps_order_of_interleaved_equal_currencies(self):
+        copy = replace(Money(0, "USD").currency)
+        monies = [
+            Money(1, "USD"),
+            Money._from_minor_units(2, copy),
+            Money(3, "USD"),
+            Money._from_minor_units(4, copy),
+        ]
+        self.assertEqual(
+            [m.amount for m in group_by_currency(monies)[CurrencyCode.USD]],
+            [1, 2, 3, 4],
+        )
@@ -0,0 +1,67 @@
+import timeit
+from unittest import TestCase
+
+from kudi import Money, hooks
+
+
+class HooksTestCase(TestCase):
+    def setUp(self):
+        self.operations = []
+
+    def tearDown(self):
+        hooks.clear()
+
+    def test_hooks_receive_operations(self):
+        hooks.on_operation(self.operations.append)
+        money = Money(1000, "USD")
+        money.split(3)
+        money.allocate(1, 2, 3, 4)
+        money.currency.formatter.plan.format_many([1, 2])
+        money.currency.parser.plan.parse_many(["$1.00"])
+        self.assertEqual(
+            [(op.name, op.size, op.code) for op in self.operations],
+            [
+                ("split", 3, "USD"),
+                ("allocate", 4, "USD"),
+                ("format_many", 2, None),
+                ("parse_many", 1, "USD"),
+            ],
+        )
+        for operation in self.operations:
+            self.assertGreater(operation.elapsed_ns, 0)
+
+    def test_remove_hook(self):
+        remove = hooks.on_operation(self.operations.append)
+        remove()
+        remove()
+        Money(1000, "USD").split(3)
+        self.assertEqual(self.operations, [])
+        self.assertEqual(hooks._max_sample_rate, 0)
+
+    def test_sampling(self):
+        sampled = []
+        hooks.on_operation(self.operations.append)
+        hooks.on_operation(sampled.append, sample_rate=0.1)
+        money = Money(1000, "USD")
+        for _ in range(2000):
+            money.split(2)
+        self.assertEqual(len(self.operations), 2000)
+        self.assertTrue(100 < len(sampled) < 300, len(sampled))
+
+    def test_invalid_sample_rate(self):
+        for rate in (0, -1, 1.5):
+            with self.subTest(f"check a sample rate of {rate} is rejected"):
+                with self.assertRaises(ValueError):
+                    hooks.on_operation(self.operations.append, sample_rate=rate)
+
+    def test_overhead_without_hooks_is_under_two_percent(self):
+        # operations pay for the `hooks._hooks` check twice when no hook is registered
+        money = Money(123_456_789, "USD")
+        check = timeit.Timer(
+            "start = hooks._start() if hooks._hooks else 0\nif start: pass",
+            globals={"hooks": hooks},
+        )
+        split = timeit.Timer(lambda: money.split(10))
+        check_time = min(check.repeat(repeat=5, number=10_000)) / 10_000
+        split_time = min(split.repeat(repeat=5, number=200)) / 200
+        self.assertLess(check_time / split_time, 0.02)
@@ -0,0 +1,121 @@
+import threading
+from decimal import Decimal
+from unittest import TestCase
+
+import kudi
+from kudi import CurrencyCode, Money, instrumentation
+from kudi.formatter import INDIAN_STYLE, Formatter
+
+
+class InstrumentationTestCase(TestCase):
+    def setUp(self):
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_nothing_is_counted_when_disabled(self):
+        str(Money(150, "USD"))
+        self.assertEqual(kudi.stats().constructions, {})
+        self.assertEqual(kudi.stats().formats, 0)
+
+    def test_disable_restores_the_original_methods(self):
+        originals = (
+            Money.__dict__["__init__"],
+            Money.__dict__["_from_minor_units"],
+            Money.__dict__["_resolve_currency"],
+            Formatter.__dict__["format"],
+        )
+        instrumentation.enable()
+        self.assertTrue(instrumentation.is_enabled())
+        self.assertIsNot(Money.__dict__["__init__"], originals[0])
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertEqual(
+            (
+                Money.__dict__["__init__"],
+                Money.__dict__["_from_minor_units"],
+                Money.__dict__["_resolve_currency"],
+                Formatter.__dict__["format"],
+            ),
+            originals,
+        )
+
+    def test_enable_and_disable_nest(self):
+        original = Money.__dict__["__init__"]
+        instrumentation.enable()
+        instrumentation.enable()
+        instrumentation.disable()
+        self.assertTrue(instrumentation.is_enabled())
+        Money(150, "USD")
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(Money.__dict__["__init__"], original)
+        instrumentation.disable()
+        self.assertIs(Money.__dict__["__init__"], original)
+        self.assertEqual(kudi.stats().constructions, {"int": 1})
+
+    def test_enable_and_disable_from_threads(self):
+        original = Money.__dict__["__init__"]
+
+        def toggle():
+            for _ in range(200):
+                instrumentation.enable()
+                Money(1, "USD")
+                instrumentation.disable()
+
+        threads = [threading.Thread(target=toggle) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(Money.__dict__["__init__"], original)
+
+    def test_counts_are_exact_across_threads(self):
+        instrumentation.enable()
+
+        def construct():
+            for _ in range(2_000):
+                Money(1, "USD")
+
+        threads = [threading.Thread(target=construct) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(kudi.stats().constructions, {"int": 16_000})
+        self.assertEqual(kudi.stats().lookups, {"alpha": 16_000})
+
+    def test_counts_constructions_and_lookups(self):
+        instrumentation.enable()
+        Money(150, "USD")
+        Money(1.5, "usd")
+        Money(Decimal("1.5"), CurrencyCode.USD)
+        Money("1.5", 840)
+        Money._from_minor_units(150, Money(0, "USD").currency)
+        stats = kudi.stats()
+        self.assertEqual(
+            stats.constructions,
+            {"int": 2, "float": 1, "Decimal": 1, "str": 1, "minor_units": 1},
+        )
+        self.assertEqual(
+            stats.lookups,
+            {"alpha": 2, "alpha_normalized": 1, "enum": 1, "numeric": 1},
+        )
+        self.assertGreater(stats.lookup_ns, 0)
+
+    def test_counts_formats_and_cache_hits(self):
+        instrumentation.enable()
+        money = Money(123_456_789, "INR")
+        formatter = money.currency.formatter
+        formatter._plans.pop(INDIAN_STYLE, None)
+        str(money)
+        money.format(INDIAN_STYLE)
+        money.format(INDIAN_STYLE)
+        stats = kudi.stats(reset=True)
+        self.assertEqual(stats.formats, 3)
+        self.assertEqual(stats.format_cache_misses, 1)
+        self.assertEqual(stats.format_cache_hits, 1)
+        self.assertEqual(kudi.stats().formats, 0)
@@ -0,0 +1,75 @@
+import io
+import json
+from unittest import TestCase
+
+from kudi import Money
+from kudi.exceptions import InvalidCurrencyAlphaCodeError
+from kudi.json import (
+    default,
+    dump_ndjson,
+    dumps,
+    from_dict,
+    load_ndjson,
+    loads,
+    object_hook,
+)
+
+
+class JSONTestCase(TestCase):
+    def test_default_encodes_money_in_subunit(self):
+        self.assertEqual(
+            json.dumps(Money(-150, "usd"), default=default),
+            '{"amount": -150, "currency": "USD"}',
+        )
+
+    def test_default_rejects_other_types(self):
+        with self.assertRaises(TypeError):
+            json.dumps(object(), default=default)
+
+    def test_object_hook_decodes_money(self):
+        samples = [
+            {"payload": '{"amount": 150, "currency": "USD"}', "expected": (150, "USD")},
+            {"payload": '{"amount": -1, "currency": "eur"}', "expected": (-1, "EUR")},
+            {"payload": '{"amount": 5, "currency": 840}', "expected": (5, "USD")},
+        ]
+        for sample in samples:
+            payload = sample["payload"]
+            amount, code = sample["expected"]
+            with self.subTest(f"check that {payload} decodes to {code} {amount}"):
+                m = json.loads(payload, object_hook=object_hook)
+                self.assertEqual(m.amount, amount)
+                self.assertEqual(m.currency.code, code)
+
+    def test_object_hook_leaves_other_objects_alone(self):
+        payload = '{"amount": 1, "currency": "USD", "note": "x"}'
+        self.assertEqual(
+            json.loads(payload, object_hook=object_hook),
+            {"amount": 1, "currency": "USD", "note": "x"},
+        )
+
+    def test_from_dict_raises_on_invalid_currency(self):
+        with self.assertRaises(InvalidCurrencyAlphaCodeError):
+            from_dict({"amount": 1, "currency": "BTC"})
+
+    def test_from_dict_rejects_non_int_amounts(self):
+        for amount in (1.5, 150.0, "150", True, None):
+            with self.subTest(f"check that {amount!r} is rejected"):
+                with self.assertRaises(ValueError):
+                    from_dict({"amount": amount, "currency": "USD"})
+        with self.assertRaises(ValueError):
+            loads('{"amount": 1.5, "currency": "USD"}')
+
+    def test_dumps_and_loads_round_trip(self):
+        payload = {"total": Money(12_345, "NGN"), "lines": [Money(1, "JPY")]}
+        decoded = loads(dumps(payload))
+        self.assertEqual(decoded["total"], payload["total"])
+        self.assertEqual(decoded["lines"][0], payload["lines"][0])
+
+    def test_ndjson_round_trip(self):
+        monies = [Money(i - 5, code) for i, code in enumerate(["USD", "EUR"] * 5)]
+        fp = io.StringIO()
+        self.assertEqual(dump_ndjson(monies, fp), len(monies))
+        fp.write("\n")
+        fp.seek(0)
+        decoded = list(load_ndjson(fp))
+        self.assertEqual([repr(m) for m in decoded], [repr(m) for m in monies])
@@ -0,0 +1,69 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from kudi import InvalidLedgerFileError, Money, MoneyArray
+from kudi.currency_codes import CurrencyCode
+from kudi.exceptions import CurrencyMismatchError
+from kudi.ledger import Ledger, SignCounts
+
+
+class LedgerTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "payouts.ledger")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_can_create_and_append_to_ledger(self):
+        with Ledger.create(self.path, "ngn") as ledger:
+            self.assertEqual(len(ledger), 0)
+            self.assertEqual(ledger.append(MoneyArray([150, -20], "NGN")), 2)
+            self.assertEqual(ledger.append(Money(0, "NGN")), 1)
+            self.assertEqual(ledger.append([7, 8]), 2)
+            self.assertEqual(ledger.money_array().tolist(), [150, -20, 0, 7, 8])
+        with Ledger(self.path) as ledger:
+            self.assertEqual(ledger.currency.code, CurrencyCode.NGN)
+            self.assertEqual(ledger.money_array(1, 3).tolist(), [-20, 0])
+        with Ledger(self.path, writable=True) as ledger:
+            ledger.append([1])
+            self.assertEqual(len(ledger), 6)
+
+    def test_append_rules(self):
+        with Ledger.create(self.path, "USD") as ledger:
+            with self.assertRaises(CurrencyMismatchError):
+                ledger.append(MoneyArray([1], "EUR"))
+        with Ledger(self.path) as ledger:
+            with self.assertRaises(InvalidLedgerFileError):
+                ledger.append([1])
+
+    def test_chunked_reductions(self):
+        amounts = [5, -3, 0, 12, -7, 0, 1]
+        with Ledger.create(self.path, "EUR") as ledger:
+            ledger.append(amounts)
+        with Ledger(self.path) as ledger:
+            for chunk_size in (1, 2, 3, 100):
+                with self.subTest(f"check reductions with chunks of {chunk_size}"):
+                    self.assertEqual(
+                        [c.tolist() for c in ledger.chunks(chunk_size)][0],
+                        amounts[:chunk_size],
+                    )
+                    self.assertEqual(ledger.sum(chunk_size).amount, sum(amounts))
+                    self.assertEqual(ledger.min(chunk_size).amount, -7)
+                    self.assertEqual(ledger.max(chunk_size).amount, 12)
+                    self.assertEqual(
+                        ledger.count_by_sign(chunk_size), SignCounts(2, 2, 3)
+                    )
+
+    def test_opening_invalid_files_raises_error(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a ledger at all, not even close")
+        with self.assertRaises(InvalidLedgerFileError):
+            Ledger(self.path)
+        with Ledger.create(self.path, "USD") as ledger:
+            ledger.append([1, 2, 3])
+        with open(self.path, "r+b") as f:
+            f.truncate(40)
+        with self.assertRaises(InvalidLedgerFileError):
+            Ledger(self.path)
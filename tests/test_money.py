@@ -1,8 +1,23 @@
-from decimal import Decimal
+from decimal import (
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP,
+    Decimal,
+)
+from fractions import Fraction
 from unittest import TestCase
 from kudi import Money
+from kudi.money import minor_units
+from kudi.currency import CURRENCIES, CURRENCIES_BY_ID
 from kudi.currency_codes import CurrencyCode
-from kudi.exceptions import InvalidCurrencyAlphaCodeError, CurrencyMismatchError
+from kudi.exceptions import (
+    InvalidCurrencyAlphaCodeError,
+    InvalidCurrencyCodeError,
+    CurrencyMismatchError,
+)
 
 
 class MoneyTestCase(TestCase):
@@ -53,6 +68,28 @@ class MoneyTestCase(TestCase):
                 self.assertEqual(
                     m.amount, expected, f"Expected {expected} got {m.amount}"
                 )
+                self.assertIsInstance(m.amount, int)
+
+    def test_creating_money_obj_from_str_amount(self):
+        samples = [
+            {"amount": "1.50", "expected": 150},
+            {"amount": "-1.50", "expected": -150},
+            {"amount": "1.459", "expected": 146},
+            {"amount": "100", "expected": 10000},
+        ]
+        for sample in samples:
+            amount = sample["amount"]
+            expected = sample["expected"]
+            with self.subTest(
+                f"check that creating money from a str value of {amount}"
+                " results in a money with the amount of {expected}"
+            ):
+                m = Money(amount, "NGN")
+                self.assertEqual(m.amount, expected)
+        for amount in ("", "1,50", "NaN", "abc", "1e30"):
+            with self.subTest(f"check that `{amount}` is rejected"):
+                with self.assertRaises(ValueError):
+                    Money(amount, "NGN")
 
     def test_money_raises_error_on_wrong_currency(self):
         with self.assertRaises(InvalidCurrencyAlphaCodeError) as context:
@@ -406,6 +443,156 @@ class MoneyTestCase(TestCase):
                     else f"expected {repr(m1)} * {repr(m2)} to be {expected}",
                 )
 
+    def test_can_multiply_money_by_rates(self):
+        samples = [
+            {"amount": 1999, "by": Decimal("0.075"), "expected": 150},
+            {"amount": -1999, "by": Decimal("0.075"), "expected": -150},
+            {"amount": 100, "by": Fraction(1, 3), "expected": 33},
+            {"amount": 200, "by": Fraction(1, 3), "expected": 67},
+            {"amount": 250, "by": Decimal("0.01"), "expected": 3},
+            {
+                "amount": 250,
+                "by": Decimal("0.01"),
+                "rounding": ROUND_HALF_EVEN,
+                "expected": 2,
+            },
+            {
+                "amount": 350,
+                "by": Decimal("0.01"),
+                "rounding": ROUND_HALF_EVEN,
+                "expected": 4,
+            },
+            {
+                "amount": 199,
+                "by": Decimal("0.01"),
+                "rounding": ROUND_DOWN,
+                "expected": 1,
+            },
+            {
+                "amount": -199,
+                "by": Decimal("0.01"),
+                "rounding": ROUND_FLOOR,
+                "expected": -2,
+            },
+            {
+                "amount": 101,
+                "by": Decimal("0.01"),
+                "rounding": ROUND_CEILING,
+                "expected": 2,
+            },
+            {
+                "amount": -101,
+                "by": Decimal("0.01"),
+                "rounding": ROUND_UP,
+                "expected": -2,
+            },
+            {"amount": 7, "by": 3, "expected": 21},
+        ]
+        for sample in samples:
+            amount = sample["amount"]
+            by = sample["by"]
+            rounding = sample.get("rounding", ROUND_HALF_UP)
+            expected = sample["expected"]
+            with self.subTest(f"check {amount} * {by} with {rounding} is {expected}"):
+                self.assertEqual(
+                    Money(amount, "USD").multiply(by, rounding).amount, expected
+                )
+                if rounding == ROUND_HALF_UP:
+                    self.assertEqual((Money(amount, "USD") * by).amount, expected)
+                    self.assertEqual((by * Money(amount, "USD")).amount, expected)
+
+    def test_can_take_basis_points_of_money(self):
+        money = Money(1_000_000, "USD")
+        self.assertEqual(money.basis_points(35).amount, 3500)
+        self.assertEqual(money.basis_points(Decimal("2.5")).amount, 250)
+        self.assertEqual(Money(1999, "USD").basis_points(35).amount, 7)
+        self.assertEqual(Money(1999, "USD").basis_points(35, ROUND_DOWN).amount, 6)
+
+    def test_multiplying_money_by_invalid_rates_raises_error(self):
+        money = Money(100, "USD")
+        with self.assertRaises(TypeError):
+            money * 1.5
+        with self.assertRaises(TypeError):
+            money.multiply("0.5")
+        with self.assertRaises(ValueError):
+            money.multiply(Decimal("NaN"))
+        with self.assertRaises(ValueError):
+            money.multiply(Decimal("0.5"), "ROUND_SIDEWAYS")
+
+    def test_can_divide_money(self):
+        samples = [
+            {"amount": 100, "by": 3, "expected": 33},
+            {"amount": 200, "by": 3, "expected": 67},
+            {"amount": -101, "by": 4, "expected": -25},
+            {"amount": 10, "by": 4, "expected": 3},
+            {"amount": 10, "by": 4, "rounding": ROUND_HALF_EVEN, "expected": 2},
+            {"amount": -10, "by": 4, "rounding": ROUND_FLOOR, "expected": -3},
+            {"amount": -10, "by": 4, "rounding": ROUND_DOWN, "expected": -2},
+            {"amount": 150, "by": Decimal("1.5"), "expected": 100},
+            {"amount": 100, "by": Fraction(2, 3), "expected": 150},
+            {"amount": 10**30 + 7, "by": 3, "expected": 333333333333333333333333333336},
+        ]
+        for sample in samples:
+            amount = sample["amount"]
+            by = sample["by"]
+            rounding = sample.get("rounding", ROUND_HALF_UP)
+            expected = sample["expected"]
+            with self.subTest(f"check {amount} / {by} with {rounding} is {expected}"):
+                money = Money(amount, "USD")
+                self.assertEqual(money.divide(by, rounding).amount, expected)
+                if rounding == ROUND_HALF_UP:
+                    self.assertEqual((money / by).amount, expected)
+
+    def test_can_floor_divide_money(self):
+        self.assertEqual((Money(-101, "USD") // 4).amount, -26)
+        self.assertEqual((Money(101, "USD") // 4).amount, 25)
+        self.assertEqual((Money(100, "USD") // Decimal("0.3")).amount, 333)
+
+    def test_can_divmod_money(self):
+        for amount, by in ((-101, 4), (101, 4), (101, -4), (10**30 + 7, 3)):
+            with self.subTest(f"check divmod({amount}, {by})"):
+                quotient, remainder = divmod(Money(amount, "USD"), by)
+                self.assertEqual(
+                    (quotient.amount, remainder.amount), divmod(amount, by)
+                )
+                self.assertEqual((Money(amount, "USD") % by).amount, amount % by)
+
+    def test_can_divmod_money_by_rates(self):
+        samples = [
+            (100, Decimal("1.5"), 66, 1),
+            (100, Decimal("2.5"), 40, 0),
+            (-101, Decimal("1.5"), -68, 1),
+            (101, Decimal("-1.5"), -68, -1),
+            (100, Fraction(1, 3), 300, 0),
+            (101, Fraction(4, 3), 75, 1),
+        ]
+        for amount, by, quotient, remainder in samples:
+            with self.subTest(f"check divmod({amount}, {by!r})"):
+                money = Money(amount, "USD")
+                q, r = divmod(money, by)
+                self.assertEqual((q.amount, r.amount), (quotient, remainder))
+                self.assertEqual(q, money // by)
+                self.assertEqual((money % by).amount, remainder)
+        with self.assertRaises(ValueError):
+            divmod(Money(100, "USD"), Decimal("0.3"))
+
+    def test_dividing_money_by_zero_raises_error(self):
+        money = Money(100, "USD")
+        for by in (0, Decimal(0), Fraction(0)):
+            with self.subTest(f"check dividing by {by!r} raises an error"):
+                with self.assertRaises(ZeroDivisionError):
+                    money / by
+        for by in (0, Decimal(0), Fraction(0)):
+            with self.subTest(f"check divmod by {by!r} raises an error"):
+                with self.assertRaises(ZeroDivisionError):
+                    divmod(money, by)
+        with self.assertRaises(TypeError):
+            divmod(money, 1.5)
+        with self.assertRaises(TypeError):
+            money % 1.5
+        with self.assertRaises(TypeError):
+            money / 1.5
+
     def test_can_round_money(self):
         samples = [
             {"amount": 125, "expected": 100},
@@ -432,6 +619,77 @@ class MoneyTestCase(TestCase):
         m = Money(12_555, "bhd")
         self.assertEqual(round(m).amount, 13_000)
 
+    def test_can_round_money_to_an_increment(self):
+        samples = [
+            {
+                "amount": 1232,
+                "code": "CHF",
+                "rounding": ROUND_HALF_UP,
+                "expected": 1230,
+            },
+            {
+                "amount": 1233,
+                "code": "CHF",
+                "rounding": ROUND_HALF_UP,
+                "expected": 1235,
+            },
+            {
+                "amount": -1233,
+                "code": "CHF",
+                "rounding": ROUND_HALF_UP,
+                "expected": -1235,
+            },
+            {"amount": 1299, "code": "SEK", "rounding": ROUND_FLOOR, "expected": 1200},
+            {
+                "amount": -1201,
+                "code": "SEK",
+                "rounding": ROUND_FLOOR,
+                "expected": -1300,
+            },
+            {
+                "amount": 1225,
+                "code": "NZD",
+                "rounding": ROUND_HALF_EVEN,
+                "expected": 1220,
+            },
+            {
+                "amount": 1235,
+                "code": "NZD",
+                "rounding": ROUND_HALF_EVEN,
+                "expected": 1240,
+            },
+            {
+                "amount": 1233,
+                "code": "USD",
+                "rounding": ROUND_HALF_UP,
+                "expected": 1233,
+            },
+            {
+                "amount": 12_345,
+                "code": "NGN",
+                "rounding": ROUND_HALF_UP,
+                "expected": 12_350,
+            },
+        ]
+        for sample in samples:
+            with self.subTest(
+                f"check {sample['amount']} {sample['code']} rounds to {sample['expected']} in cash"
+            ):
+                m = Money(sample["amount"], sample["code"]).round_to(
+                    rounding=sample["rounding"]
+                )
+                self.assertEqual(m.amount, sample["expected"])
+        self.assertEqual(Money(12_345, "NGN").round_to(500).amount, 12_500)
+        self.assertEqual(
+            Money(12_345, "NGN").round_to(Money(1_000, "NGN"), ROUND_UP).amount, 13_000
+        )
+        with self.assertRaises(ValueError):
+            Money(12_345, "NGN").round_to(0)
+        with self.assertRaises(ValueError):
+            Money(12_345, "NGN").round_to(5, "ROUND_SIDEWAYS")
+        with self.assertRaises(CurrencyMismatchError):
+            Money(12_345, "NGN").round_to(Money(5, "CHF"))
+
     def test_can_split_money(self):
         samples = [
             {"amount": 100, "split": 3, "expected": [34, 33, 33]},
@@ -462,6 +720,9 @@ class MoneyTestCase(TestCase):
             {"amount": 0, "ratio": [50, 10], "expected": [0, 0]},
             {"amount": 10, "ratio": [0, 100], "expected": [0, 10]},
             {"amount": 10, "ratio": [0, 0], "expected": [0, 0]},
+            {"amount": 11, "ratio": [1, 1, 1], "expected": [4, 4, 3]},
+            {"amount": 11, "ratio": [0, 1, 1, 1], "expected": [0, 4, 4, 3]},
+            {"amount": -11, "ratio": [1, 1, 1], "expected": [-3, -4, -4]},
         ]
         for sample in samples:
             amount = sample["amount"]
@@ -473,7 +734,11 @@ class MoneyTestCase(TestCase):
                 self.assertListEqual(splits, expected)
 
     def test_money_str_representation(self):
-        samples = [{"amount": 100, "code": "gbp", "expected": "£1.00"}]
+        samples = [
+            {"amount": 100, "code": "gbp", "expected": "£1.00"},
+            {"amount": 123_456_789, "code": "usd", "expected": "$1,234,567.89"},
+            {"amount": -100_000, "code": "jpy", "expected": "-¥100,000"},
+        ]
         for sample in samples:
             amount = sample["amount"]
             code = sample["code"]
@@ -500,6 +765,31 @@ class MoneyTestCase(TestCase):
                 m = Money(amount, code)
                 self.assertEqual(repr(m), expected)
 
+    def test_minor_units(self):
+        usd = Money(0, "USD").currency
+        self.assertEqual(minor_units(150, usd), 150)
+        self.assertEqual(minor_units(Money(150, "USD"), usd), 150)
+        with self.assertRaises(CurrencyMismatchError):
+            minor_units(Money(150, "EUR"), usd)
+
+    def test_currency_ids(self):
+        ids = [currency.id for currency in CURRENCIES.values()]
+        self.assertEqual(sorted(ids), list(range(len(CurrencyCode))))
+        self.assertLess(max(ids), 2**16)
+        for currency_id, currency in enumerate(CURRENCIES_BY_ID):
+            with self.subTest(f"check {currency.code} round trips through its id"):
+                self.assertEqual(currency.id, currency_id)
+                m = Money.from_currency_id(150, currency_id)
+                self.assertIs(m.currency, currency)
+                self.assertEqual(m.currency_id, currency_id)
+        # ids are stored, so they must never change
+        self.assertEqual(Money(1, "AED").currency_id, 0)
+        self.assertEqual(Money(1, "USD").currency_id, 156)
+        self.assertEqual(Money.from_currency_id("1.5", 156), Money(150, "USD"))
+        for invalid in (-1, len(CURRENCIES_BY_ID)):
+            with self.assertRaises(InvalidCurrencyCodeError):
+                Money.from_currency_id(1, invalid)
+
     def test_money_as_major_unit(self):
         samples = [
             {"amount": 100, "code": "aed", "expected": Decimal("1.0")},
@@ -0,0 +1,142 @@
+from array import array
+from decimal import ROUND_CEILING, ROUND_HALF_EVEN, Decimal
+from unittest import TestCase, skipUnless
+
+from kudi import Money, MoneyArray
+from kudi.calculator import ROUNDING_MODES
+from kudi.currency_codes import CurrencyCode
+from kudi.exceptions import CurrencyMismatchError
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class MoneyArrayTestCase(TestCase):
+    def test_can_create_money_array(self):
+        samples = [
+            {"amounts": [1, -2, 3], "description": "a list"},
+            {"amounts": array("q", [1, -2, 3]), "description": "an int64 array"},
+            {"amounts": array("q", [1, -2, 3]).tobytes(), "description": "raw bytes"},
+            {"amounts": array("i", [1, -2, 3]), "description": "an int32 array"},
+            {"amounts": array("h", [1, -2, 3]), "description": "an int16 array"},
+            {"amounts": array("l", [1, -2, 3]), "description": "a long array"},
+        ]
+        for sample in samples:
+            with self.subTest(
+                f"check that a money array can be created from {sample['description']}"
+            ):
+                ma = MoneyArray(sample["amounts"], "usd")
+                self.assertEqual(ma.tolist(), [1, -2, 3])
+                self.assertEqual(ma.currency.code, CurrencyCode.USD)
+
+    def test_money_array_rejects_non_integer_buffers(self):
+        for amounts in (array("d", [1.5]), array("f", [1.0, 2.0])):
+            with self.subTest(f"check that {amounts!r} is rejected"):
+                with self.assertRaises(TypeError):
+                    MoneyArray(amounts, "USD")
+        with self.assertRaises(OverflowError):
+            MoneyArray(array("Q", [2**64 - 1]), "USD")
+
+    @skipUnless(np, "numpy is not installed")
+    def test_money_array_from_numpy(self):
+        samples = {
+            "int64": np.array([1, -2, 3], dtype=np.int64),
+            "int32": np.array([1, -2, 3], dtype=np.int32),
+            "big-endian int64": np.array([1, -2, 3], dtype=">i8"),
+            "strided int64": np.array([1, 0, -2, 0, 3, 0], dtype=np.int64)[::2],
+        }
+        for description, amounts in samples.items():
+            with self.subTest(
+                f"check that a money array can be created from {description}"
+            ):
+                self.assertEqual(MoneyArray(amounts, "USD").tolist(), [1, -2, 3])
+        with self.assertRaises(TypeError):
+            MoneyArray(np.array([1.5, 2.5]), "USD")
+
+    def test_money_array_shares_buffers(self):
+        amounts = array("q", [1, 2, 3])
+        ma = MoneyArray(amounts, "EUR")
+        amounts[0] = 10
+        self.assertEqual(ma[0].amount, 10)
+        self.assertTrue(ma.amounts.readonly)
+
+    def test_money_array_from_monies(self):
+        ma = MoneyArray.from_monies([Money(1, "GBP"), Money(2, "GBP")])
+        self.assertEqual(ma.tolist(), [1, 2])
+        with self.assertRaises(CurrencyMismatchError):
+            MoneyArray.from_monies([Money(1, "GBP"), Money(2, "USD")])
+        with self.assertRaises(ValueError):
+            MoneyArray.from_monies([])
+        self.assertEqual(len(MoneyArray.from_monies([], "GBP")), 0)
+
+    def test_money_array_indexing(self):
+        ma = MoneyArray([5, 6, 7], "NGN")
+        self.assertEqual(repr(ma[1]), 'Money(amount=6, code="NGN")')
+        self.assertEqual(ma[1:].tolist(), [6, 7])
+        self.assertEqual(ma[::-2].tolist(), [7, 5])
+        self.assertTrue(ma[::2].amounts.contiguous)
+        strided = MoneyArray(memoryview(array("q", range(6)))[::2], "NGN")
+        self.assertTrue(strided.amounts.contiguous)
+        self.assertEqual(strided.tolist(), [0, 2, 4])
+        self.assertEqual([m.amount for m in ma], [5, 6, 7])
+
+    def test_money_array_reductions(self):
+        ma = MoneyArray([5, -6, 7], "NGN")
+        self.assertEqual(ma.sum().amount, 6)
+        self.assertEqual(ma.min().amount, -6)
+        self.assertEqual(ma.max().amount, 7)
+        with self.assertRaises(ValueError):
+            MoneyArray([], "NGN").min()
+
+    def test_money_array_currency_id(self):
+        self.assertEqual(
+            MoneyArray([1, 2], "USD").currency_id, Money(1, "USD").currency_id
+        )
+
+    def test_money_array_arithmetic(self):
+        ma = MoneyArray([1, 2, 3], "EUR")
+        self.assertEqual((ma + ma).tolist(), [2, 4, 6])
+        self.assertEqual((ma - Money(1, "EUR")).tolist(), [0, 1, 2])
+        self.assertEqual((ma * 3).tolist(), [3, 6, 9])
+        self.assertEqual((-ma).tolist(), [-1, -2, -3])
+        with self.assertRaises(CurrencyMismatchError):
+            ma + MoneyArray([1, 2, 3], "USD")
+        with self.assertRaises(ValueError):
+            ma + ma[1:]
+
+    def test_money_array_round_to(self):
+        ma = MoneyArray([1232, 1233, -1233, 0, 7], "CHF")
+        self.assertEqual(ma.round_to().tolist(), [1230, 1235, -1235, 0, 5])
+        self.assertEqual(
+            ma.round_to(Money(10, "CHF"), ROUND_CEILING).tolist(),
+            [1240, 1240, -1230, 0, 10],
+        )
+        amounts = list(range(-1_000, 1_000, 7))
+        for rounding in ROUNDING_MODES:
+            for increment in (1, 2, 5, 50, 100):
+                with self.subTest(f"check rounding to {increment} with {rounding}"):
+                    self.assertEqual(
+                        MoneyArray(amounts, "NGN")
+                        .round_to(increment, rounding)
+                        .tolist(),
+                        [
+                            Money(a, "NGN").round_to(increment, rounding).amount
+                            for a in amounts
+                        ],
+                    )
+                    self.assertEqual(
+                        MoneyArray(amounts, "NGN")
+                        .round_to(increment, rounding)
+                        .tolist(),
+                        [
+                            int((Decimal(a) / increment).quantize(1, rounding))
+                            * increment
+                            for a in amounts
+                        ],
+                    )
+        with self.assertRaises(ValueError):
+            ma.round_to(-5)
+        with self.assertRaises(CurrencyMismatchError):
+            ma.round_to(Money(5, "USD"), ROUND_HALF_EVEN)
@@ -0,0 +1,116 @@
+import operator
+from unittest import TestCase, skipUnless
+
+from kudi import Money, MoneyArray
+from kudi.currency_codes import CurrencyCode
+from kudi.exceptions import CurrencyMismatchError
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
+
+@skipUnless(pd, "pandas is not installed")
+class PandasTestCase(TestCase):
+    def setUp(self):
+        import kudi.pandas  # noqa: F401
+
+    def _series(self, values, code="USD"):
+        return pd.Series(values, dtype=f"money[{code}]")
+
+    def test_can_create_money_series(self):
+        s = self._series([Money(150, "USD"), None, 250])
+        self.assertEqual(s.dtype.code, CurrencyCode.USD)
+        self.assertEqual(repr(s[0]), 'Money(amount=150, code="USD")')
+        self.assertIs(s[1], pd.NA)
+        self.assertEqual(s[2].amount, 250)
+        with self.assertRaises(CurrencyMismatchError):
+            self._series([Money(150, "EUR")])
+
+    def test_money_series_shares_money_array_amounts(self):
+        from kudi.pandas import MoneyExtensionArray
+
+        ma = MoneyArray([1, 2, 3], "NGN")
+        s = pd.Series(MoneyExtensionArray.from_money_array(ma))
+        self.assertEqual(str(s.dtype), "money[NGN]")
+        self.assertEqual(s.array.to_money_array().tolist(), [1, 2, 3])
+
+    def test_money_series_arithmetic(self):
+        s = self._series([100, 200, None])
+        self.assertEqual((s + s).tolist()[:2], [Money(200, "USD"), Money(400, "USD")])
+        self.assertEqual((s - Money(50, "USD"))[0].amount, 50)
+        self.assertEqual((s * 3)[1].amount, 600)
+        self.assertEqual((-s)[0].amount, -100)
+        self.assertIs((s + s)[2], pd.NA)
+        with self.assertRaises(CurrencyMismatchError):
+            s + self._series([1, 2, 3], "EUR")
+        with self.assertRaises(CurrencyMismatchError):
+            s + Money(1, "EUR")
+
+    def test_money_series_comparisons(self):
+        s = self._series([100, 200, None])
+        self.assertEqual((s > Money(150, "USD")).tolist(), [False, True, pd.NA])
+        self.assertRaises(CurrencyMismatchError, operator.eq, s, Money(100, "EUR"))
+
+    def test_money_series_reductions(self):
+        s = self._series([100, -200, None, 50])
+        self.assertEqual(s.sum(), Money(-50, "USD"))
+        self.assertEqual(s.min(), Money(-200, "USD"))
+        self.assertEqual(s.max(), Money(100, "USD"))
+        self.assertIs(s.sum(skipna=False), pd.NA)
+        big = self._series([2**62, 2**62, 2**62])
+        self.assertEqual(big.sum().amount, 3 * 2**62)
+
+    def test_money_series_groupby(self):
+        df = pd.DataFrame(
+            {
+                "key": ["a", "b", "a", "b", "c"],
+                "value": self._series([1, 2, 3, None, None]),
+            }
+        )
+        grouped = df.groupby("key")["value"]
+        self.assertEqual(
+            grouped.sum().tolist(), [Money(4, "USD"), Money(2, "USD"), Money(0, "USD")]
+        )
+        self.assertEqual(grouped.max().tolist()[:2], [Money(3, "USD"), Money(2, "USD")])
+        self.assertIs(grouped.min().tolist()[2], pd.NA)
+
+    def test_money_series_overflow(self):
+        big = self._series([2**63 - 1, 1, None])
+        smallest = self._series([-(2**63)])
+        operations = {
+            "add": lambda: big + big,
+            "sub": lambda: big - Money(-1, "USD"),
+            "rsub": lambda: Money(-2, "USD") - big,
+            "mul": lambda: big * 2,
+            "mul_array": lambda: big * pd.Series([2, 1, 1]),
+            "neg": lambda: -smallest,
+            "abs": lambda: abs(smallest),
+        }
+        for name, operation in operations.items():
+            with self.subTest(f"check {name} raises instead of wrapping"):
+                with self.assertRaises(OverflowError):
+                    operation()
+        self.assertEqual((big * 1)[0].amount, 2**63 - 1)
+        self.assertEqual((big - big)[0].amount, 0)
+
+    def test_money_series_groupby_overflow(self):
+        df = pd.DataFrame(
+            {
+                "key": ["a", "a", "b", "b"],
+                "value": self._series([2**63 - 1, -(2**63 - 1), 2**63 - 1, 0]),
+            }
+        )
+        self.assertEqual(
+            df.groupby("key")["value"].sum().tolist(),
+            [Money(0, "USD"), Money(2**63 - 1, "USD")],
+        )
+        df = pd.DataFrame({"key": ["a", "a"], "value": self._series([2**63 - 1, 1])})
+        with self.assertRaises(OverflowError):
+            df.groupby("key")["value"].sum()
+
+    def test_money_series_formatting(self):
+        s = self._series([123456, None], "GBP")
+        self.assertEqual(s.astype(str).tolist(), ["£1,234.56", "<NA>"])
+        self.assertIn("£1,234.56", repr(s))
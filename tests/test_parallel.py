@@ -0,0 +1,65 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+
+from kudi import Money, MoneyArray
+from kudi.currency_codes import CurrencyCode
+from kudi.ledger import Ledger
+from kudi.parallel import sum_by_currency, sum_ledgers
+
+
+class ParallelTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def test_sum_money_arrays(self):
+        arrays = [
+            MoneyArray(range(1000), "USD"),
+            MoneyArray([-5, 5, 7], "EUR"),
+            MoneyArray(range(10), "USD"),
+        ]
+        totals = sum_by_currency(arrays, chunk_size=64, executor=self.executor)
+        self.assertEqual(
+            totals,
+            {
+                CurrencyCode.USD: Money(499_545, "USD"),
+                CurrencyCode.EUR: Money(7, "EUR"),
+            },
+        )
+        self.assertEqual(
+            sum_by_currency(arrays[1], executor=self.executor),
+            {CurrencyCode.EUR: Money(7, "EUR")},
+        )
+
+    def test_sum_records(self):
+        records = [(150, "USD"), (-20, "usd"), (300, "NGN"), (5, 840)] * 50
+        totals = sum_by_currency(iter(records), chunk_size=7, executor=self.executor)
+        self.assertEqual(totals[CurrencyCode.USD].amount, 135 * 50)
+        self.assertEqual(totals[CurrencyCode.NGN].amount, 300 * 50)
+        self.assertEqual(sum_by_currency([], executor=self.executor), {})
+
+    def test_sum_is_exact_beyond_int64(self):
+        arrays = [MoneyArray([2**62] * 8, "JPY")]
+        totals = sum_by_currency(arrays, chunk_size=2, workers=2)
+        self.assertEqual(totals[CurrencyCode.JPY].amount, 2**65)
+
+    def test_sum_ledgers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, f"{i}.ledger") for i in range(3)]
+            for path, code in zip(paths, ["USD", "USD", "GBP"]):
+                with Ledger.create(path, code) as ledger:
+                    ledger.append(range(100))
+            totals = sum_ledgers(paths, chunk_size=30, executor=self.executor)
+        self.assertEqual(
+            totals,
+            {
+                CurrencyCode.USD: Money(9900, "USD"),
+                CurrencyCode.GBP: Money(4950, "GBP"),
+            },
+        )
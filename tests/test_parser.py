@@ -0,0 +1,94 @@
+from unittest import TestCase
+
+from kudi import InvalidCurrencyCodeError, Money
+from kudi.formatter import (
+    ACCOUNTING_STYLE,
+    DECIMAL_COMMA_STYLE,
+    INDIAN_STYLE,
+    NBSP_STYLE,
+)
+
+
+class ParserTestCase(TestCase):
+    def test_parse_formatted_amounts(self):
+        samples = [
+            {
+                "text": "₦1,234,567.89",
+                "code": None,
+                "expected": Money(123456789, "NGN"),
+            },
+            {"text": "-$12.00", "code": "USD", "expected": Money(-1200, "USD")},
+            {"text": "$-12.00", "code": "USD", "expected": Money(-1200, "USD")},
+            {"text": "($12.00)", "code": "USD", "expected": Money(-1200, "USD")},
+            {"text": "12.5 USD", "code": None, "expected": Money(1250, "USD")},
+            {"text": "¥123,456", "code": None, "expected": Money(123456, "JPY")},
+            {"text": "1,234.567 .د.ب", "code": None, "expected": Money(1234567, "BHD")},
+            {
+                "text": "R$1.234.567,89",
+                "code": "BRL",
+                "expected": Money(123456789, "BRL"),
+            },
+            {"text": "1,234.56", "code": 840, "expected": Money(123456, "USD")},
+            {"text": " ₦ 5 ", "code": None, "expected": Money(500, "NGN")},
+        ]
+        for sample in samples:
+            text = sample["text"]
+            with self.subTest(f"check `{text}` is parsed"):
+                money = Money.parse(text, sample["code"])
+                self.assertEqual(money.currency, sample["expected"].currency)
+                self.assertEqual(money.amount, sample["expected"].amount)
+
+    def test_parse_with_style(self):
+        money = Money.parse("1.234,56 €", style=DECIMAL_COMMA_STYLE)
+        self.assertEqual(money.amount, 123456)
+        self.assertEqual(money.currency.code, "EUR")
+
+    def test_parse_round_trips_formatting(self):
+        for code in ("USD", "INR", "JPY", "BHD", "BRL", "AED"):
+            for style in (None, INDIAN_STYLE, ACCOUNTING_STYLE, NBSP_STYLE):
+                for amount in (0, 7, -7, 123_456_789, -98_765_432_101):
+                    money = Money(amount, code)
+                    with self.subTest(f"check {money!r} round trips with {style}"):
+                        self.assertEqual(
+                            Money.parse(money.format(style), code, style).amount,
+                            amount,
+                        )
+
+    def test_parse_invalid_amounts(self):
+        for text in ("", "abc", "1.2.3", "12.345", "($1", "--1", "€12.00"):
+            with self.subTest(f"check `{text}` is rejected"):
+                with self.assertRaises(ValueError):
+                    Money.parse(text, "USD")
+
+    def test_parse_rejects_misgrouped_amounts(self):
+        samples = [
+            ("€1,50", "EUR", None),
+            ("1,50", "USD", None),
+            ("1 234,56 €", "EUR", None),
+            ("12,3456.7", "USD", None),
+            ("1 234.56", "USD", None),
+            ("1,2345,678.00", "USD", None),
+            ("12,34,567.89", "INR", None),
+            ("1,234,567.89", "INR", INDIAN_STYLE),
+        ]
+        for text, code, style in samples:
+            with self.subTest(f"check `{text}` is rejected"):
+                with self.assertRaises(ValueError):
+                    Money.parse(text, code, style)
+
+    def test_parse_space_delimited_amounts(self):
+        for text in ("1 234 567,89 p.", "1\u00a0234\u00a0567,89 p.", "1234567,89 p."):
+            with self.subTest(f"check `{text}` is parsed"):
+                self.assertEqual(Money.parse(text, "BYN").amount, 123456789)
+
+    def test_parse_ambiguous_symbol(self):
+        for text in ("$5.00", "5.00"):
+            with self.subTest(f"check the currency of `{text}` cannot be inferred"):
+                with self.assertRaises(InvalidCurrencyCodeError):
+                    Money.parse(text)
+
+    def test_parse_many_with_plan(self):
+        plan = Money(0, "USD").currency.parser.plan
+        self.assertEqual(
+            plan.parse_many(["$0.01", "-$1", "$1,000.00"]), [1, -100, 100_000]
+        )
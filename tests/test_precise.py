@@ -0,0 +1,89 @@
+import random
+from decimal import ROUND_FLOOR, ROUND_HALF_UP, Decimal
+from fractions import Fraction
+from unittest import TestCase
+
+from kudi import CurrencyMismatchError, Money, PreciseMoney
+
+
+class PreciseMoneyTestCase(TestCase):
+    def test_rounds_chained_calculations_once(self):
+        principal = Money(4_620_313, "USD")
+        rate = Decimal("0.0525")
+        # 4_620_313 * 0.0525 * 31 / 365 is 20_601.53...
+        precise = (principal.with_scale(6) * rate * 31 / 365).to_money()
+        self.assertEqual(precise.amount, 20_602)
+        # rounding to the subunit at every step drifts
+        self.assertEqual((principal * rate * 31 / 365).amount, 20_601)
+
+    def test_matches_exact_arithmetic(self):
+        rng = random.Random(0)
+        for _ in range(2_000):
+            amount = rng.randint(-(10**9), 10**9)
+            rate = Decimal(rng.randint(1, 10**5)).scaleb(-6)
+            days = rng.randint(1, 366)
+            exact = Fraction(amount) * Fraction(rate) * days / 365
+            precise = Money(amount, "NGN").with_scale(8) * rate * days / 365
+            with self.subTest(f"check {amount} x {rate} x {days} / 365"):
+                # two half even roundings at the scale, at most one unit of error
+                self.assertLessEqual(abs(Fraction(precise.value, 10**8) - exact), 1e-8)
+                if abs(abs(exact - round(exact)) - Fraction(1, 2)) > Fraction(1, 10**7):
+                    # away from ties, rounding once matches rounding the exact value
+                    exact = Decimal(exact.numerator) / Decimal(exact.denominator)
+                    self.assertEqual(
+                        precise.to_money(ROUND_HALF_UP).amount,
+                        int(exact.quantize(1, ROUND_HALF_UP)),
+                    )
+
+    def test_operators(self):
+        a = Money(150, "USD").with_scale(2)
+        b = Money(25, "USD").with_scale(4)
+        self.assertEqual((a + b).value, 1_750_000)
+        self.assertEqual((a + b).scale, 4)
+        self.assertEqual((a - Money(50, "USD")).value, 10_000)
+        self.assertEqual((Money(50, "USD") - a).value, -10_000)
+        self.assertEqual((Money(50, "USD") + a).value, 20_000)
+        self.assertEqual((3 * a).value, 45_000)
+        self.assertEqual((a * Fraction(1, 3)).value, 5_000)
+        self.assertEqual((a / 7).value, 2_143)
+        self.assertEqual((-a).value, -15_000)
+        self.assertEqual(abs(-a), a)
+        self.assertEqual(a, Money(150, "USD"))
+        self.assertEqual(Money(150, "USD"), a)
+        self.assertTrue(b < a)
+        self.assertTrue(Money(151, "USD") > a)
+        self.assertTrue(a >= Money(150, "USD"))
+        self.assertEqual(str(a / 7), "0.2143 USD")
+        self.assertEqual(repr(a), 'PreciseMoney(value=15000, scale=2, code="USD")')
+        self.assertEqual((a / 7).to_money(ROUND_FLOOR), Money(21, "USD"))
+
+    def test_floor_division_and_remainders(self):
+        a = Money(150, "USD").with_scale(2)
+        self.assertEqual((a // 7).value, 2_142)
+        self.assertEqual((-a // 7).value, -2_143)
+        self.assertEqual((a // Decimal("1.5")).value, 10_000)
+        quotient, remainder = divmod(a, 7)
+        self.assertEqual((quotient.value, remainder.value), (2_142, 6))
+        self.assertEqual(quotient.scale, 2)
+        self.assertEqual((a % 7).value, 6)
+        quotient, remainder = divmod(a, Fraction(4, 3))
+        self.assertEqual((quotient.value, remainder.value), (11_250, 0))
+        with self.assertRaises(ValueError):
+            divmod(a, Decimal("0.7"))
+        with self.assertRaises(ZeroDivisionError):
+            a // 0
+        with self.assertRaises(ZeroDivisionError):
+            divmod(a, Fraction(0))
+        with self.assertRaises(TypeError):
+            a % 1.5
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            Money(150, "USD").with_scale(-1)
+        with self.assertRaises(CurrencyMismatchError):
+            Money(150, "USD").with_scale(2) + Money(150, "NGN")
+        with self.assertRaises(ZeroDivisionError):
+            Money(150, "USD").with_scale(2) / 0
+        with self.assertRaises(TypeError):
+            Money(150, "USD").with_scale(2) * 1.5
+        self.assertIsInstance(PreciseMoney(Money(1, "USD"), 0), PreciseMoney)
@@ -0,0 +1,74 @@
+import operator
+from dataclasses import replace
+from unittest import TestCase
+
+from kudi import CurrencyMismatchError, Money, sorted_money
+
+
+class SortingTestCase(TestCase):
+    def test_sorted_money(self):
+        monies = [
+            Money(300, "USD"),
+            Money(-20, "usd"),
+            Money(150, 840),
+            Money(0, "USD"),
+        ]
+        self.assertEqual([m.amount for m in sorted_money(monies)], [-20, 0, 150, 300])
+        self.assertEqual(
+            [m.amount for m in sorted_money(iter(monies), reverse=True)],
+            [300, 150, 0, -20],
+        )
+        self.assertEqual(
+            [m.amount for m in sorted_money(monies)], [m.amount for m in sorted(monies)]
+        )
+
+    def test_sorted_money_is_stable(self):
+        a, b = Money(5, "USD"), Money(5, "USD")
+        result = sorted_money([a, Money(1, "USD"), b])
+        self.assertIs(result[1], a)
+        self.assertIs(result[2], b)
+
+    def test_mixed_currencies(self):
+        monies = [
+            Money(300, "USD"),
+            Money(5, "EUR"),
+            Money(-20, "USD"),
+            Money(1, "EUR"),
+        ]
+        with self.assertRaises(CurrencyMismatchError):
+            sorted_money(monies)
+        self.assertEqual(
+            [
+                (m.currency.code.value, m.amount)
+                for m in sorted_money(monies, mixed="group")
+            ],
+            [("EUR", 1), ("EUR", 5), ("USD", -20), ("USD", 300)],
+        )
+        self.assertEqual(
+            sorted_money(monies, mixed="group", reverse=True),
+            sorted(monies, key=Money.sort_key, reverse=True),
+        )
+        with self.assertRaises(ValueError):
+            sorted_money(monies, mixed="ignore")
+
+    def test_equal_currencies_that_are_distinct_objects_are_not_mixed(self):
+        usd = Money(0, "USD").currency
+        monies = [Money(3, "USD"), Money._from_minor_units(1, replace(usd))]
+        self.assertEqual([m.amount for m in sorted_money(monies)], [1, 3])
+
+    def test_empty(self):
+        self.assertEqual(sorted_money([]), [])
+
+    def test_sort_key(self):
+        self.assertEqual(Money(150, "USD").sort_key(), ("USD", 150))
+
+    def test_comparisons_are_consistent(self):
+        a, b = Money(1, "USD"), Money(2, "USD")
+        self.assertEqual(
+            (a < b, a <= b, a > b, a >= b, a == b, a != b),
+            (True, True, False, False, False, True),
+        )
+        self.assertFalse(a == 1)
+        self.assertTrue(a != "USD")
+        self.assertRaises(TypeError, operator.lt, a, 1)
+        self.assertRaises(CurrencyMismatchError, operator.lt, a, Money(1, "EUR"))
@@ -0,0 +1,146 @@
+import random
+from unittest import TestCase
+
+from kudi import CurrencyMismatchError, Money
+from kudi.waterfall import Party, Waterfall
+
+
+def _amounts(shares: list[list[Money]]) -> list[list[int]]:
+    return [[share.amount for share in tier] for tier in shares]
+
+
+def _random_waterfall(rng: random.Random) -> list[list[Party]]:
+    tiers = []
+    for _ in range(rng.randint(1, 4)):
+        tier = []
+        for _ in range(rng.randint(1, 6)):
+            floor = rng.choice([0, 0, rng.randint(0, 500)])
+            cap = rng.choice([None, floor, floor + rng.randint(0, 5_000)])
+            tier.append(Party(ratio=rng.randint(0, 5), floor=floor, cap=cap))
+        tiers.append(tier)
+    return tiers
+
+
+class WaterfallTestCase(TestCase):
+    def test_allocate(self):
+        waterfall = Waterfall(
+            "USD",
+            [Party(cap=5_000), Party(ratio=3, cap=10_000)],
+            [Party(floor=100)],
+        )
+        samples = [
+            {"amount": 20_000, "shares": [[5_000, 10_000], [5_000]]},
+            {"amount": 4_100, "shares": [[1_000, 3_000], [100]]},
+            {"amount": 8_100, "shares": [[2_000, 6_000], [100]]},
+            {"amount": 13_433, "shares": [[3_334, 9_999], [100]]},
+            {"amount": 13_434, "shares": [[3_334, 10_000], [100]]},
+            {"amount": 50, "shares": [[0, 0], [50]]},
+            {"amount": -4_101, "shares": [[-1_001, -3_000], [-100]]},
+        ]
+        for sample in samples:
+            with self.subTest(f"check the waterfall allocates {sample['amount']}"):
+                result = waterfall.allocate(Money(sample["amount"], "USD"))
+                self.assertEqual(_amounts(result.shares), sample["shares"])
+                self.assertEqual(result.remainder.amount, 0)
+
+    def test_remainder_when_every_party_is_capped(self):
+        waterfall = Waterfall("NGN", [Party(cap=Money(100, "NGN")), Party(cap=50)])
+        result = waterfall.allocate(Money(1_000, "NGN"))
+        self.assertEqual(_amounts(result.shares), [[100, 50]])
+        self.assertEqual(result.remainder, Money(850, "NGN"))
+
+    def test_floors_are_paid_in_priority_order(self):
+        waterfall = Waterfall(
+            "USD",
+            [Party(floor=300, cap=300), Party(floor=100)],
+            [Party(floor=1_000)],
+        )
+        self.assertEqual(
+            _amounts(waterfall.allocate(Money(201, "USD")).shares),
+            [[151, 50], [0]],
+        )
+        self.assertEqual(
+            _amounts(waterfall.allocate(Money(900, "USD")).shares),
+            [[300, 100], [500]],
+        )
+
+    def test_matches_money_allocate_without_floors_or_caps(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            ratios = [rng.randint(0, 10) for _ in range(rng.randint(1, 8))]
+            if not sum(ratios):
+                continue
+            money = Money(rng.randint(0, 10**6), "USD")
+            waterfall = Waterfall("USD", [Party(ratio=r) for r in ratios])
+            with self.subTest(f"check {money.amount} by {ratios}"):
+                self.assertEqual(
+                    _amounts(waterfall.allocate(money).shares)[0],
+                    [share.amount for share in money.allocate(*ratios)],
+                )
+
+    def test_properties(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            tiers = _random_waterfall(rng)
+            waterfall = Waterfall("USD", *tiers)
+            floors = sum(party.floor for tier in tiers for party in tier)
+            amount = rng.randint(0, 2 * floors + 20_000)
+            result = waterfall.allocate(Money(amount, "USD"))
+            shares = _amounts(result.shares)
+            mirrored = waterfall.allocate(Money(-amount, "USD"))
+            with self.subTest(f"check {tiers} allocates {amount}"):
+                self.assertEqual(
+                    sum(map(sum, shares)) + result.remainder.amount, amount
+                )
+                self.assertEqual(
+                    _amounts(mirrored.shares), [[-s for s in t] for t in shares]
+                )
+                self.assertEqual(mirrored.remainder.amount, -result.remainder.amount)
+                full = True
+                for tier, tier_shares in zip(tiers, shares):
+                    for party, share in zip(tier, tier_shares):
+                        self.assertGreaterEqual(share, 0)
+                        if party.cap is not None:
+                            self.assertLessEqual(share, party.cap)
+                        if amount >= floors:
+                            self.assertGreaterEqual(share, party.floor)
+                        if not full:
+                            # nothing beyond floors reaches a tier before the earlier
+                            # ones are full
+                            self.assertLessEqual(share, party.floor)
+                    full = full and all(
+                        share == party.cap
+                        for party, share in zip(tier, tier_shares)
+                        if party.ratio
+                    )
+                if result.remainder.amount:
+                    self.assertTrue(full)
+
+    def test_thousands_of_parties(self):
+        rng = random.Random(2)
+        tiers = [
+            [
+                Party(ratio=rng.randint(1, 9), cap=rng.randint(0, 10_000))
+                for _ in range(3_000)
+            ]
+            for _ in range(3)
+        ]
+        waterfall = Waterfall("USD", *tiers)
+        for amount in (0, 7, 10**6, 10**7, 10**8, 10**12):
+            result = waterfall.allocate(Money(amount, "USD"))
+            total = sum(map(sum, _amounts(result.shares)))
+            self.assertEqual(total + result.remainder.amount, amount)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Waterfall("USD")
+        with self.assertRaises(ValueError):
+            Waterfall("USD", [])
+        with self.assertRaises(ValueError):
+            Waterfall("USD", [Party(ratio=-1)])
+        with self.assertRaises(ValueError):
+            Waterfall("USD", [Party(floor=10, cap=5)])
+        with self.assertRaises(CurrencyMismatchError):
+            Waterfall("USD", [Party(cap=Money(5, "NGN"))])
+        with self.assertRaises(CurrencyMismatchError):
+            Waterfall("USD", [Party()]).allocate(Money(5, "NGN"))